@@ -0,0 +1,64 @@
+"""Time graph construction and scheduling of a large layered DAG of no-op nodes.
+
+Run with: python -m benchmarks.bench_large_dag
+"""
+
+import time
+
+from fluxly.node import Node
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class NoopNode(Node):
+    def _logic(self) -> None:
+        return None
+
+
+def build_layers(layers: int, width: int) -> tuple[list[Node], list[tuple[Node, Node]]]:
+    nodes: list[Node] = []
+    edges: list[tuple[Node, Node]] = []
+    previous: list[Node] = []
+    for layer in range(layers):
+        current = [NoopNode(name=f"node-{layer}-{i}") for i in range(width)]
+        nodes.extend(current)
+        for i, node in enumerate(current):
+            edges.extend((parent, node) for parent in previous[max(0, i - 1): i + 2])
+        previous = current
+    return nodes, edges
+
+
+def build_workflow(layers: int, width: int, bulk: bool = False) -> Workflow:
+    wf = Workflow(name="bench-large-dag", inputs=WorkflowInput(verbose=False))
+    nodes, edges = build_layers(layers, width)
+    if bulk:
+        wf.add_nodes_from(nodes)
+        wf.add_edges_from(edges)
+        return wf
+
+    for node in nodes:
+        wf.add_node(node)
+    for parent, child in edges:
+        wf.add_edge(parent, child)
+    return wf
+
+
+def main(layers: int = 40, width: int = 50) -> None:
+    bulk_start = time.perf_counter()
+    build_workflow(layers, width, bulk=True)
+    bulk_build = time.perf_counter() - bulk_start
+
+    build_start = time.perf_counter()
+    wf = build_workflow(layers, width)
+    build = time.perf_counter() - build_start
+
+    run_start = time.perf_counter()
+    wf.execute()
+    run = time.perf_counter() - run_start
+
+    print(f"nodes: {len(wf.get_nodes())}, edges: {len(wf._graph.edges)}")
+    print(f"graph construction: {build:.3f}s (bulk: {bulk_build:.3f}s)")
+    print(f"execution:          {run:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Measure the fixed per-node cost of running no-op nodes, alone and inside a workflow.
+
+Run with: python -m benchmarks.bench_node_overhead
+"""
+
+import time
+import tracemalloc
+
+from fluxly.node import Node
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class NoopNode(Node):
+    def _logic(self) -> None:
+        return None
+
+
+def standalone(count: int) -> float:
+    nodes = [NoopNode(name=f"node-{i}") for i in range(count)]
+    start = time.perf_counter()
+    for node in nodes:
+        node.execute()
+    return (time.perf_counter() - start) / count
+
+
+def build_workflow(count: int) -> Workflow:
+    wf = Workflow(name="bench-node-overhead", inputs=WorkflowInput(verbose=False, max_workers=1))
+    wf.add_nodes_from([NoopNode(name=f"node-{i}") for i in range(count)])
+    return wf
+
+
+def in_workflow(count: int) -> float:
+    wf = build_workflow(count)
+    start = time.perf_counter()
+    wf.execute()
+    return (time.perf_counter() - start) / count
+
+
+def retained_per_node(count: int) -> float:
+    """Heap still held by the node records after the run, per node."""
+    tracemalloc.start()
+    wf = build_workflow(count)
+    before, _ = tracemalloc.get_traced_memory()
+    wf.execute()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main(count: int = 2000, repeats: int = 3) -> None:
+    alone = min(standalone(count) for _ in range(repeats))
+    workflow = min(in_workflow(count) for _ in range(repeats))
+    retained = retained_per_node(count)
+
+    print(f"nodes: {count}, best of {repeats}")
+    print(f"standalone execute: {alone * 1e6:8.1f} us/node")
+    print(f"workflow execute:   {workflow * 1e6:8.1f} us/node")
+    print(f"retained after run: {retained / 1024:8.2f} KiB/node")
+
+
+if __name__ == "__main__":
+    main()
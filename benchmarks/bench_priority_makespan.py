@@ -0,0 +1,72 @@
+"""Compare workflow makespan under FIFO and critical-path-first scheduling.
+
+Builds synthetic DAGs of sleeping nodes with declared durations and runs each one with a
+small worker pool under both policies.
+
+Run with: python -m benchmarks.bench_priority_makespan
+"""
+
+import random
+import time
+
+from fluxly.node import Node
+from fluxly.workflow import Workflow, WorkflowInput
+
+TIME_SCALE = 0.01
+
+
+class SleepNode(Node):
+    def _logic(self) -> None:
+        time.sleep((self.expected_duration_seconds or 0) * TIME_SCALE)
+
+
+def long_chain_last(policy: str, max_workers: int) -> Workflow:
+    """Many short independent nodes registered before a long chain."""
+    wf = Workflow(name="chain-last", scheduling_policy=policy, inputs=WorkflowInput(verbose=False, max_workers=max_workers))
+    wf.add_nodes_from(SleepNode(name=f"short-{i}", expected_duration_seconds=2) for i in range(12))
+    chain = [SleepNode(name=f"chain-{i}", expected_duration_seconds=4) for i in range(6)]
+    wf.add_nodes_from(chain)
+    wf.add_edges_from(zip(chain, chain[1:], strict=False))
+    return wf
+
+
+def random_layered(policy: str, max_workers: int, seed: int) -> Workflow:
+    rng = random.Random(seed)
+    wf = Workflow(name=f"random-{seed}", scheduling_policy=policy, inputs=WorkflowInput(verbose=False, max_workers=max_workers))
+    previous: list[Node] = []
+    edges: list[tuple[Node, Node]] = []
+    for layer in range(6):
+        current = [
+            SleepNode(name=f"node-{layer}-{i}", expected_duration_seconds=rng.choice([1, 1, 2, 3, 8]))
+            for i in range(rng.randint(2, 6))
+        ]
+        wf.add_nodes_from(current)
+        for node in current:
+            edges.extend((parent, node) for parent in previous if rng.random() < 0.3)
+        previous = current
+    wf.add_edges_from(edges)
+    return wf
+
+
+def makespan(wf: Workflow) -> float:
+    start = time.perf_counter()
+    wf.execute()
+    return time.perf_counter() - start
+
+
+def main(max_workers: int = 2) -> None:
+    scenarios = {
+        "long chain registered last": long_chain_last,
+        **{f"random layered (seed={seed})": lambda p, w, s=seed: random_layered(p, w, s) for seed in range(3)},
+    }
+
+    print(f"max_workers={max_workers}")
+    print(f"{'scenario':32} {'fifo':>8} {'critical':>9} {'speedup':>8}")
+    for label, build in scenarios.items():
+        fifo = makespan(build("fifo", max_workers))
+        critical = makespan(build("critical_path", max_workers))
+        print(f"{label:32} {fifo:7.2f}s {critical:8.2f}s {fifo / critical:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
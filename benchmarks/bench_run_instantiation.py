@@ -0,0 +1,55 @@
+"""Compare the cost of preparing a workflow run: deepcopy of the template versus Workflow.new_run().
+
+Run with: python -m benchmarks.bench_run_instantiation
+"""
+
+import copy
+import time
+from functools import partial
+
+from fluxly.node import Node
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class StepNode(Node):
+    upstream: Node | None = None
+    columns: list[str] = []
+
+    def _logic(self) -> None:
+        return None
+
+
+def build_workflow(count: int) -> Workflow:
+    wf = Workflow(name="bench-run-instantiation", inputs=WorkflowInput(verbose=False))
+    columns = [f"column_{i}" for i in range(50)]
+    previous: StepNode | None = None
+    for i in range(count):
+        node = StepNode(name=f"node-{i}", upstream=previous, columns=columns)
+        wf.add_node(node)
+        if previous is not None:
+            wf.add_edge(previous, node)
+        previous = node
+    # The API and the CLI compile their templates before starting runs from them.
+    wf.compile()
+    return wf
+
+
+def per_call(fn, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def main(sizes: tuple[int, ...] = (10, 100, 1000)) -> None:
+    print(f"{'nodes':>6} {'deepcopy':>12} {'new_run':>12} {'speedup':>8}")
+    for count in sizes:
+        template = build_workflow(count)
+        repeats = max(5, 2000 // count)
+        deep = per_call(partial(copy.deepcopy, template), repeats)
+        fresh = per_call(template.new_run, repeats)
+        print(f"{count:>6} {deep * 1e6:>10.0f}us {fresh * 1e6:>10.0f}us {deep / fresh:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
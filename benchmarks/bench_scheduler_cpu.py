@@ -0,0 +1,46 @@
+"""Measure how much CPU the workflow scheduler burns while nodes are sleeping.
+
+Run with: python -m benchmarks.bench_scheduler_cpu
+"""
+
+import time
+
+from fluxly.node import Node
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class SleepNode(Node):
+    sleep_seconds: float = 1.0
+
+    def _logic(self) -> None:
+        time.sleep(self.sleep_seconds)
+
+
+def build_workflow(width: int, sleep_seconds: float) -> Workflow:
+    wf = Workflow(name="bench-scheduler-cpu", inputs=WorkflowInput(verbose=False))
+    root = SleepNode(name="root", sleep_seconds=0.0)
+    wf.add_node(root)
+    for i in range(width):
+        node = SleepNode(name=f"sleeper-{i}", sleep_seconds=sleep_seconds)
+        wf.add_node(node)
+        wf.add_edge(root, node)
+    return wf
+
+
+def main(width: int = 8, sleep_seconds: float = 2.0) -> None:
+    wf = build_workflow(width, sleep_seconds)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    wf.execute()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    print(f"nodes sleeping in parallel: {width} x {sleep_seconds}s")
+    print(f"wall time:      {wall:.3f}s")
+    print(f"process CPU:    {cpu:.3f}s")
+    print(f"CPU / wall:     {cpu / wall:.1%}")
+
+
+if __name__ == "__main__":
+    main()
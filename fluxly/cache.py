@@ -0,0 +1,7 @@
+from fluxly.core.cache import CacheConfig, ResultCache, compute_cache_key
+
+__all__ = [
+    "CacheConfig",
+    "ResultCache",
+    "compute_cache_key",
+]
@@ -7,6 +7,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ValidationError
 
 from fluxly.core.api.service import RunnerService
+from fluxly.core.exceptions import WorkflowException
 from fluxly.core.workflow.input import WorkflowInput
 from fluxly.core.workflow.workflow import Workflow
 
@@ -25,6 +26,13 @@ class EndpointRunner(BaseModel):
         except (ValidationError) as e:
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(e))
 
+        # Compiled on the first submission, so a broken workflow only fails its own endpoint.
+        try:
+            self.workflow.compile()
+        except WorkflowException as e:
+            detail = f"Workflow {self.name} cannot run: {e.__class__.__name__} {e}".rstrip()
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=detail)
+
         record = self.service.submit(self.name, self.workflow, self.input_cls, values)
         return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=record.model_dump())
 
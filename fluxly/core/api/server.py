@@ -11,14 +11,15 @@ from fluxly.core.api.handlers import (
 )
 from fluxly.core.api.models import ApiConfig
 from fluxly.core.api.service import RunnerService
+from fluxly.core.resources import ResourceCapacity
 from fluxly.core.utils.consts import PACKAGE_VERSION
 from fluxly.core.workflow.input import WorkflowInput
 from fluxly.core.workflow.workflow import Workflow
 
 
-def build_app(endpoints: dict[str, tuple[Workflow, type[WorkflowInput]]], config: ApiConfig) -> FastAPI:
+def build_app(endpoints: dict[str, tuple[Workflow, type[WorkflowInput]]], config: ApiConfig, capacity: ResourceCapacity | None = None) -> FastAPI:
     app = FastAPI(title="Fluxly API", version=PACKAGE_VERSION, **config.fastapi_kwargs)
-    service = RunnerService()
+    service = RunnerService(capacity=capacity)
 
     for endpoint_name, (workflow_template, wf_input_cls) in endpoints.items():
         runner = EndpointRunner(name=endpoint_name, workflow=workflow_template, input_cls=wf_input_cls, service=service)
@@ -55,8 +56,8 @@ def build_app(endpoints: dict[str, tuple[Workflow, type[WorkflowInput]]], config
     return app
 
 
-def serve(endpoints: dict[str, tuple[Workflow, type[WorkflowInput]]], config: ApiConfig) -> None:
-    app = build_app(endpoints, config)
+def serve(endpoints: dict[str, tuple[Workflow, type[WorkflowInput]]], config: ApiConfig, capacity: ResourceCapacity | None = None) -> None:
+    app = build_app(endpoints, config, capacity=capacity)
     uvicorn.run(app, host=config.host, port=config.port, log_level=config.log_level, **config.uvicorn_kwargs)
 
 
@@ -1,25 +1,37 @@
 from __future__ import annotations
 
-import copy
-import threading
+import asyncio
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
 from fluxly.core.api.models import RunRecord
+from fluxly.core.resources import ResourceBudget, ResourceCapacity
 from fluxly.core.status import StatusCodes
+from fluxly.core.utils.event_loop import EventLoopThread
 from fluxly.core.workflow.input import WorkflowInput
 from fluxly.core.workflow.models import EndpointType
 from fluxly.core.workflow.workflow import Workflow
 
 
 class RunnerService:
-    def __init__(self) -> None:
+    def __init__(self, capacity: ResourceCapacity | None = None) -> None:
         self._runs: dict[str, RunRecord] = {}
+        self._loop_thread: EventLoopThread | None = None
+        self._resource_budget = ResourceBudget(capacity) if capacity else None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        # One event loop shared by every run, so async nodes across runs multiplex on it.
+        if self._loop_thread is None:
+            self._loop_thread = EventLoopThread(name="fluxly-runner").start()
+        return self._loop_thread.loop
 
     def submit(self, endpoint: str, workflow: Workflow, input_cls: type[WorkflowInput], values: dict[str, Any]) -> RunRecord:
-        wf = copy.deepcopy(workflow)
+        wf = workflow.new_run()
         wf.inputs = input_cls(**values)
+        if self._resource_budget is not None:
+            wf.assign_resource_budget(self._resource_budget)
 
         run_id = wf.run_id or str(uuid4())
         wf.assign_run_id(run_id)
@@ -34,13 +46,13 @@ class RunnerService:
         )
         self._runs[run_id] = record
 
-        def _run() -> None:
+        async def _run() -> None:
             rec = self._runs[run_id]
             rec.status = StatusCodes.IN_PROGRESS.name
             rec.started_at = datetime.now(UTC).isoformat()
             rec.workflow_id = wf.id
             try:
-                wf.execute()
+                await wf.execute_async()
                 latest = wf.last_execution
                 rec.status = latest.status.name
                 rec.executions = wf.executions
@@ -50,7 +62,7 @@ class RunnerService:
                 rec.executions = wf.executions
                 rec.error = str(e)
 
-        threading.Thread(target=_run, daemon=True).start()
+        asyncio.run_coroutine_threadsafe(_run(), self.loop)
         return record
 
     def get(self, run_id: str) -> RunRecord | None:
@@ -1,16 +1,21 @@
 import sys
+from typing import Annotated
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr
 
 from fluxly.core.api.server import ApiConfig, serve
+from fluxly.core.cache import CacheConfig
 from fluxly.core.cli.generator import build_click_group_with_commands
+from fluxly.core.resources import ResourceCapacity
 from fluxly.core.workflow.input import WorkflowInput
 from fluxly.core.workflow.workflow import Workflow
 
 
 class Fluxly(BaseModel):
     # TODO: debug: bool = False
-    # TODO: max_workers: int | None = None
+    max_workers: Annotated[int | None, Field(gt=0, description="Default maximum number of concurrently executed nodes for registered workflows.")] = None
+    capacity: Annotated[ResourceCapacity | None, Field(description="Resource budget shared by all API runs, and the default per-run budget for CLI runs.")] = None
+    cache: Annotated[CacheConfig, Field(description="Result cache settings for registered workflows that do not set their own, also used by the `cache` CLI command.")] = CacheConfig()
     _endpoints: dict[str, tuple[Workflow, type[WorkflowInput]]] = PrivateAttr(default_factory=dict)
     _api_config: ApiConfig = PrivateAttr(default_factory=ApiConfig)
 
@@ -27,11 +32,22 @@ class Fluxly(BaseModel):
     def configure_api(self, config: ApiConfig) -> None:
         self._api_config = config
 
+    def _apply_app_defaults(self) -> None:
+        for workflow, _ in self._endpoints.values():
+            if workflow.max_workers is None:
+                workflow.max_workers = self.max_workers
+            if workflow.capacity is None:
+                workflow.capacity = self.capacity
+            if workflow.cache is None:
+                workflow.cache = self.cache
+
     def run_api(self) -> None:
-        serve(self._endpoints, self._api_config)
+        self._apply_app_defaults()
+        serve(self._endpoints, self._api_config, capacity=self.capacity)
 
     def run_cli(self) -> None:
-        click_group = build_click_group_with_commands(self._endpoints)
+        self._apply_app_defaults()
+        click_group = build_click_group_with_commands(self._endpoints, cache_config=self.cache)
         click_group()
 
     def run(self) -> None:
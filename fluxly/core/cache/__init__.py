@@ -0,0 +1,10 @@
+from fluxly.core.cache.config import CacheConfig
+from fluxly.core.cache.key import compute_cache_key, upstream_digest
+from fluxly.core.cache.store import ResultCache
+
+__all__ = [
+    "CacheConfig",
+    "ResultCache",
+    "compute_cache_key",
+    "upstream_digest",
+]
@@ -0,0 +1,11 @@
+import os
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from fluxly.core.utils.consts import DEFAULT_CACHE_DIR, ENV_PREFIX
+
+
+class CacheConfig(BaseModel):
+    directory: Annotated[str, Field(description="Directory holding cached node results.")] = os.environ.get(f"{ENV_PREFIX}CACHE_DIR", DEFAULT_CACHE_DIR)
+    max_size_mb: Annotated[int, Field(gt=0, description="Size above which the least recently used results are evicted, in MB.")] = 1024
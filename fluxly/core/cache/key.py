@@ -0,0 +1,94 @@
+import hashlib
+import inspect
+import json
+from collections.abc import Iterable
+from datetime import date, time
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from fluxly.core.node.node import Node
+from fluxly.core.node.output import NodeOutput
+from fluxly.core.workflow.input import WorkflowInput
+
+
+def _json_default(value: Any) -> Any:
+    # Only values with a representation that is stable across processes; a repr may embed an address.
+    if isinstance(value, bytes | bytearray):
+        return hashlib.sha256(value).hexdigest()
+    if hasattr(value, "tobytes"):
+        return hashlib.sha256(value.tobytes()).hexdigest()
+    if isinstance(value, set | frozenset):
+        return sorted(_digest(item) for item in value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date | time):
+        return value.isoformat()
+    if isinstance(value, Decimal | UUID | PurePath):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Cannot hash a value of type {type(value).__name__} into a cache key")
+
+
+def _digest(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, default=_json_default)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def code_version(node: Node) -> str:
+    if node.cache_version is not None:
+        return node.cache_version
+    try:
+        return _digest(inspect.getsource(type(node)))
+    except (OSError, TypeError):
+        return f"{type(node).__module__}.{type(node).__qualname__}"
+
+
+def output_digest(output: NodeOutput) -> str:
+    return _digest(output.model_dump())
+
+
+def upstream_digest(node: Node) -> str:
+    """Digest of the node's latest output, computed once and kept on its attempt record.
+
+    The workflow computes it when the node completes, before the output may be spilled, so
+    downstream cache keys never load spilled fields back.
+    """
+    record = node._last_record
+    if record.output_digest is None:
+        output = node.last_execution.output
+        if output.spilled_fields:
+            raise TypeError(f"Output of {node.name} was spilled before it could be hashed")
+        record.output_digest = output_digest(output)
+    return record.output_digest
+
+
+def compute_cache_key(node: Node, workflow_input: WorkflowInput | None, upstream: Iterable[Node]) -> str:
+    """Hash of everything that determines a node's result.
+
+    Covers the fields declared by the node's class (not the execution settings inherited from
+    ``Node``), the relevant ``WorkflowInput`` fields, the node's code version and the outputs
+    of its upstream nodes. Raises ``TypeError`` when one of them holds a value without a
+    stable hash.
+    """
+    node_cls = type(node)
+    config_fields = set(node_cls.model_fields) - set(Node.model_fields)
+    input_values: dict[str, Any] = {}
+    if workflow_input is not None:
+        input_fields = node.cache_inputs
+        if input_fields is None:
+            input_fields = set(type(workflow_input).model_fields) - set(WorkflowInput.model_fields)
+        input_values = workflow_input.model_dump(include=set(input_fields))
+
+    return _digest({
+        "node": f"{node_cls.__module__}.{node_cls.__qualname__}",
+        "code": code_version(node),
+        "config": node.model_dump(include=config_fields),
+        "inputs": input_values,
+        "upstream": {parent.name: upstream_digest(parent) for parent in upstream if parent.attempt},
+    })
@@ -0,0 +1,104 @@
+import os
+import pickle
+import threading
+from pathlib import Path
+from uuid import uuid4
+
+from fluxly.core.cache.config import CacheConfig
+from fluxly.core.node.output import NodeOutput
+
+# Automatic eviction frees this much headroom below the limit, so it does not run again on the next put.
+_EVICTION_TARGET_FRACTION = 0.9
+
+
+class ResultCache:
+    """Content-addressed store of node outputs on local disk.
+
+    Each entry is a pickled ``NodeOutput`` named after its cache key. Reads refresh the
+    file's modification time, so evicting the oldest files first keeps the store under
+    ``max_size_mb`` in least-recently-used order.
+
+    The store size is scanned once, then tracked as entries are written; the directory is
+    only scanned again when that estimate crosses the limit. Entries written by other
+    processes are picked up by that scan.
+    """
+
+    def __init__(self, config: CacheConfig) -> None:
+        self._directory = Path(config.directory).expanduser()
+        self._max_size_bytes = config.max_size_mb * 1024 * 1024
+        self._lock = threading.Lock()
+        self._estimated_bytes: int | None = None
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def get(self, key: str) -> NodeOutput | None:
+        path = self._path(key)
+        try:
+            output = pickle.loads(path.read_bytes())
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+            path.unlink(missing_ok=True)
+            return None
+        return output
+
+    def put(self, key: str, output: NodeOutput) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = pickle.dumps(output)
+        tmp_path = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+        tmp_path.write_bytes(data)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._estimated_bytes is None:
+                self._estimated_bytes = sum(stat.st_size for _, stat in self._entries())
+            else:
+                self._estimated_bytes += len(data) - replaced
+            over_limit = self._estimated_bytes > self._max_size_bytes
+        if over_limit:
+            self.evict(int(self._max_size_bytes * _EVICTION_TARGET_FRACTION))
+
+    def size_bytes(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def count(self) -> int:
+        return len(self._entries())
+
+    def evict(self, max_size_bytes: int | None = None) -> int:
+        """Remove least recently used entries until the store fits; returns how many were removed."""
+        limit = self._max_size_bytes if max_size_bytes is None else max_size_bytes
+        with self._lock:
+            entries = self._entries()
+            total = sum(stat.st_size for _, stat in entries)
+            removed = 0
+            for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime):
+                if total <= limit:
+                    break
+                path.unlink(missing_ok=True)
+                total -= stat.st_size
+                removed += 1
+            self._estimated_bytes = total
+            return removed
+
+    def clear(self) -> int:
+        return self.evict(max_size_bytes=0)
+
+    def _path(self, key: str) -> Path:
+        return self._directory / key[:2] / f"{key}.pkl"
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self._directory.glob("*/*.pkl"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return entries
@@ -0,0 +1,136 @@
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from loguru import logger
+
+from fluxly.core.exceptions import CancelledException
+
+
+def _run_callback(callback: Callable[[], None]) -> None:
+    # A failing callback must not stop the others, nor the thread that runs them.
+    try:
+        callback()
+    except Exception:
+        logger.exception(f"Cancellation callback {callback!r} failed")
+
+
+class CancellationToken:
+    """Cooperative cancellation signal shared between a scheduler and running work.
+
+    Work can poll ``cancelled``/``raise_if_cancelled()`` or register callbacks that fire
+    once on cancellation (e.g. to kill a subprocess). Child tokens are cancelled together
+    with their parent.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            _run_callback(callback)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise CancelledException("Execution was cancelled")
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run ``callback`` on cancellation (immediately if already cancelled); returns an unregister function."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+
+        callback()
+        return lambda: None
+
+    def child(self) -> "CancellationToken":
+        token = CancellationToken()
+        self.add_callback(token.cancel)
+        return token
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks and callbacks are process-local; a copied token only carries its state.
+        return {"cancelled": self.cancelled}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__()  # type: ignore[misc]
+        if state.get("cancelled"):
+            self._event.set()
+
+
+class Watchdog:
+    """A single daemon thread that runs callbacks once their deadline has passed.
+
+    Timed node attempts register a callback that cancels their token instead of each waiting
+    on a thread of their own. ``schedule`` returns a function that disarms the callback.
+    """
+
+    def __init__(self, name: str = "fluxly-watchdog") -> None:
+        self._name = name
+        self._condition = threading.Condition()
+        self._deadlines: list[list[Any]] = []
+        self._sequence = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> Callable[[], None]:
+        entry: list[Any] = [time.monotonic() + delay, next(self._sequence), callback]
+        with self._condition:
+            heapq.heappush(self._deadlines, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+        def disarm() -> None:
+            with self._condition:
+                entry[2] = None
+
+        return disarm
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                callback = self._next_due()
+            _run_callback(callback)
+
+    def _next_due(self) -> Callable[[], None]:
+        deadlines = self._deadlines
+        while True:
+            while deadlines and deadlines[0][2] is None:
+                heapq.heappop(deadlines)
+            if not deadlines:
+                self._condition.wait()
+                continue
+            remaining = deadlines[0][0] - time.monotonic()
+            if remaining > 0:
+                self._condition.wait(remaining)
+                continue
+            return heapq.heappop(deadlines)[2]
+
+
+# Shared by every timed attempt in the process.
+watchdog = Watchdog()
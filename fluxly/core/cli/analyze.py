@@ -0,0 +1,33 @@
+import click
+
+from fluxly.core.workflow.checkpoint import RunCheckpoint
+from fluxly.core.workflow.exceptions import CheckpointNotFoundException
+from fluxly.core.workflow.input import WorkflowInput
+from fluxly.core.workflow.models import DurationSource
+from fluxly.core.workflow.workflow import Workflow
+
+
+def build_analyze_command(commands: dict[str, tuple[Workflow, type[WorkflowInput]]]) -> click.Command:
+    @click.command(name="analyze", help="Analyze the graph of a workflow: depth, width, critical path and parallelism.")
+    @click.argument("workflow_name", type=click.Choice(sorted(commands)))
+    @click.option(
+        "--durations",
+        type=click.Choice([source.value for source in DurationSource]),
+        default=DurationSource.UNIT.value,
+        show_default=True,
+        help="Node weights: one unit each, declared timeout_seconds, or timings of a previous run (see --run-dir).",
+    )
+    @click.option("--max-workers", type=click.IntRange(min=1), default=None, help="Estimate the makespan for this many workers.")
+    @click.option("--run-dir", type=click.Path(file_okay=False), default=None, help="Checkpoint directory of a previous run to take timings from.")
+    @click.option("--json", "as_json", is_flag=True, help="Print the report as JSON.")
+    def analyze(workflow_name: str, durations: str, max_workers: int | None, run_dir: str | None, as_json: bool) -> None:
+        workflow = commands[workflow_name][0].new_run()
+        if run_dir is not None:
+            try:
+                RunCheckpoint.open(run_dir, workflow_name=workflow.name).restore(workflow.get_nodes())
+            except CheckpointNotFoundException as e:
+                raise click.ClickException(str(e))
+        report = workflow.analyze(DurationSource(durations), max_workers=max_workers)
+        click.echo(report.model_dump_json(indent=2) if as_json else str(report))
+
+    return analyze
@@ -0,0 +1,28 @@
+import click
+
+from fluxly.core.cache import CacheConfig, ResultCache
+
+
+def build_cache_group(cache_config: CacheConfig) -> click.Group:
+    group = click.Group(name="cache", help="Manage the node result cache.")
+
+    @group.command(help="Show where the cache lives and how large it is.")
+    def info() -> None:
+        cache = ResultCache(cache_config)
+        click.echo(f"Directory: {cache.directory}")
+        click.echo(f"Entries: {cache.count()}")
+        click.echo(f"Size: {cache.size_bytes() / (1024 * 1024):.2f} MB (limit {cache_config.max_size_mb} MB)")
+
+    @group.command(help="Remove every cached result.")
+    def clear() -> None:
+        removed = ResultCache(cache_config).clear()
+        click.echo(f"Removed {removed} cached results.")
+
+    @group.command(help="Evict least recently used results until the cache fits the size limit.")
+    @click.option("--max-size-mb", type=int, default=None, help="Size to prune down to; defaults to the configured limit.")
+    def prune(max_size_mb: int | None) -> None:
+        max_size_bytes = max_size_mb * 1024 * 1024 if max_size_mb is not None else None
+        removed = ResultCache(cache_config).evict(max_size_bytes)
+        click.echo(f"Removed {removed} cached results.")
+
+    return group
@@ -1,9 +1,12 @@
-import copy
 from typing import Any
 
 import click
 from pydantic import ValidationError
 
+from fluxly.core.cache import CacheConfig
+from fluxly.core.cli.analyze import build_analyze_command
+from fluxly.core.cli.cache import build_cache_group
+from fluxly.core.exceptions import WorkflowException
 from fluxly.core.utils.consts import ENV_PREFIX
 from fluxly.core.workflow.input import WorkflowInput
 from fluxly.core.workflow.models import EndpointType
@@ -75,7 +78,6 @@ def _build_option(field_name: str, meta: dict[str, Any], is_required: bool) -> c
             show_default=bool(default),
             envvar=envvar_name,
             show_envvar=True,
-            split_envvar=True,
         )
     else:
         click_type: Any = click.Choice([str(v) for v in enum_values]) if enum_values else _json_type_to_click_type(field_type)
@@ -125,8 +127,15 @@ def _create_inputs(workflow_input_cls: type[WorkflowInput], values: dict[str, An
         raise click.ClickException(f"Input validation failed:\n{e}")
 
 
-def _clone_workflow(template: Workflow) -> Workflow:
-    return copy.deepcopy(template)
+def _clone_workflow(command_name: str, template: Workflow) -> Workflow:
+    # Compiled on first use, so a broken workflow only fails its own command.
+    try:
+        template.compile()
+    except WorkflowException as e:
+        error = click.ClickException(f"Workflow {command_name} cannot run: {e.__class__.__name__} {e}".rstrip())
+        error.exit_code = e.exit_code.value
+        raise error
+    return template.new_run()
 
 
 def build_click_command_for_workflow(command_name: str, workflow_template: Workflow, workflow_input_cls: type[WorkflowInput]) -> click.Command:
@@ -135,7 +144,7 @@ def build_click_command_for_workflow(command_name: str, workflow_template: Workf
     def _callback(**kwargs: Any) -> None:
         normalized = _normalize_array_options(kwargs, workflow_input_cls)
         inputs = _create_inputs(workflow_input_cls, normalized)
-        wf = _clone_workflow(workflow_template)
+        wf = _clone_workflow(command_name, workflow_template)
         wf.inputs = inputs
         wf.assign_trigger(endpoint_type=EndpointType.CLI, endpoint_name=command_name)
         wf.init_by_cli()
@@ -144,9 +153,16 @@ def build_click_command_for_workflow(command_name: str, workflow_template: Workf
 
 
 
-def build_click_group_with_commands(commands: dict[str, tuple[Workflow, type[WorkflowInput]]]) -> click.Group:
+def build_click_group_with_commands(
+    commands: dict[str, tuple[Workflow, type[WorkflowInput]]],
+    cache_config: CacheConfig | None = None,
+) -> click.Group:
     group = click.Group(help="Fluxly Framework Runner")
     for command_name, (workflow_template, wf_input_cls) in commands.items():
         group.add_command(build_click_command_for_workflow(command_name, workflow_template, wf_input_cls), name=command_name)
+    if cache_config is not None and "cache" not in commands:
+        group.add_command(build_cache_group(cache_config), name="cache")
+    if commands and "analyze" not in commands:
+        group.add_command(build_analyze_command(commands), name="analyze")
     return group
 
@@ -18,6 +18,9 @@ class WorkflowException(Exception):
 class TimeoutException(WorkflowException):
     exit_code: Enum = StatusCodes.TIMED_OUT
 
+class CancelledException(WorkflowException):
+    exit_code: Enum = StatusCodes.CANCELLED
+
 class InfrastructureErrorException(WorkflowException):
     exit_code: Enum = StatusCodes.INFRASTRUCTURE_ERROR
 
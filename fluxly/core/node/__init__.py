@@ -1,13 +1,18 @@
 from fluxly.core.node.error import NodeError
 from fluxly.core.node.execution import NodeExecution
-from fluxly.core.node.metadata import NodeMetadata
+from fluxly.core.node.map_node import MapNode
+from fluxly.core.node.metadata import NodeMetadata, ShardMetadata
+from fluxly.core.node.models import ExecutorType
 from fluxly.core.node.node import Node
 from fluxly.core.node.output import NodeOutput
 
 __all__ = [
     "Node",
+    "MapNode",
     "NodeMetadata",
+    "ShardMetadata",
     "NodeOutput",
     "NodeExecution",
     "NodeError",
+    "ExecutorType",
 ]
@@ -10,12 +10,12 @@ from fluxly.core.status import StatusCodes
 
 
 class NodeExecution(BaseModel):
-    metadata: Annotated[NodeMetadata, Field(description="Per-attempt execution metadata")] = NodeMetadata()
+    metadata: Annotated[NodeMetadata, Field(default_factory=NodeMetadata, description="Per-attempt execution metadata")]
     status: Annotated[StatusCodes, Field(description="Node execution status")] = StatusCodes.WAITING
     output: Annotated[
         SerializeAsAny[NodeOutput],
-        Field(description="Per-attempt output state"),
-    ] = NodeOutput()
+        Field(default_factory=NodeOutput, description="Per-attempt output state"),
+    ]
     error: Annotated[NodeError | None, Field(description="Error for this attempt if failed")] = None
 
     _id: str = PrivateAttr(default_factory=lambda: str(uuid4()))
@@ -0,0 +1,211 @@
+import threading
+from abc import abstractmethod
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Annotated, Any
+
+from pydantic import Field, PrivateAttr
+
+from fluxly.core.exceptions import WorkflowException
+from fluxly.core.node.error import NodeError
+from fluxly.core.node.metadata import ShardMetadata
+from fluxly.core.node.node import Node
+from fluxly.core.resources import ResourceBudget
+from fluxly.core.status import StatusCodes
+from fluxly.core.utils.consts import DEFAULT_MAX_WORKERS
+from fluxly.core.workflow.worker_pool import WorkerPool
+
+
+def _map_in_worker(node: "MapNode", shard: Any) -> tuple[Any, Exception | None]:
+    try:
+        return node._map(shard), None
+    except Exception as e:
+        return None, e
+
+
+class MapNode(Node):
+    """Node that splits its work into shards at runtime and maps them in parallel.
+
+    ``_split`` returns the shards, ``_map`` runs once per shard on a bounded pool of threads
+    (or on the process pool when the node runs with the process executor), and ``_reduce``
+    merges the shard results, in split order, into the node output. Shards are retried on
+    their own; when the node itself is retried, shards that already completed are kept.
+
+    The node maps shards on its own worker and on workers borrowed from the workflow pool,
+    up to ``max_shard_workers`` in total. Each borrowed worker also reserves the node's
+    ``resources`` from the workflow budget, so shards never exceed ``max_workers`` or the
+    capacity. Borrowing never blocks: with no free worker, the shards run one at a time.
+    """
+
+    max_shard_workers: Annotated[int | None, Field(gt=0, description="Maximum number of shards mapped concurrently.")] = None
+    shard_max_retries: Annotated[int, Field(ge=0, description="Maximum number of map attempts per shard in case of failure.")] = 0
+    shard_retry_delay_seconds: Annotated[float, Field(ge=0, description="Delay between shard retries in seconds.")] = 0
+
+    _shard_results: dict[int, Any] = PrivateAttr(default_factory=dict)
+    _worker_pool: WorkerPool | None = PrivateAttr(default=None)
+    _resource_budget: ResourceBudget | None = PrivateAttr(default=None)
+
+    @abstractmethod
+    def _split(self) -> Iterable[Any]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _map(self, shard: Any) -> Any:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _reduce(self, results: list[Any]) -> None:
+        raise NotImplementedError()
+
+    @property
+    def _shard_workers(self) -> int:
+        return self.max_shard_workers or DEFAULT_MAX_WORKERS
+
+    @property
+    def _process_slots(self) -> int:
+        return self._shard_workers
+
+    def _set_worker_pool(self, worker_pool: WorkerPool | None, resource_budget: ResourceBudget | None) -> None:
+        self._worker_pool = worker_pool
+        self._resource_budget = resource_budget
+
+    def _run_with_timeout(self) -> None:
+        # Split and reduce stay in this process; only the shards go to worker processes.
+        self._run_locally()
+
+    def _logic(self) -> None:
+        shards = list(self._split())
+        if self._call_attempts <= 1:
+            self._shard_results = {}
+        self._shard_results = {i: r for i, r in self._shard_results.items() if i < len(shards)}
+
+        records = [ShardMetadata(index=i) for i in range(len(shards))]
+        self.current_execution.metadata.shards = records
+        pending = []
+        for record in records:
+            if record.index in self._shard_results:
+                record.status = StatusCodes.COMPLETED
+                record.reused = True
+            else:
+                pending.append(record)
+
+        if pending:
+            errors = self._map_pending(shards, pending)
+            if errors:
+                self._logger.error(f"{self.name}: {len(errors)} of {len(shards)} shards failed")
+                raise errors[0]
+
+        results = [self._shard_results[i] for i in range(len(shards))]
+        self._shard_results = {}
+        self._reduce(results)
+
+    def _map_pending(self, shards: list[Any], pending: list[ShardMetadata]) -> list[Exception]:
+        """Map the pending shards on this thread and on borrowed workers; returns the errors in shard order."""
+        queued = iter(pending)
+        lock = threading.Lock()
+        errors: dict[int, Exception] = {}
+
+        def drain() -> None:
+            while True:
+                with lock:
+                    record = next(queued, None)
+                if record is None:
+                    return
+                try:
+                    self._run_shard(shards[record.index], record)
+                except Exception as e:
+                    with lock:
+                        errors[record.index] = e
+
+        wanted = min(self._shard_workers, len(pending)) - 1
+        pool = self._worker_pool
+        # Outside of a workflow there is no pool to borrow from, so the attempt brings its own.
+        owned_pool = WorkerPool(max_workers=wanted, name=f"{self.name}-shard") if pool is None and wanted > 0 else None
+        pool = pool or owned_pool
+        helpers = self._borrow_workers(pool, wanted) if pool is not None else 0
+        finished = threading.Semaphore(0)
+
+        def helper() -> None:
+            try:
+                drain()
+            finally:
+                finished.release()
+
+        try:
+            for _ in range(helpers):
+                pool.submit(helper)
+            drain()
+            for _ in range(helpers):
+                finished.acquire()
+        finally:
+            self._return_workers(pool, helpers)
+            if owned_pool is not None:
+                owned_pool.shutdown()
+        return [errors[index] for index in sorted(errors)]
+
+    def _borrow_workers(self, pool: WorkerPool, wanted: int) -> int:
+        granted = pool.try_reserve(wanted)
+        budget = self._resource_budget
+        if budget is None:
+            return granted
+        for acquired in range(granted):
+            if not budget.try_acquire(self.resources):
+                pool.release(granted - acquired)
+                return acquired
+        return granted
+
+    def _return_workers(self, pool: WorkerPool | None, count: int) -> None:
+        if pool is None or count == 0:
+            return
+        pool.release(count)
+        if self._resource_budget is not None:
+            for _ in range(count):
+                self._resource_budget.release(self.resources)
+
+    def _run_shard(self, shard: Any, record: ShardMetadata) -> None:
+        token = self._cancel_token
+        record.start_time = datetime.now()
+        while True:
+            token.raise_if_cancelled()
+            record.attempts += 1
+            record.status = StatusCodes.IN_PROGRESS
+            try:
+                self._shard_results[record.index] = self._map_shard(shard)
+                record.status = StatusCodes.COMPLETED
+                record.error = None
+                return
+            except Exception as e:
+                status = e.exit_code if isinstance(e, WorkflowException) else StatusCodes.FAILED
+                record.status = status
+                record.error = NodeError(status=status, exception_class_name=e.__class__.__name__, exception_message=str(e))
+                if token.cancelled or not self.retry_policy.is_retryable(e) or record.attempts >= self.shard_max_retries:
+                    raise e
+                delay = self.retry_policy.delay_seconds(self.shard_retry_delay_seconds, record.attempts)
+                self._logger.warning(f"{self.name} shard {record.index} failed: {e}. Retrying in {delay:.2f}s...")
+                if token.wait(delay):
+                    raise e
+            finally:
+                record.end_time = datetime.now()
+
+    def _map_shard(self, shard: Any) -> Any:
+        if self._process_pool is None:
+            return self._map(shard)
+
+        result, error = self._process_pool.call(
+            _map_in_worker,
+            self,
+            shard,
+            label=f"shard of node {self.name}",
+            cancel_token=self._cancel_token,
+        )
+        if error is not None:
+            raise error
+        return result
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # Shards are shipped one by one; results of the other shards and the workflow's pools stay in the parent.
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private and (private.get("_shard_results") or private.get("_worker_pool") is not None or private.get("_resource_budget") is not None):
+            state["__pydantic_private__"] = {**private, "_shard_results": {}, "_worker_pool": None, "_resource_budget": None}
+        return state
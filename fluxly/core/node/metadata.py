@@ -2,12 +2,35 @@ from typing import Annotated
 
 from pydantic import BaseModel, Field, computed_field
 
+from fluxly.core.node.error import NodeError
+from fluxly.core.status import StatusCodes
 from fluxly.core.utils.types import DatetimeReadable, TimedeltaReadable
 
 
+class ShardMetadata(BaseModel):
+    index: Annotated[int, Field(description="Position of the shard in the split.")]
+    status: Annotated[StatusCodes, Field(description="Shard status")] = StatusCodes.WAITING
+    attempts: Annotated[int, Field(description="Times the shard was mapped during this node attempt.")] = 0
+    reused: Annotated[bool, Field(description="Whether the result was kept from an earlier attempt of the node.")] = False
+    start_time: Annotated[DatetimeReadable, Field(description="Start datetime of the first shard attempt.")] = None
+    end_time: Annotated[DatetimeReadable, Field(description="End datetime of the last shard attempt.")] = None
+    error: Annotated[NodeError | None, Field(description="Error of the last attempt if the shard failed")] = None
+
+    @computed_field
+    @property
+    def process_time(self) -> TimedeltaReadable:
+        if self.start_time and self.end_time:
+            return self.end_time - self.start_time
+        return None
+
+
 class NodeMetadata(BaseModel):
     start_time: Annotated[DatetimeReadable, Field(description="Start datetime of the node execution.")] = None
     end_time: Annotated[DatetimeReadable, Field(description="End datetime of the node execution.")] = None
+    cache_hit: Annotated[bool, Field(description="Whether the output was restored from the result cache instead of running the node.")] = False
+    shards: Annotated[list[ShardMetadata], Field(description="Per-shard records of a map node.")] = []
+    output_released: Annotated[bool, Field(description="Whether the transient output was dropped after all children completed.")] = False
+    output_summary: Annotated[dict[str, str] | None, Field(description="Summary of the output fields kept when the output was released.")] = None
 
     @computed_field
     @property
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ExecutorType(str, Enum):
+    THREAD = "thread"
+    PROCESS = "process"
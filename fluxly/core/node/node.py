@@ -1,20 +1,60 @@
+import asyncio
+import inspect
+import subprocess
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
 from datetime import datetime
-from typing import Annotated
+from functools import cache
+from typing import TYPE_CHECKING, Annotated, Any, get_args
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, PrivateAttr
 
-from fluxly.core.exceptions import TimeoutException, WorkflowException
+from fluxly.core.cancellation import CancellationToken, watchdog
+from fluxly.core.exceptions import (
+    CancelledException,
+    TimeoutException,
+    WorkflowException,
+)
 from fluxly.core.node.error import NodeError
 from fluxly.core.node.execution import NodeExecution
+from fluxly.core.node.models import ExecutorType
+from fluxly.core.node.process_pool import ProcessWorkerPool
+from fluxly.core.node.record import AttemptRecord, ExecutionHistory
+from fluxly.core.resources import NodeResources, ResourceBudget
+from fluxly.core.retry import RetryPolicy
 from fluxly.core.status import StatusCodes
+from fluxly.core.utils.copying import copy_with_fresh_private_state
 from fluxly.core.workflow.input import WorkflowInput
 from fluxly.core.workflow.metadata import WorkflowMetadata
 from fluxly.services import LoggerConfig, LoggerService
 
+if TYPE_CHECKING:
+    from fluxly.core.cache.store import ResultCache
+    from fluxly.core.workflow.stream import BatchStream
+    from fluxly.core.workflow.worker_pool import WorkerPool
+
+# Kept when a node is copied for a new run; every other private attribute is run state.
+# The cancel token is only a placeholder until the first attempt replaces it.
+_SHARED_PRIVATE_ATTRIBUTES = frozenset({"_id", "_logger", "_cancel_token"})
+
+
+class _AbandonedAttempt:
+    """Thread of a timed-out attempt that was left running; the next attempt waits for it first."""
+
+    def __init__(self) -> None:
+        self.finished = threading.Event()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The thread belongs to the original node; a copy has nothing to wait for.
+        return {}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__()  # type: ignore[misc]
+        self.finished.set()
+
 
 class Node(ABC, BaseModel):
     name: Annotated[str, Field(..., max_length=30, min_length=3, description="The name of the node.")]
@@ -22,11 +62,31 @@ class Node(ABC, BaseModel):
     timeout_seconds: Annotated[int, Field(gt=0, description="Timeout for the node in seconds.")] | None = None
     max_retries: Annotated[int, Field(ge=0, description="Maximum number of run attempts allowed in case of failure.")] = 0
     retry_delay_seconds: Annotated[int, Field(ge=0, description="Delay between retries in seconds.")] = 0
+    retry_policy: Annotated[RetryPolicy, Field(description="Which failures are retried, and the backoff applied to `retry_delay_seconds`.")] = RetryPolicy()
+    cache: Annotated[bool, Field(description="Reuse a cached output instead of running `_logic` when the cache key matches.")] = False
+    cache_version: Annotated[str | None, Field(description="Code version in the cache key; defaults to a hash of the node class source.")] = None
+    cache_inputs: Annotated[list[str] | None, Field(description="WorkflowInput fields in the cache key; defaults to all fields declared by the input class.")] = None
+    cancel_grace_seconds: Annotated[float, Field(ge=0, description="Time a timed-out or cancelled attempt gets to stop before the next one starts.")] = 5
+    cooperative_timeout: Annotated[bool, Field(description="Run `_logic` on the worker thread and enforce `timeout_seconds` only by cancelling the token, which `_logic` must check.")] = False
+    priority: Annotated[int, Field(description="Scheduling priority when workers are limited; higher runs first, before the critical-path rank is considered.")] = 0
+    expected_duration_seconds: Annotated[float | None, Field(gt=0, description="Declared duration estimate used to rank nodes on the critical path.")] = None
+    resources: Annotated[NodeResources, Field(description="Resources reserved from the workflow capacity while the node runs.")] = NodeResources()
+    transient_output: Annotated[bool, Field(description="Drop the output once every child has completed, keeping only a summary in the execution record.")] = False
+    executor: Annotated[ExecutorType | None, Field(description="Where `_logic` runs: a worker thread or a worker process. Defaults to the workflow executor.")] = None
 
     _id: str = PrivateAttr(default_factory=lambda: str(uuid4()))
-    _executions: list[NodeExecution] = PrivateAttr(default_factory=list)
+    _records: list[AttemptRecord] = PrivateAttr(default_factory=list)
+    _first_attempt: int = PrivateAttr(default=0)
     _workflow_input: WorkflowInput | None = PrivateAttr(default=None)
     _workflow_metadata: WorkflowMetadata | None = PrivateAttr(default=None)
+    _process_pool: ProcessWorkerPool | None = PrivateAttr(default=None)
+    _cancel_token: CancellationToken = PrivateAttr(default_factory=CancellationToken)
+    _cancel_scope: CancellationToken | None = PrivateAttr(default=None)
+    _abandoned_attempt: _AbandonedAttempt | None = PrivateAttr(default=None)
+    _result_cache: "ResultCache | None" = PrivateAttr(default=None)
+    _cache_key: str | None = PrivateAttr(default=None)
+    _input_streams: "dict[str, BatchStream]" = PrivateAttr(default_factory=dict)
+    _output_streams: "list[BatchStream]" = PrivateAttr(default_factory=list)
     _logger: LoggerService = LoggerService(config=LoggerConfig())
 
     @property
@@ -35,7 +95,11 @@ class Node(ABC, BaseModel):
 
     @property
     def executions(self) -> list[NodeExecution]:
-        return self._executions
+        return [record.materialize(self._create_execution) for record in self._records]
+
+    def _execution_history(self) -> ExecutionHistory:
+        """The attempts so far, materialized only when read."""
+        return ExecutionHistory(self._records, self._create_execution)
 
     @property
     def workflow_input(self) -> WorkflowInput | None:
@@ -49,82 +113,379 @@ class Node(ABC, BaseModel):
         self._workflow_input = workflow_input
         self._workflow_metadata = workflow_metadata
 
+    def _set_process_pool(self, process_pool: ProcessWorkerPool | None) -> None:
+        self._process_pool = process_pool
+
+    def _set_worker_pool(self, worker_pool: "WorkerPool | None", resource_budget: ResourceBudget | None) -> None:
+        """Workflow workers and resources the node may borrow while it runs; only nodes that fan out use them."""
+        pass
+
+    def _set_result_cache(self, result_cache: "ResultCache | None", cache_key: str | None) -> None:
+        self._result_cache = result_cache
+        self._cache_key = cache_key
+
+    def _set_cancel_scope(self, cancel_scope: CancellationToken | None) -> None:
+        self._cancel_scope = cancel_scope
+
+    def _set_streams(self, input_streams: "dict[str, BatchStream]", output_streams: "list[BatchStream]") -> None:
+        self._input_streams = input_streams
+        self._output_streams = output_streams
+
+    def emit(self, batch: Any) -> None:
+        """Send a batch to the consumers on streaming edges; blocks while their buffers are full."""
+        for stream in self._output_streams:
+            stream.put(batch, self._cancel_token)
+
+    def stream(self, producer: "Node") -> Iterator[Any]:
+        """Iterate over the batches ``producer`` emits on its streaming edge to this node."""
+        stream = self._input_streams.get(producer.name)
+        if stream is None:
+            raise ValueError(f"No streaming edge from {producer.name} to {self.name} in the current run")
+        return stream.iterate(self._cancel_token)
+
+    @property
+    def cancel_token(self) -> CancellationToken:
+        """Token of the current attempt; cancelled on timeout or when the workflow is cancelled."""
+        return self._cancel_token
+
+    def raise_if_cancelled(self) -> None:
+        self._cancel_token.raise_if_cancelled()
+
+    def run_subprocess(self, args: str | Sequence[str], check: bool = False, **kwargs: Any) -> subprocess.CompletedProcess:
+        """Run a command that is killed as soon as the current attempt is cancelled."""
+        process = subprocess.Popen(args, **kwargs)
+        unregister = self._cancel_token.add_callback(process.kill)
+        try:
+            stdout, stderr = process.communicate()
+        finally:
+            unregister()
+
+        self.raise_if_cancelled()
+        completed = subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+        if check:
+            completed.check_returncode()
+        return completed
+
     @abstractmethod
     def _logic(self) -> None:
         raise NotImplementedError()
 
     @property
     def current_execution(self) -> NodeExecution:
-        return self._executions[-1]
+        return self._records[-1].materialize(self._create_execution)
 
     @property
     def last_execution(self) -> NodeExecution:
-        return self._executions[-1]
+        return self._records[-1].materialize(self._create_execution)
+
+    @property
+    def _last_record(self) -> AttemptRecord:
+        """The latest attempt without building its execution model, for the scheduler hot path."""
+        return self._records[-1]
 
     @property
     def attempt(self) -> int:
-        return len(self._executions)
+        return len(self._records)
+
+    @property
+    def _call_attempts(self) -> int:
+        """Attempts made by the current ``execute`` call; earlier workflow attempts do not count."""
+        return self.attempt - self._first_attempt
+
+    @property
+    def _process_slots(self) -> int:
+        """Worker processes the node can keep busy at once."""
+        return 1
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self._logic)
 
     def execute(self) -> None:
-        while self.attempt <= self.max_retries:
+        if self.is_async:
+            asyncio.run(self.execute_async())
+            return
+
+        self._first_attempt = self.attempt
+        if self._restore_cached_output():
+            return
+
+        owned_pool = None
+        if self.executor == ExecutorType.PROCESS and self._process_pool is None:
+            owned_pool = ProcessWorkerPool(max_workers=self._process_slots)
+            self._process_pool = owned_pool
+        try:
+            self._execute_attempts()
+        finally:
+            if owned_pool is not None:
+                owned_pool.shutdown()
+                self._process_pool = None
+        self._store_cached_output()
+
+    def _execute_attempts(self) -> None:
+        while True:
             try:
-                self._start_node_execution()
-                self.on_start()
+                self._run_attempt()
+                return
+            except Exception as e:
+                delay = self._next_retry_delay(e)
+                if delay is None:
+                    raise e
+                if not self._wait_before_retry(delay):
+                    raise e
+
+    async def execute_async(self) -> None:
+        self._first_attempt = self.attempt
+        if self._restore_cached_output():
+            return
 
-                self._run_with_timeout()
-                self.on_success()
+        while True:
+            try:
+                await self._run_attempt_async()
                 break
             except Exception as e:
-                self.on_failure(e)
-                if not self._handle_retry(e):
+                delay = self._next_retry_delay(e)
+                if delay is None:
                     raise e
-            finally:
-                self._finalize_node_execution()
-                self.on_finish()
+                await asyncio.sleep(delay)
+        self._store_cached_output()
+
+    def _run_scheduled_attempt(self, first_attempt: bool) -> float | None:
+        """Run a single attempt for the workflow scheduler.
+
+        Returns the delay after which the scheduler should start the next attempt, or None
+        once the node is done. Raises when the node failed for good.
+        """
+        if first_attempt:
+            self._first_attempt = self.attempt
+            if self._restore_cached_output():
+                return None
+
+        try:
+            self._run_attempt()
+        except Exception as e:
+            delay = self._next_retry_delay(e)
+            if delay is None:
+                raise e
+            return delay
+
+        self._store_cached_output()
+        return None
+
+    async def _run_scheduled_attempt_async(self, first_attempt: bool) -> float | None:
+        if first_attempt:
+            self._first_attempt = self.attempt
+            if self._restore_cached_output():
+                return None
+
+        try:
+            await self._run_attempt_async()
+        except Exception as e:
+            delay = self._next_retry_delay(e)
+            if delay is None:
+                raise e
+            return delay
+
+        self._store_cached_output()
+        return None
+
+    def _run_attempt(self) -> None:
+        try:
+            self._start_node_execution()
+            self.on_start()
+
+            self._run_with_timeout()
+            self.on_success()
+        except Exception as e:
+            self.on_failure(e)
+            raise e
+        finally:
+            self._finalize_node_execution()
+            self.on_finish()
+
+    async def _run_attempt_async(self) -> None:
+        try:
+            self._start_node_execution()
+            self.on_start()
+
+            await self._run_with_timeout_async()
+            self.on_success()
+        except Exception as e:
+            self.on_failure(e)
+            raise e
+        finally:
+            self._finalize_node_execution()
+            self.on_finish()
+
+    def _restore_cached_output(self) -> bool:
+        if self._result_cache is None or self._cache_key is None:
+            return False
+        output = self._result_cache.get(self._cache_key)
+        if output is None:
+            return False
+
+        self._start_node_execution()
+        self.current_execution.output = output
+        self.current_execution.metadata.cache_hit = True
+        self._finalize_node_execution()
+        return True
+
+    def _store_cached_output(self) -> None:
+        if self._result_cache is None or self._cache_key is None:
+            return
+        if self._last_record.status == StatusCodes.COMPLETED:
+            self._result_cache.put(self._cache_key, self.last_execution.output)
+
+    def _release_output(self) -> None:
+        for execution in self.executions:
+            if execution.metadata.output_released:
+                continue
+            execution.metadata.output_summary = execution.output.summarize()
+            execution.output = self._create_execution().output
+            execution.metadata.output_released = True
 
     def _create_execution(self) -> NodeExecution:
         return NodeExecution()
 
     def _start_node_execution(self) -> None:
-        execution = self._create_execution()
-        execution._attempt = self.attempt + 1
-        execution.metadata.start_time = datetime.now()
-        execution.status = StatusCodes.IN_PROGRESS
-        self._executions.append(execution)
+        records = self._records
+        records.append(AttemptRecord(len(records) + 1, datetime.now()))
+        cancel_scope = self._cancel_scope
+        self._cancel_token = cancel_scope.child() if cancel_scope is not None else CancellationToken()
 
     def _run_with_timeout(self) -> None:
+        if self._process_pool is not None:
+            self._run_in_process()
+            return
+        self._run_locally()
+
+    def _run_locally(self) -> None:
+        """Run ``_logic`` in this process, on a thread of its own only when a timeout must be enforced."""
+        abandoned = self._abandoned_attempt
+        if abandoned is not None:
+            self._abandoned_attempt = None
+            if not abandoned.finished.wait(timeout=self.cancel_grace_seconds):
+                self._logger.warning(f"{self.name} did not stop within {self.cancel_grace_seconds}s of being cancelled")
+
+        if self.timeout_seconds is not None and not self.cooperative_timeout:
+            self._run_in_thread()
+        else:
+            self._run_inline()
+
+    def _run_in_thread(self) -> None:
+        token = self._cancel_token
         result: list[Exception | None] = [None]
+        attempt = _AbandonedAttempt()
+        wake_up = threading.Event()
 
         def runner() -> None:
             try:
                 self._logic()
             except Exception as e:
                 result[0] = e
+            finally:
+                attempt.finished.set()
+                wake_up.set()
 
-        thread = threading.Thread(target=runner, daemon=True)
+        thread = threading.Thread(target=runner, name=f"fluxly-{self.name}", daemon=True)
+        unregister = token.add_callback(wake_up.set)
         thread.start()
-        thread.join(timeout=self.timeout_seconds)
-
-        if thread.is_alive():
+        wake_up.wait(timeout=self.timeout_seconds)
+        unregister()
+
+        if not attempt.finished.is_set():
+            # Give up on the attempt right away so its worker is freed; a retry waits for the thread.
+            error = CancelledException() if token.cancelled else TimeoutException()
+            token.cancel()
+            self._abandoned_attempt = attempt
+            self._handle_exception(error)
+
+        self._handle_exception(result[0])
+
+    def _run_inline(self) -> None:
+        """Run ``_logic`` on the calling thread; a cooperative timeout cancels the token through the shared watchdog."""
+        token = self._cancel_token
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            token.cancel()
+
+        disarm = watchdog.schedule(self.timeout_seconds, expire) if self.timeout_seconds is not None else None
+        error: Exception | None = None
+        try:
+            self._logic()
+        except Exception as e:
+            error = e
+        finally:
+            if disarm is not None:
+                disarm()
+
+        if timed_out.is_set():
             self._handle_exception(TimeoutException())
+        if token.cancelled and (error is None or isinstance(error, CancelledException)):
+            self._handle_exception(CancelledException())
+        self._handle_exception(error)
+
+    async def _run_with_timeout_async(self) -> None:
+        token = self._cancel_token
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(self._logic())
+        unregister = token.add_callback(lambda: loop.call_soon_threadsafe(task.cancel))
+        try:
+            await asyncio.wait_for(task, timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            token.cancel()
+            self._handle_exception(TimeoutException())
+        except asyncio.CancelledError:
+            if not token.cancelled:
+                raise
+            self._handle_exception(CancelledException())
+        except Exception as e:
+            self._handle_exception(e)
+        finally:
+            unregister()
+
+    def _run_in_process(self) -> None:
+        try:
+            execution, error = self._process_pool.run(self, timeout=self.timeout_seconds, cancel_token=self._cancel_token)
+        except Exception as e:
+            self._handle_exception(e)
+            return
 
-        if result[0] is not None:
-            self._handle_exception(result[0])
+        if execution is not None:
+            self._records[-1] = AttemptRecord.of(execution)
+        self._handle_exception(error)
 
-    def _handle_retry(self, error: Exception) -> bool:
-        if self.attempt >= self.max_retries:
+    def _next_retry_delay(self, error: Exception) -> float | None:
+        """Delay before the next attempt, or None when the failure must not be retried."""
+        if self._cancel_scope is not None and self._cancel_scope.cancelled:
+            return None
+
+        if not self.retry_policy.is_retryable(error):
+            self._logger.error(f"{self.name} failed: {error}. Not retryable.")
+            return None
+
+        if self._call_attempts >= self.max_retries:
             self._logger.error(f"{self.name} failed: {error}. Retries exhausted.")
-            return False
+            return None
 
-        self._logger.warning(f"{self.name} failed: {error}. Retrying in {self.retry_delay_seconds}s...")
-        time.sleep(self.retry_delay_seconds)
+        delay = self.retry_policy.delay_seconds(self.retry_delay_seconds, self._call_attempts)
+        self._logger.warning(f"{self.name} failed: {error}. Retrying in {delay:.2f}s...")
+        return delay
+
+    def _wait_before_retry(self, delay: float) -> bool:
+        if self._cancel_scope is not None:
+            return not self._cancel_scope.wait(delay)
+
+        time.sleep(delay)
         return True
 
     def _finalize_node_execution(self) -> None:
-        current = self.current_execution
+        current = self._records[-1]
 
-        if current.metadata.end_time is None:
-            current.metadata.end_time = datetime.now()
+        if current.end_time is None:
+            current.end_time = datetime.now()
 
         if current.status == StatusCodes.IN_PROGRESS:
             current.status = StatusCodes.COMPLETED
@@ -133,7 +494,7 @@ class Node(ABC, BaseModel):
         if exception is None:
             return
 
-        current = self.current_execution
+        current = self._records[-1]
         status = exception.exit_code if isinstance(exception, WorkflowException) else StatusCodes.FAILED
         current.status = status
         current.error = NodeError(
@@ -159,6 +520,40 @@ class Node(ABC, BaseModel):
         """Called at the end of any node execution (success or failure)."""
         pass
 
+    def _copy_for_run(self) -> "Node":
+        """Copy for a new workflow run: field values are shared, private state starts from its defaults."""
+        return copy_with_fresh_private_state(self, _SHARED_PRIVATE_ATTRIBUTES)
+
+    def _rebind_nodes(self, copies: dict[int, "Node"]) -> None:
+        """Point fields annotated with a node type at the copies of those nodes for the same run."""
+        fields = self.__dict__
+        for name in _node_fields(type(self)):
+            value = fields[name]
+            if isinstance(value, Node):
+                fields[name] = copies.get(id(value), value)
+            elif isinstance(value, list | tuple):
+                fields[name] = type(value)(copies.get(id(item), item) for item in value)
+            elif isinstance(value, dict):
+                fields[name] = {key: copies.get(id(item), item) for key, item in value.items()}
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # Worker pools, caches and streams are process-local and must never travel with a pickled node.
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private and (
+            private.get("_process_pool") is not None
+            or private.get("_result_cache") is not None
+            or private.get("_input_streams")
+            or private.get("_output_streams")
+        ):
+            state["__pydantic_private__"] = {
+                **private,
+                "_process_pool": None,
+                "_result_cache": None,
+                "_input_streams": {},
+                "_output_streams": [],
+            }
+        return state
 
     def __hash__(self) -> int:
         return hash(self.name)
@@ -169,3 +564,14 @@ class Node(ABC, BaseModel):
 
         if other is self:
             return True
+
+
+def _annotation_mentions_node(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, Node):
+        return True
+    return any(_annotation_mentions_node(arg) for arg in get_args(annotation))
+
+
+@cache
+def _node_fields(cls: type[Node]) -> tuple[str, ...]:
+    return tuple(name for name, field in cls.model_fields.items() if _annotation_mentions_node(field.annotation))
@@ -1,8 +1,66 @@
+from collections.abc import Sized
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel
+from pydantic import (
+    BaseModel,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
+
+if TYPE_CHECKING:
+    from fluxly.core.spill.handle import SpilledValue
+
+
+def describe_value(value: Any) -> str:
+    """Scalars as-is, containers by type and length, anything else by type."""
+    if value is None or isinstance(value, bool | int | float):
+        return repr(value)
+    if isinstance(value, Sized):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
 
 
 class NodeOutput(BaseModel):
+    _spilled: "dict[str, SpilledValue]" = PrivateAttr(default_factory=dict)
+
+    def summarize(self) -> dict[str, str]:
+        """Lightweight description of each field, without loading spilled ones."""
+        spilled = self._spilled
+        return {
+            name: spilled[name].summary if name in spilled else describe_value(getattr(self, name))
+            for name in type(self).model_fields
+        }
+
+    @property
+    def spilled_fields(self) -> list[str]:
+        return list(self._spilled)
+
+    def _spill_field(self, name: str, handle: "SpilledValue") -> None:
+        self._spilled[name] = handle
+        del self.__dict__[name]
+
+    def __getattr__(self, name: str) -> Any:
+        # Spilled fields are missing from __dict__ until their first access loads them back.
+        try:
+            private = object.__getattribute__(self, "__pydantic_private__")
+        except AttributeError:
+            private = None
+        handle = private["_spilled"].get(name) if private and "_spilled" in private else None
+        if handle is None:
+            return super().__getattr__(name)  # type: ignore[misc]
+
+        value = handle.load()
+        self.__dict__[name] = value
+        private["_spilled"].pop(name, None)
+        return value
+
+    @model_serializer(mode="wrap")
+    def _load_spilled(self, handler: SerializerFunctionWrapHandler) -> Any:
+        for name in list(self._spilled):
+            getattr(self, name)
+        return handler(self)
+
     def __str__(self) -> str:
         return self.model_dump_json(indent=2)
 
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import threading
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import TYPE_CHECKING, Any
+
+from fluxly.core.exceptions import (
+    CancelledException,
+    InfrastructureErrorException,
+    TimeoutException,
+)
+
+if TYPE_CHECKING:
+    from fluxly.core.cancellation import CancellationToken
+    from fluxly.core.node.execution import NodeExecution
+    from fluxly.core.node.node import Node
+
+
+def _worker_main(conn: Connection) -> None:
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+
+        fn, args, label = task
+        try:
+            conn.send(fn(*args))
+        except Exception as e:
+            conn.send((None, InfrastructureErrorException(f"Unable to return result of {label}: {e}")))
+
+
+def _run_node_logic(node: Node) -> tuple[NodeExecution, Exception | None]:
+    error: Exception | None = None
+    try:
+        node._logic()
+    except Exception as e:
+        error = e
+    return node.current_execution, error
+
+
+class _ProcessWorker:
+    def __init__(self, process: BaseProcess, conn: Connection) -> None:
+        self.process = process
+        self.conn = conn
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ProcessWorkerPool:
+    """Pre-spawned, reusable worker processes that run a node's ``_logic``.
+
+    The node is pickled to an idle worker, and the resulting ``NodeExecution`` (plus the
+    raised exception, if any) is shipped back to the parent. ``call`` runs any picklable
+    function returning a ``(result, error)`` pair the same way. A worker that times out or
+    dies is killed and replaced so the pool keeps its size. Cancelling the token passed to
+    ``run`` kills the worker right away instead of waiting for ``_logic`` to return.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self._context = multiprocessing.get_context()
+        self._idle: queue.SimpleQueue[_ProcessWorker] = queue.SimpleQueue()
+        self._workers: list[_ProcessWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(max_workers):
+            self._idle.put(self._spawn())
+
+    @property
+    def max_workers(self) -> int:
+        return len(self._workers)
+
+    def run(
+        self,
+        node: Node,
+        timeout: float | None = None,
+        cancel_token: CancellationToken | None = None,
+    ) -> tuple[NodeExecution | None, Exception | None]:
+        return self.call(_run_node_logic, node, label=f"node {node.name}", timeout=timeout, cancel_token=cancel_token)
+
+    def call(
+        self,
+        fn: Callable[..., tuple[Any, Exception | None]],
+        *args: Any,
+        label: str,
+        timeout: float | None = None,
+        cancel_token: CancellationToken | None = None,
+    ) -> tuple[Any, Exception | None]:
+        worker = self._idle.get()
+        unregister = cancel_token.add_callback(worker.process.kill) if cancel_token is not None else None
+        try:
+            worker.conn.send((fn, args, label))
+            if not worker.conn.poll(timeout):
+                worker = self._replace(worker)
+                raise TimeoutException()
+            return worker.conn.recv()
+        except (EOFError, OSError):
+            worker = self._replace(worker)
+            if cancel_token is not None and cancel_token.cancelled:
+                raise CancelledException(f"Cancelled while running {label}")
+            raise InfrastructureErrorException(f"Process worker running {label} exited unexpectedly")
+        finally:
+            if unregister is not None:
+                unregister()
+                if not worker.process.is_alive() and not self._closed:
+                    # Killed by a cancellation that raced with a finished result.
+                    worker = self._replace(worker)
+            self._idle.put(worker)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            for worker in self._workers:
+                try:
+                    worker.conn.send(None)
+                except OSError:
+                    pass
+            for worker in self._workers:
+                worker.process.join(timeout=1)
+                if worker.process.is_alive():
+                    worker.kill()
+            self._workers.clear()
+
+    def _spawn(self) -> _ProcessWorker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        process.start()
+        child_conn.close()
+        worker = _ProcessWorker(process, parent_conn)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _replace(self, worker: _ProcessWorker) -> _ProcessWorker:
+        worker.kill()
+        with self._lock:
+            self._workers.remove(worker)
+            if self._closed:
+                return worker
+        return self._spawn()
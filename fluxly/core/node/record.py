@@ -0,0 +1,146 @@
+import threading
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from fluxly.core.status import StatusCodes
+
+if TYPE_CHECKING:
+    from fluxly.core.node.error import NodeError
+    from fluxly.core.node.execution import NodeExecution
+
+# Shared by all records: materializing is rare, and a record must not be written while its
+# fields are copied into the execution model.
+_lock = threading.Lock()
+
+
+class AttemptRecord:
+    """Slotted bookkeeping of one node attempt.
+
+    The scheduler hot path only reads and writes these fields. The pydantic ``NodeExecution``
+    is built the first time the attempt is reached through the public API and from then on
+    holds the state, so both views always agree.
+    """
+
+    __slots__ = ("attempt", "execution", "output_digest", "_status", "_start_time", "_end_time", "_error")
+
+    def __init__(self, attempt: int, start_time: datetime | None = None) -> None:
+        self.attempt = attempt
+        self.execution: NodeExecution | None = None
+        # Hash of the completed output, kept for the cache keys of downstream nodes.
+        self.output_digest: str | None = None
+        self._status = StatusCodes.IN_PROGRESS
+        self._start_time = start_time
+        self._end_time: datetime | None = None
+        self._error: NodeError | None = None
+
+    @classmethod
+    def of(cls, execution: "NodeExecution") -> "AttemptRecord":
+        record = cls(execution.attempt)
+        record.execution = execution
+        return record
+
+    def materialize(self, factory: "Callable[[], NodeExecution]") -> "NodeExecution":
+        execution = self.execution
+        if execution is not None:
+            return execution
+        with _lock:
+            if self.execution is None:
+                execution = factory()
+                execution._attempt = self.attempt
+                execution.status = self._status
+                execution.error = self._error
+                execution.metadata.start_time = self._start_time
+                execution.metadata.end_time = self._end_time
+                self.execution = execution
+            return self.execution
+
+    @property
+    def status(self) -> StatusCodes:
+        execution = self.execution
+        return self._status if execution is None else execution.status
+
+    @status.setter
+    def status(self, status: StatusCodes) -> None:
+        with _lock:
+            if self.execution is None:
+                self._status = status
+            else:
+                self.execution.status = status
+
+    @property
+    def start_time(self) -> datetime | None:
+        execution = self.execution
+        return self._start_time if execution is None else execution.metadata.start_time
+
+    @property
+    def end_time(self) -> datetime | None:
+        execution = self.execution
+        return self._end_time if execution is None else execution.metadata.end_time
+
+    @end_time.setter
+    def end_time(self, end_time: datetime) -> None:
+        with _lock:
+            if self.execution is None:
+                self._end_time = end_time
+            else:
+                self.execution.metadata.end_time = end_time
+
+    @property
+    def error(self) -> "NodeError | None":
+        execution = self.execution
+        return self._error if execution is None else execution.error
+
+    @error.setter
+    def error(self, error: "NodeError") -> None:
+        with _lock:
+            if self.execution is None:
+                self._error = error
+            else:
+                self.execution.error = error
+
+    @property
+    def process_time(self) -> timedelta | None:
+        execution = self.execution
+        if execution is not None:
+            return execution.metadata.process_time
+        if self._start_time and self._end_time:
+            return self._end_time - self._start_time
+        return None
+
+    @property
+    def cache_hit(self) -> bool:
+        execution = self.execution
+        return execution is not None and execution.metadata.cache_hit
+
+
+class ExecutionHistory(Sequence["NodeExecution"]):
+    """Read-only snapshot of a node's attempts that builds each execution model only when it is read.
+
+    The workflow output keeps one per node, so finishing a node never materializes its records;
+    serializing the output or indexing the history does.
+    """
+
+    __slots__ = ("_records", "_factory")
+
+    def __init__(self, records: Sequence[AttemptRecord], factory: "Callable[[], NodeExecution]") -> None:
+        self._records = tuple(records)
+        self._factory = factory
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index):  # type: ignore[no-untyped-def]
+        if isinstance(index, slice):
+            return [record.materialize(self._factory) for record in self._records[index]]
+        return self._records[index].materialize(self._factory)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -0,0 +1,83 @@
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class NodeResources(BaseModel):
+    cpu: Annotated[float, Field(ge=0, description="CPU cores reserved while the node runs.")] = 0
+    memory_mb: Annotated[int, Field(ge=0, description="Memory reserved while the node runs, in MB.")] = 0
+    pools: Annotated[dict[str, int], Field(description="Slots reserved from named pools, e.g. {'db': 1}.")] = {}
+
+
+class ResourceCapacity(BaseModel):
+    cpu: Annotated[float | None, Field(ge=0, description="Total CPU cores available; unlimited when unset.")] = None
+    memory_mb: Annotated[int | None, Field(ge=0, description="Total memory available in MB; unlimited when unset.")] = None
+    pools: Annotated[dict[str, int], Field(description="Size of each named pool; pools not listed are unlimited.")] = {}
+
+
+class ResourceBudget:
+    """Thread-safe accounting of resources held by running nodes against a capacity.
+
+    A budget can be shared by several concurrent runs; listeners are notified whenever
+    resources are released so waiting schedulers can retry admission.
+    """
+
+    def __init__(self, capacity: ResourceCapacity) -> None:
+        self._capacity = capacity
+        self._cpu = 0.0
+        self._memory_mb = 0
+        self._pools: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def capacity(self) -> ResourceCapacity:
+        return self._capacity
+
+    def fits(self, resources: NodeResources) -> bool:
+        return self._fits(resources, cpu=0.0, memory_mb=0, pools={})
+
+    def try_acquire(self, resources: NodeResources) -> bool:
+        with self._lock:
+            if not self._fits(resources, cpu=self._cpu, memory_mb=self._memory_mb, pools=self._pools):
+                return False
+            self._cpu += resources.cpu
+            self._memory_mb += resources.memory_mb
+            for pool, slots in resources.pools.items():
+                self._pools[pool] += slots
+            return True
+
+    def release(self, resources: NodeResources) -> None:
+        with self._lock:
+            self._cpu -= resources.cpu
+            self._memory_mb -= resources.memory_mb
+            for pool, slots in resources.pools.items():
+                self._pools[pool] -= slots
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            listener()
+
+    def subscribe(self, listener: Callable[[], None]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[], None]) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _fits(self, resources: NodeResources, cpu: float, memory_mb: int, pools: dict[str, int]) -> bool:
+        capacity = self._capacity
+        if capacity.cpu is not None and cpu + resources.cpu > capacity.cpu:
+            return False
+        if capacity.memory_mb is not None and memory_mb + resources.memory_mb > capacity.memory_mb:
+            return False
+        for pool, slots in resources.pools.items():
+            size = capacity.pools.get(pool)
+            if size is not None and pools.get(pool, 0) + slots > size:
+                return False
+        return True
@@ -0,0 +1,45 @@
+import random
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from fluxly.core.exceptions import WorkflowException
+from fluxly.core.status import StatusCodes
+
+RetryMatcher = type[Exception] | StatusCodes
+
+
+class RetryPolicy(BaseModel):
+    """Which failures are retried and how long to wait before each retry.
+
+    The delay starts at the owner's ``retry_delay_seconds`` and is multiplied by
+    ``backoff_factor`` after every failed attempt, capped at ``max_delay_seconds``. With
+    ``jitter``, up to that fraction of the delay is randomly shaved off so that retries
+    of many nodes do not fire at once.
+    """
+
+    backoff_factor: Annotated[float, Field(ge=1, description="Multiplier applied to the delay after each failed attempt.")] = 1
+    max_delay_seconds: Annotated[float | None, Field(ge=0, description="Upper bound of the delay between attempts.")] = None
+    jitter: Annotated[float, Field(ge=0, le=1, description="Fraction of the delay that is randomized.")] = 0
+    retry_on: Annotated[list[RetryMatcher], Field(description="Retry only failures matching these exception types or statuses; all failures when empty.")] = []
+    no_retry_on: Annotated[list[RetryMatcher], Field(description="Never retry failures matching these exception types or statuses.")] = []
+
+    def is_retryable(self, error: Exception) -> bool:
+        if any(self._matches(error, matcher) for matcher in self.no_retry_on):
+            return False
+        return not self.retry_on or any(self._matches(error, matcher) for matcher in self.retry_on)
+
+    def delay_seconds(self, base_delay: float, retry_number: int) -> float:
+        delay = base_delay * self.backoff_factor ** max(retry_number - 1, 0)
+        if self.max_delay_seconds is not None:
+            delay = min(delay, self.max_delay_seconds)
+        if self.jitter:
+            delay *= 1 - self.jitter * random.random()
+        return delay
+
+    @staticmethod
+    def _matches(error: Exception, matcher: RetryMatcher) -> bool:
+        if isinstance(matcher, StatusCodes):
+            status = error.exit_code if isinstance(error, WorkflowException) else StatusCodes.FAILED
+            return status == matcher
+        return isinstance(error, matcher)
@@ -0,0 +1,10 @@
+from fluxly.core.spill.config import SpillConfig
+from fluxly.core.spill.handle import SpilledValue
+from fluxly.core.spill.store import OutputSpiller, estimate_size
+
+__all__ = [
+    "SpillConfig",
+    "SpilledValue",
+    "OutputSpiller",
+    "estimate_size",
+]
@@ -0,0 +1,11 @@
+import os
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from fluxly.core.utils.consts import DEFAULT_SPILL_DIR, ENV_PREFIX
+
+
+class SpillConfig(BaseModel):
+    directory: Annotated[str, Field(description="Directory holding node output fields spilled to disk.")] = os.environ.get(f"{ENV_PREFIX}SPILL_DIR", DEFAULT_SPILL_DIR)
+    threshold_mb: Annotated[float, Field(ge=0, description="Estimated output size above which the largest fields are spilled, in MB.")] = 64
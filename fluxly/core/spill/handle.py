@@ -0,0 +1,50 @@
+import os
+import pickle
+import weakref
+from pathlib import Path
+from typing import Any
+
+
+def _remove(path: Path) -> None:
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+class SpilledValue:
+    """Handle to an output field written to the spill directory.
+
+    ``kind`` selects how the file is read back: ``bytes``/``bytearray`` straight from the raw
+    file into a single buffer, ``ndarray`` as a NumPy memmap, anything else with pickle. The file is removed
+    once the handle is garbage collected in the process that wrote it; copies shipped to
+    other processes only read it.
+    """
+
+    def __init__(self, path: Path, kind: str, summary: str) -> None:
+        self.path = path
+        self.kind = kind
+        self.summary = summary
+        self._finalizer: weakref.finalize | None = weakref.finalize(self, _remove, path)
+
+    def load(self) -> Any:
+        if self.kind == "bytes":
+            return self.path.read_bytes()
+        if self.kind == "bytearray":
+            with open(self.path, "rb") as file:
+                buffer = bytearray(os.fstat(file.fileno()).st_size)
+                file.readinto(buffer)
+                return buffer
+        if self.kind == "ndarray":
+            import numpy
+
+            return numpy.load(self.path, mmap_mode="r", allow_pickle=False)
+        with open(self.path, "rb") as file:
+            return pickle.load(file)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": self.path, "kind": self.kind, "summary": self.summary}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._finalizer = None
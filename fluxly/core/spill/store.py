@@ -0,0 +1,99 @@
+import itertools
+import pickle
+import sys
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from fluxly.core.node.output import NodeOutput, describe_value
+from fluxly.core.spill.config import SpillConfig
+from fluxly.core.spill.handle import SpilledValue
+
+_SAMPLE_SIZE = 64
+_MAX_DEPTH = 3
+
+
+def estimate_size(value: Any, depth: int = 0) -> int:
+    """Rough in-memory size of ``value`` in bytes; large containers are sampled."""
+    if isinstance(value, bytes | bytearray | str):
+        return len(value)
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(value)
+    if depth >= _MAX_DEPTH:
+        return size
+    if isinstance(value, BaseModel):
+        return size + sum(estimate_size(item, depth + 1) for item in value.__dict__.values())
+    if isinstance(value, dict):
+        items = [*itertools.chain.from_iterable(itertools.islice(value.items(), _SAMPLE_SIZE))]
+        count = len(value) * 2
+    elif isinstance(value, list | tuple | set | frozenset):
+        items = list(itertools.islice(value, _SAMPLE_SIZE))
+        count = len(value)
+    else:
+        return size
+    if not items:
+        return size
+    return size + sum(estimate_size(item, depth + 1) for item in items) * count // len(items)
+
+
+def _is_ndarray(value: Any) -> bool:
+    cls = type(value)
+    return cls.__module__ == "numpy" and cls.__name__ == "ndarray" and not value.dtype.hasobject
+
+
+class OutputSpiller:
+    """Moves the largest fields of big node outputs to files in the spill directory.
+
+    Fields are spilled, largest first, until the estimated size of what stays in memory is
+    under ``threshold_mb``. Each spilled field is replaced by a ``SpilledValue`` that the
+    output loads back on first access.
+    """
+
+    def __init__(self, config: SpillConfig) -> None:
+        self._directory = Path(config.directory).expanduser()
+        self._threshold_bytes = int(config.threshold_mb * 1024 * 1024)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def spill(self, output: NodeOutput, label: str) -> list[str]:
+        sizes = {
+            name: estimate_size(output.__dict__[name])
+            for name in type(output).model_fields
+            if name in output.__dict__
+        }
+        total = sum(sizes.values())
+        spilled: list[str] = []
+        for name, size in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+            if total <= self._threshold_bytes:
+                break
+            output._spill_field(name, self._write(output.__dict__[name], f"{label}-{name}"))
+            total -= size
+            spilled.append(name)
+        return spilled
+
+    def _write(self, value: Any, label: str) -> SpilledValue:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        stem = self._directory / f"{label}-{uuid4().hex}"
+        summary = describe_value(value)
+        if isinstance(value, bytes | bytearray) and value:
+            path = stem.with_suffix(".bin")
+            path.write_bytes(value)
+            return SpilledValue(path, type(value).__name__, summary)
+        if _is_ndarray(value):
+            import numpy
+
+            path = stem.with_suffix(".npy")
+            numpy.save(path, value, allow_pickle=False)
+            return SpilledValue(path, "ndarray", summary)
+
+        path = stem.with_suffix(".pkl")
+        with open(path, "wb") as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        return SpilledValue(path, "pickle", summary)
@@ -8,6 +8,7 @@ class StatusCodes(Enum):
 
     WAITING = 21
     IN_PROGRESS = 22
+    SKIPPED = 23
 
     NO_VERDICT = 41
     PARTIAL_VERDICT = 42
@@ -1,5 +1,10 @@
+import os
+import tempfile
 from typing import Final
 
 ENV_PREFIX: Final[str] = "FLUXLY_"
 PACKAGE_NAME: Final[str] = "fluxly"
 PACKAGE_VERSION: Final[str] = "1.0.0"
+DEFAULT_MAX_WORKERS: Final[int] = min(32, (os.cpu_count() or 1) + 4)
+DEFAULT_CACHE_DIR: Final[str] = os.path.join("~", ".cache", PACKAGE_NAME)
+DEFAULT_SPILL_DIR: Final[str] = os.path.join(tempfile.gettempdir(), f"{PACKAGE_NAME}-spill")
@@ -0,0 +1,38 @@
+import copy
+import enum
+from collections.abc import Callable
+from functools import cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, bytes, tuple, frozenset, enum.Enum)
+
+
+@cache
+def _private_defaults(cls: type[BaseModel], shared: frozenset[str]) -> tuple[dict[str, Any], tuple[tuple[str, Callable[[], Any]], ...]]:
+    static: dict[str, Any] = {}
+    factories: list[tuple[str, Callable[[], Any]]] = []
+    for name, attr in cls.__private_attributes__.items():
+        if name in shared:
+            continue
+        if attr.default_factory is not None:
+            factories.append((name, attr.default_factory))
+        elif isinstance(attr.default, _IMMUTABLE_DEFAULTS):
+            static[name] = attr.default
+        else:
+            factories.append((name, lambda default=attr.default: copy.deepcopy(default)))
+    return static, tuple(factories)
+
+
+def copy_with_fresh_private_state(model: M, shared: frozenset[str]) -> M:
+    """Shallow copy of ``model`` whose private attributes, except ``shared``, are reset to their defaults."""
+    clone = model.model_copy()
+    static, factories = _private_defaults(type(model), shared)
+    private = clone.__pydantic_private__
+    private.update(static)
+    for name, factory in factories:
+        private[name] = factory()
+    return clone
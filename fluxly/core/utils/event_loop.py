@@ -0,0 +1,33 @@
+import asyncio
+import threading
+
+
+class EventLoopThread:
+    """An asyncio event loop running forever on a dedicated daemon thread."""
+
+    def __init__(self, name: str = "fluxly-event-loop") -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=name, daemon=True)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def start(self) -> "EventLoopThread":
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5) -> None:
+        async def _cancel_pending() -> None:
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_pending(), self._loop).result(timeout=timeout)
+        except TimeoutError:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -3,12 +3,18 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from fluxly.core.workflow.exceptions import NodesNotFoundException
+    from fluxly.core.workflow.analysis import GraphAnalysis
+    from fluxly.core.workflow.exceptions import (
+        NodesNotFoundException,
+        WorkflowCompiledException,
+    )
     from fluxly.core.workflow.execution import WorkflowExecution
     from fluxly.core.workflow.graph import WorkflowGraph
     from fluxly.core.workflow.input import WorkflowInput
     from fluxly.core.workflow.metadata import WorkflowMetadata
+    from fluxly.core.workflow.models import DurationSource, SchedulingPolicy
     from fluxly.core.workflow.output import WorkflowOutput
+    from fluxly.core.workflow.plan import ExecutionPlan
     from fluxly.core.workflow.workflow import Workflow
 
 __all__ = [
@@ -19,6 +25,11 @@ __all__ = [
     "WorkflowMetadata",
     "WorkflowExecution",
     "NodesNotFoundException",
+    "WorkflowCompiledException",
+    "SchedulingPolicy",
+    "ExecutionPlan",
+    "GraphAnalysis",
+    "DurationSource",
 ]
 
 
@@ -44,5 +55,20 @@ def __getattr__(name: str):
     if name == "NodesNotFoundException":
         from fluxly.core.workflow.exceptions import NodesNotFoundException
         return NodesNotFoundException
+    if name == "WorkflowCompiledException":
+        from fluxly.core.workflow.exceptions import WorkflowCompiledException
+        return WorkflowCompiledException
+    if name == "ExecutionPlan":
+        from fluxly.core.workflow.plan import ExecutionPlan
+        return ExecutionPlan
+    if name == "SchedulingPolicy":
+        from fluxly.core.workflow.models import SchedulingPolicy
+        return SchedulingPolicy
+    if name == "GraphAnalysis":
+        from fluxly.core.workflow.analysis import GraphAnalysis
+        return GraphAnalysis
+    if name == "DurationSource":
+        from fluxly.core.workflow.models import DurationSource
+        return DurationSource
 
     raise AttributeError(f"module 'fluxly.core.workflow' has no attribute '{name}'")
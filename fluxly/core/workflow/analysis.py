@@ -0,0 +1,173 @@
+import heapq
+from collections.abc import Mapping
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from fluxly.core.node.node import Node
+from fluxly.core.workflow.graph import WorkflowGraph
+from fluxly.core.workflow.models import DurationSource
+from fluxly.core.workflow.plan import ExecutionPlan
+from fluxly.core.workflow.priority import (
+    DurationHistory,
+    critical_path_ranks,
+    estimate_node_duration,
+    recorded_node_duration,
+)
+
+
+class GraphAnalysis(BaseModel):
+    node_count: Annotated[int, Field(description="Number of nodes.")]
+    edge_count: Annotated[int, Field(description="Number of edges.")]
+    depth: Annotated[int, Field(description="Number of nodes on the longest path, ignoring durations.")]
+    max_width: Annotated[int, Field(description="Size of the largest set of nodes with no path between any two of them.")]
+    duration_source: Annotated[DurationSource | None, Field(description="Where node durations came from; None when given explicitly.")]
+    critical_path: Annotated[list[str], Field(description="Longest path through the graph, weighted by node durations.")]
+    critical_path_length: Annotated[float, Field(description="Total duration of the critical path.")]
+    total_work: Annotated[float, Field(description="Sum of all node durations.")]
+    max_speedup: Annotated[float, Field(description="Upper bound on the speedup over a serial run: total work over the critical path length.")]
+    max_workers: Annotated[int | None, Field(description="Worker count the makespan was estimated for.")] = None
+    makespan: Annotated[float | None, Field(description="Estimated duration of a run with `max_workers` workers.")] = None
+
+    def __str__(self) -> str:
+        lines = [
+            f"Nodes: {self.node_count}",
+            f"Edges: {self.edge_count}",
+            f"Depth: {self.depth}",
+            f"Max width: {self.max_width}",
+            f"Durations: {self.duration_source.value if self.duration_source else 'explicit'}",
+            f"Critical path ({self.critical_path_length:g}): {' -> '.join(self.critical_path)}",
+            f"Total work: {self.total_work:g}",
+            f"Max speedup: {self.max_speedup:.2f}x",
+        ]
+        if self.makespan is not None:
+            lines.append(f"Makespan with {self.max_workers} workers: {self.makespan:g}")
+        return "\n".join(lines)
+
+
+def node_durations(
+    nodes: Mapping[str, Node],
+    source: DurationSource,
+    history: DurationHistory | None = None,
+) -> dict[str, float]:
+    """Duration of every node according to ``source``.
+
+    ``TIMEOUT`` uses the declared ``timeout_seconds``. ``HISTORY`` uses the workflow's duration
+    history, then the node's own completed attempts (for example restored from a checkpoint).
+    Both fall back to ``estimate_node_duration`` for nodes that have neither.
+    """
+    if source == DurationSource.UNIT:
+        return dict.fromkeys(nodes, 1.0)
+    if source == DurationSource.TIMEOUT:
+        return {name: float(node.timeout_seconds or estimate_node_duration(node)) for name, node in nodes.items()}
+    durations: dict[str, float] = {}
+    for name, node in nodes.items():
+        recorded = history.mean(name) if history is not None else None
+        if recorded is None:
+            recorded = recorded_node_duration(node)
+        durations[name] = recorded if recorded is not None else estimate_node_duration(node)
+    return durations
+
+
+def analyze_graph(
+    graph: WorkflowGraph,
+    plan: ExecutionPlan,
+    durations: DurationSource | str | Mapping[str, float] = DurationSource.UNIT,
+    max_workers: int | None = None,
+    history: DurationHistory | None = None,
+) -> GraphAnalysis:
+    """Static shape of ``graph`` and, for ``max_workers``, a list-scheduling estimate of the run's makespan.
+
+    The estimate assumes every node needs a worker for its whole duration and that every condition
+    passes; streaming edges, async nodes and resource budgets are not modelled.
+    """
+    source = DurationSource(durations) if isinstance(durations, str) else None
+    weights = node_durations(graph.nodes, source, history) if source is not None else dict(durations)
+    ranks = critical_path_ranks(graph, weights, order=plan.names)
+
+    critical_path: list[str] = []
+    candidates = [i for i, parents in enumerate(plan.parents) if not parents]
+    while candidates:
+        best = max(candidates, key=lambda i: ranks[plan.names[i]])
+        critical_path.append(plan.names[best])
+        candidates = list(plan.children[best])
+
+    total_work = sum(weights[name] for name in plan.names)
+    critical_path_length = ranks[critical_path[0]] if critical_path else 0.0
+    return GraphAnalysis(
+        node_count=len(plan.names),
+        edge_count=sum(len(children) for children in plan.children),
+        depth=len(plan.levels),
+        max_width=_max_antichain_width(plan),
+        duration_source=source,
+        critical_path=critical_path,
+        critical_path_length=critical_path_length,
+        total_work=total_work,
+        max_speedup=total_work / critical_path_length if critical_path_length else 1.0,
+        max_workers=max_workers,
+        makespan=_list_schedule_makespan(plan, weights, ranks, max_workers) if max_workers else None,
+    )
+
+
+def _max_antichain_width(plan: ExecutionPlan) -> int:
+    # Dilworth: the widest antichain is as large as the smallest chain cover, which is the
+    # node count minus a maximum matching between each node and the nodes it reaches.
+    reach = [0] * len(plan.names)
+    for i in reversed(range(len(plan.names))):
+        for child in plan.children[i]:
+            reach[i] |= 1 << child | reach[child]
+
+    matched_to = [-1] * len(plan.names)
+    matching = sum(_augment(i, reach, matched_to) for i in range(len(plan.names)))
+    return len(plan.names) - matching
+
+
+def _augment(root: int, reach: list[int], matched_to: list[int]) -> bool:
+    """Look for an augmenting path from ``root`` with an iterative depth-first search over bitsets."""
+    visited = 0
+    stack = [[root, reach[root]]]
+    path: list[int] = []
+    while stack:
+        frame = stack[-1]
+        candidates = frame[1] & ~visited
+        if not candidates:
+            stack.pop()
+            if path:
+                path.pop()
+            continue
+        bit = candidates & -candidates
+        visited |= bit
+        frame[1] = candidates ^ bit
+        target = bit.bit_length() - 1
+        path.append(target)
+        if matched_to[target] < 0:
+            for (source, _), reached in zip(stack, path, strict=True):
+                matched_to[reached] = source
+            return True
+        stack.append([matched_to[target], reach[matched_to[target]]])
+    return False
+
+
+def _list_schedule_makespan(
+    plan: ExecutionPlan,
+    durations: Mapping[str, float],
+    ranks: Mapping[str, float],
+    max_workers: int,
+) -> float:
+    # Mirrors the critical-path scheduling policy: whenever a worker is free, the ready node
+    # with the longest remaining path starts next.
+    pending = [len(parents) for parents in plan.parents]
+    ready = [(-ranks[plan.names[i]], i) for i, count in enumerate(pending) if count == 0]
+    heapq.heapify(ready)
+    running: list[tuple[float, int]] = []
+    now = 0.0
+    while ready or running:
+        while ready and len(running) < max_workers:
+            _, i = heapq.heappop(ready)
+            heapq.heappush(running, (now + durations[plan.names[i]], i))
+        now, i = heapq.heappop(running)
+        for child in plan.children[i]:
+            pending[child] -= 1
+            if pending[child] == 0:
+                heapq.heappush(ready, (-ranks[plan.names[child]], child))
+    return now
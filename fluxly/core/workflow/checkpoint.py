@@ -0,0 +1,101 @@
+import os
+import pickle
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from fluxly.core.node.node import Node
+from fluxly.core.node.record import AttemptRecord
+from fluxly.core.status import StatusCodes
+from fluxly.core.workflow.exceptions import CheckpointNotFoundException
+
+MANIFEST_FILE_NAME = "manifest.json"
+NODES_DIR_NAME = "nodes"
+
+
+class RunManifest(BaseModel):
+    workflow_name: Annotated[str, Field(description="Name of the checkpointed workflow.")]
+    run_id: Annotated[str, Field(description="Run ID of the checkpointed run.")]
+    created_at: Annotated[datetime, Field(description="When the run directory was created.")]
+    nodes: Annotated[list[str], Field(description="Nodes of the workflow when the run started.")] = []
+
+
+class RunCheckpoint:
+    """Run directory holding a manifest and the executions of every completed node.
+
+    Each node is written to ``nodes/<name>.pkl`` as soon as it completes, through a temporary
+    file and an atomic rename, so a crash never leaves a partially written checkpoint. Executions
+    are pickled, like cached and spilled outputs, so they come back as the same values.
+    """
+
+    def __init__(self, run_dir: Path, manifest: RunManifest) -> None:
+        self._run_dir = run_dir
+        self._manifest = manifest
+
+    @property
+    def run_dir(self) -> Path:
+        return self._run_dir
+
+    @property
+    def manifest(self) -> RunManifest:
+        return self._manifest
+
+    @classmethod
+    def create(cls, run_dir: str | Path, workflow_name: str, run_id: str, nodes: Iterable[str]) -> "RunCheckpoint":
+        run_dir = Path(run_dir).expanduser()
+        (run_dir / NODES_DIR_NAME).mkdir(parents=True, exist_ok=True)
+        manifest = RunManifest(workflow_name=workflow_name, run_id=run_id, created_at=datetime.now(), nodes=list(nodes))
+        _write_atomic(run_dir / MANIFEST_FILE_NAME, manifest.model_dump_json(indent=2).encode())
+        return cls(run_dir, manifest)
+
+    @classmethod
+    def open(cls, run_dir: str | Path, workflow_name: str) -> "RunCheckpoint":
+        run_dir = Path(run_dir).expanduser()
+        manifest_path = run_dir / MANIFEST_FILE_NAME
+        if not manifest_path.is_file():
+            raise CheckpointNotFoundException(f"No checkpoint manifest found in {run_dir}")
+
+        manifest = RunManifest.model_validate_json(manifest_path.read_text())
+        if manifest.workflow_name != workflow_name:
+            raise CheckpointNotFoundException(
+                f"Checkpoint in {run_dir} belongs to workflow {manifest.workflow_name}, not {workflow_name}"
+            )
+        (run_dir / NODES_DIR_NAME).mkdir(exist_ok=True)
+        return cls(run_dir, manifest)
+
+    def save_node(self, node: Node) -> None:
+        _write_atomic(self._node_path(node.name), pickle.dumps(list(node.executions)))
+
+    def discard_node(self, name: str) -> None:
+        """Remove the checkpoint of a node, so a resumed run executes it again."""
+        self._node_path(name).unlink(missing_ok=True)
+
+    def restore(self, nodes: Iterable[Node]) -> list[str]:
+        """Reload executions of nodes whose checkpoint ends in a completed execution."""
+        restored: list[str] = []
+        for node in nodes:
+            path = self._node_path(node.name)
+            if not path.is_file():
+                continue
+
+            try:
+                executions = pickle.loads(path.read_bytes())
+            except (pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+                continue
+
+            if executions and executions[-1].status == StatusCodes.COMPLETED:
+                node._records = [AttemptRecord.of(execution) for execution in executions]
+                restored.append(node.name)
+        return restored
+
+    def _node_path(self, name: str) -> Path:
+        return self._run_dir / NODES_DIR_NAME / f"{name}.pkl"
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
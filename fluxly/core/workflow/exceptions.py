@@ -8,3 +8,23 @@ class NodesNotFoundException(WorkflowException):
 
 class UnsupportedGraphScenario(WorkflowException):
     exit_code = StatusCodes.PREREQUISITE_FAIL
+
+
+class InsufficientResourcesException(WorkflowException):
+    exit_code = StatusCodes.PREREQUISITE_FAIL
+
+
+class CheckpointNotFoundException(WorkflowException):
+    exit_code = StatusCodes.PREREQUISITE_FAIL
+
+
+class InvalidNodeSelectionException(WorkflowException):
+    exit_code = StatusCodes.PREREQUISITE_FAIL
+
+
+class StreamAbortedException(WorkflowException):
+    exit_code = StatusCodes.PREREQUISITE_FAIL
+
+
+class WorkflowCompiledException(WorkflowException):
+    exit_code = StatusCodes.PREREQUISITE_FAIL
@@ -1,10 +1,11 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from graphlib import CycleError, TopologicalSorter
 
 from pydantic import BaseModel, Field, PrivateAttr
 
 from fluxly.core.node.node import Node
 from fluxly.core.status import StatusCodes
+from fluxly.core.workflow.exceptions import WorkflowCompiledException
 
 
 class Edge(BaseModel):
@@ -12,15 +13,30 @@ class Edge(BaseModel):
     destination: str = Field(...)
     condition: Callable[[], bool] | None = None
     condition_passed: bool | None = None
+    requires_source_completed: bool = False
+    streaming: bool = False
+    max_buffered_batches: int = Field(default=8, gt=0)
+
+    @property
+    def conditional(self) -> bool:
+        """Whether the edge has a condition to check; the scheduler records its result in ``condition_passed``."""
+        return self.condition is not None or self.requires_source_completed
 
     def evaluate_condition(self) -> bool:
         self.condition_passed = True if self.condition is None else bool(self.condition())
         return self.condition_passed
 
 
+EdgeSpec = tuple[Node, Node] | tuple[Node, Node, Callable[[], bool] | None]
+
+
 class WorkflowGraph(BaseModel):
     edges: list[Edge] = Field(default_factory=list)
     _nodes: dict[str, Node] = PrivateAttr(default_factory=dict)
+    _parents: dict[str, list[str]] = PrivateAttr(default_factory=dict)
+    _children: dict[str, list[str]] = PrivateAttr(default_factory=dict)
+    _edge_index: dict[tuple[str, str], Edge] = PrivateAttr(default_factory=dict)
+    _frozen: bool = PrivateAttr(default=False)
 
     @property
     def nodes(self) -> dict[str, Node]:
@@ -28,22 +44,95 @@ class WorkflowGraph(BaseModel):
         return self._nodes
 
     def get_parents(self, node: Node) -> list[Node]:
-        return [self._nodes[edge.source] for edge in self.edges if edge.destination == node.name]
+        return [self._nodes[name] for name in self._parents.get(node.name, ())]
 
     def get_children(self, node: Node) -> list[Node]:
-        return [self._nodes[edge.destination] for edge in self.edges if edge.source == node.name]
+        return [self._nodes[name] for name in self._children.get(node.name, ())]
+
+    def topological_order(self) -> list[str]:
+        sorter: TopologicalSorter[str] = TopologicalSorter({name: self._parents[name] for name in self._nodes})
+        return list(sorter.static_order())
+
+    def get_ancestors(self, names: Iterable[str]) -> set[str]:
+        return self._reachable(names, self._parents)
+
+    def get_descendants(self, names: Iterable[str]) -> set[str]:
+        return self._reachable(names, self._children)
+
+    def select_nodes(
+        self,
+        only: Iterable[str] = (),
+        from_nodes: Iterable[str] = (),
+        until: Iterable[str] = (),
+    ) -> set[str]:
+        """Names of the nodes matching every given criterion; all nodes when none is given.
+
+        ``from_nodes`` selects the nodes and their descendants, ``until`` the nodes and their
+        ancestors, and ``only`` exactly the given nodes.
+        """
+        only, from_nodes, until = list(only), list(from_nodes), list(until)
+        unknown = sorted({*only, *from_nodes, *until} - self._nodes.keys())
+        if unknown:
+            raise ValueError(f"Unknown nodes in selection: {unknown}")
+
+        selected = set(self._nodes)
+        if only:
+            selected &= set(only)
+        if from_nodes:
+            selected &= self.get_descendants(from_nodes) | set(from_nodes)
+        if until:
+            selected &= self.get_ancestors(until) | set(until)
+        return selected
+
+    def _reachable(self, names: Iterable[str], adjacency: dict[str, list[str]]) -> set[str]:
+        seen: set[str] = set()
+        stack = [neighbour for name in names for neighbour in adjacency[name]]
+        while stack:
+            name = stack.pop()
+            if name not in seen:
+                seen.add(name)
+                stack.extend(adjacency[name])
+        return seen
+
+    def get_in_degrees(self) -> dict[str, int]:
+        return {name: len(self._parents[name]) for name in self._nodes}
+
+    def freeze(self) -> None:
+        """Reject any further node or edge; called when the workflow is compiled."""
+        self._frozen = True
+
+    def _validate_mutable(self) -> None:
+        if self._frozen:
+            raise WorkflowCompiledException("The workflow is compiled; its graph can no longer be modified")
 
     def add_node(self, node: Node) -> None:
+        self._validate_mutable()
         if node.name in self._nodes:
             raise ValueError(f"Node '{node.name}' already exists.")
         self._nodes[node.name] = node
+        self._parents[node.name] = []
+        self._children[node.name] = []
+
+    def add_nodes_from(self, nodes: Iterable[Node]) -> None:
+        self._validate_mutable()
+        nodes = list(nodes)
+        seen: set[str] = set()
+        duplicates: set[str] = set()
+        for node in nodes:
+            if node.name in seen or node.name in self._nodes:
+                duplicates.add(node.name)
+            seen.add(node.name)
+        if duplicates:
+            raise ValueError(f"Nodes already exist: {sorted(duplicates)}")
+        for node in nodes:
+            self.add_node(node)
 
     def add_edge(self, source_node: Node, dest_node: Node) -> Edge:
         self._validate_nodes(source_node, dest_node)
         self._validate_no_duplicate_edge(source_node, dest_node)
         edge = Edge(source=source_node.name, destination=dest_node.name)
         self._validate_acyclic(edge)
-        self.edges.append(edge)
+        self._insert_edge(edge)
         return edge
 
     def add_conditional_edge(self, source_node: Node, dest_node: Node, condition: Callable[[], bool]) -> Edge:
@@ -51,71 +140,163 @@ class WorkflowGraph(BaseModel):
         self._validate_no_duplicate_edge(source_node, dest_node)
         edge = Edge(source=source_node.name, destination=dest_node.name, condition=condition)
         self._validate_acyclic(edge)
-        self.edges.append(edge)
+        self._insert_edge(edge)
         return edge
 
-    def add_edge_if_source_completed(self, source_node: Node, dest_node: Node) -> Edge:
+    def add_streaming_edge(self, source_node: Node, dest_node: Node, max_buffered_batches: int = 8) -> Edge:
         self._validate_nodes(source_node, dest_node)
         self._validate_no_duplicate_edge(source_node, dest_node)
+        if self._parents[dest_node.name]:
+            raise ValueError(f"Streaming consumer '{dest_node.name}' cannot have other incoming edges.")
+        edge = Edge(
+            source=source_node.name,
+            destination=dest_node.name,
+            streaming=True,
+            max_buffered_batches=max_buffered_batches,
+        )
+        self._validate_acyclic(edge)
+        self._insert_edge(edge)
+        return edge
 
-        def condition() -> bool:
-            return source_node.attempt > 0 and source_node.last_execution.status == StatusCodes.COMPLETED
+    def add_edge_if_source_completed(self, source_node: Node, dest_node: Node) -> Edge:
+        self._validate_nodes(source_node, dest_node)
+        self._validate_no_duplicate_edge(source_node, dest_node)
 
-        edge = Edge(source=source_node.name, destination=dest_node.name, condition=condition)
+        edge = Edge(source=source_node.name, destination=dest_node.name, requires_source_completed=True)
         self._validate_acyclic(edge)
-        self.edges.append(edge)
+        self._insert_edge(edge)
         return edge
 
+    def add_edges_from(self, edges: Iterable[EdgeSpec]) -> list[Edge]:
+        self._validate_mutable()
+        new_edges: list[Edge] = []
+        seen: set[tuple[str, str]] = set()
+        for source_node, dest_node, *condition in edges:
+            self._validate_nodes(source_node, dest_node)
+            self._validate_no_duplicate_edge(source_node, dest_node)
+            key = (source_node.name, dest_node.name)
+            if key in seen:
+                raise ValueError(f"Edge '{key[0]}' → '{key[1]}' is listed more than once.")
+            seen.add(key)
+            new_edges.append(Edge(source=key[0], destination=key[1], condition=condition[0] if condition else None))
+
+        self._validate_acyclic_batch(new_edges)
+        for edge in new_edges:
+            self._insert_edge(edge)
+        return new_edges
+
     def get_edge(self, source: Node, destination: Node) -> Edge | None:
-        return next(
-            (edge for edge in self.edges if edge.source == source.name and edge.destination == destination.name),
-            None,
-        )
+        return self._edge_index.get((source.name, destination.name))
+
+    def streaming_edges(self) -> list[Edge]:
+        return [edge for edge in self.edges if edge.streaming]
+
+    def is_streaming_consumer(self, name: str) -> bool:
+        parents = self._parents.get(name, ())
+        return len(parents) == 1 and self._edge_index[(parents[0], name)].streaming
+
+    def _insert_edge(self, edge: Edge) -> None:
+        self.edges.append(edge)
+        self._edge_index[(edge.source, edge.destination)] = edge
+        self._children[edge.source].append(edge.destination)
+        self._parents[edge.destination].append(edge.source)
 
     def _validate_nodes(self, source_node: Node, dest_node: Node) -> None:
+        self._validate_mutable()
         if source_node.name not in self.nodes or dest_node.name not in self.nodes:
             raise ValueError("Both source and destination nodes must exist in the graph.")
         if source_node.name == dest_node.name:
             raise ValueError("Cannot create self-loop edges.")
+        if self.is_streaming_consumer(dest_node.name):
+            raise ValueError(f"Streaming consumer '{dest_node.name}' cannot have other incoming edges.")
 
     def _validate_acyclic(self, new_edge: Edge) -> None:
-        sorter = TopologicalSorter()
+        # The new edge closes a cycle only if its source is already reachable from its destination.
+        stack = [new_edge.destination]
+        visited = {new_edge.destination}
+        while stack:
+            current = stack.pop()
+            if current == new_edge.source:
+                raise ValueError(f"edge {new_edge.source} → {new_edge.destination} creates a cycle.")
+            for child in self._children[current]:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append(child)
 
-        for e in self.edges:
-            sorter.add(e.destination, e.source)
+    def _validate_acyclic_batch(self, new_edges: list[Edge]) -> None:
+        sorter: TopologicalSorter[str] = TopologicalSorter()
 
-        sorter.add(new_edge.destination, new_edge.source)
+        for e in [*self.edges, *new_edges]:
+            sorter.add(e.destination, e.source)
 
         try:
-            list(sorter.static_order())
-        except CycleError:
-            raise ValueError(f"edge {new_edge.source} → {new_edge.destination} creates a cycle.")
+            sorter.prepare()
+        except CycleError as e:
+            cycle = " → ".join(e.args[1])
+            raise ValueError(f"edges create a cycle: {cycle}.")
 
     def _edge_exists(self, source: str, destination: str) -> bool:
-        return any(e.source == source and e.destination == destination for e in self.edges)
+        return (source, destination) in self._edge_index
 
     def _validate_no_duplicate_edge(self, source_node: Node, dest_node: Node) -> None:
         if self._edge_exists(source_node.name, dest_node.name):
             raise ValueError(f"Edge '{source_node.name}' → '{dest_node.name}' already exists.")
 
     def can_node_run(self, node: Node, completed: set[Node]) -> bool:
-        if node.name in completed:
+        if node in completed:
             return False
 
-        parents = self.get_parents(node)
+        parents = self._parents.get(node.name, ())
 
         if not parents:
             return True
 
         completed_names = {n.name for n in completed}
+        if any(parent not in completed_names for parent in parents):
+            return False
 
-        for parent in parents:
-            if parent.name not in completed_names:
-                return False
+        return self.incoming_conditions_pass(node)
 
-            edge = self.get_edge(parent, node)
-            if edge is not None and edge.condition is not None:
-                if not edge.condition():
-                    return False
+    def incoming_conditions_pass(self, node: Node) -> bool:
+        for parent in self._parents.get(node.name, ()):
+            if not self.edge_passes(self._edge_index[(parent, node.name)]):
+                return False
 
         return True
+
+    def edge_passes(self, edge: Edge) -> bool:
+        if edge.requires_source_completed and not self._completed(edge.source):
+            return False
+        return edge.condition is None or bool(edge.condition())
+
+    def _completed(self, name: str) -> bool:
+        # Looked up by name, so the edge follows whichever node copy the graph holds for the run.
+        node = self._nodes[name]
+        return node.attempt > 0 and node._last_record.status == StatusCodes.COMPLETED
+
+    def _for_run(self) -> "WorkflowGraph":
+        """Graph for a new workflow run.
+
+        Nodes are copied, and so are conditional edges, whose ``condition_passed`` the scheduler
+        writes for each run. Edges without a condition, edge conditions and node settings are shared
+        as they are. Once the graph is frozen nothing else changes, so the edge list, edge index and
+        adjacency lists are shared too; those of a graph that can still change are copied.
+        """
+        copies = {id(node): node._copy_for_run() for node in self._nodes.values()}
+        for node in copies.values():
+            node._rebind_nodes(copies)
+        frozen = self._frozen
+        conditional = [i for i, edge in enumerate(self.edges) if edge.conditional]
+        edges = self.edges if frozen and not conditional else list(self.edges)
+        edge_index = self._edge_index if frozen and not conditional else dict(self._edge_index)
+        for i in conditional:
+            edge = edges[i] = edges[i].model_copy()
+            edge_index[(edge.source, edge.destination)] = edge
+
+        graph = self.model_copy(update={"edges": edges})
+        graph._nodes = {name: copies[id(node)] for name, node in self._nodes.items()}
+        graph._edge_index = edge_index
+        if not frozen:
+            graph._parents = {name: list(parents) for name, parents in self._parents.items()}
+            graph._children = {name: list(children) for name, children in self._children.items()}
+        return graph
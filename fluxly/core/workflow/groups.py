@@ -0,0 +1,35 @@
+from fluxly.core.workflow.plan import ExecutionPlan
+
+
+class ExecutionGroupIndex:
+    """Tracks which execution groups are still alive during one workflow attempt.
+
+    A group dies as soon as one of its members fails. A node still matters while any group
+    containing it, or containing one of its descendants, is alive; once that count drops to
+    zero the node is reported as pruned. Without explicit groups every node forms one group.
+    Group membership comes from the bitsets of the compiled plan.
+    """
+
+    def __init__(self, plan: ExecutionPlan) -> None:
+        self._plan = plan
+        self._live_counts = [mask.bit_count() for mask in plan.relevance_masks]
+        self._all_groups = (1 << plan.group_count) - 1
+        self._dead = 0
+
+    def all_dead(self) -> bool:
+        return self._dead == self._all_groups
+
+    def mark_failed(self, name: str) -> list[str]:
+        """Kill the groups containing ``name``; returns the nodes that no longer matter."""
+        plan = self._plan
+        newly_dead = plan.group_masks[plan.index(name)] & ~self._dead
+        self._dead |= newly_dead
+        pruned: list[str] = []
+        for group in range(plan.group_count):
+            if not newly_dead >> group & 1:
+                continue
+            for dependent in plan.group_dependents(group):
+                self._live_counts[dependent] -= 1
+                if self._live_counts[dependent] == 0:
+                    pruned.append(plan.names[dependent])
+        return pruned
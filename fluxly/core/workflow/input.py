@@ -4,11 +4,18 @@ from pydantic import BaseModel, Field
 
 
 class WorkflowInput(BaseModel):
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "populate_by_name": True}
     verbose: Annotated[bool, Field(description="Print more details for debug")] = True
     timeout_seconds: Annotated[int | None, Field(default=None, gt=0, description="Timeout for the workflow in seconds.")] = None
     max_retries: Annotated[int, Field(ge=0, description="Maximum number of run attempts allowed in case of failure.")] = 0
     retry_delay_seconds: Annotated[int, Field(ge=0, description="Delay between retries in seconds.")] = 0
+    resume_on_retry: Annotated[bool, Field(description="On workflow retries, reuse nodes that succeeded in earlier attempts and rerun only failed, skipped and downstream nodes.")] = False
+    checkpoint_dir: Annotated[str | None, Field(default=None, description="Directory where completed nodes are checkpointed, in a subdirectory per run ID.")] = None
+    resume: Annotated[str | None, Field(default=None, description="Run directory of an earlier run to resume; its completed nodes are reloaded and only the rest runs.")] = None
+    only: Annotated[list[str], Field(description="Run only these nodes.")] = []
+    from_nodes: Annotated[list[str], Field(alias="from", description="Run these nodes and everything downstream of them.")] = []
+    until: Annotated[list[str], Field(description="Run these nodes and everything upstream of them.")] = []
+    max_workers: Annotated[int | None, Field(default=None, gt=0, description="Maximum number of nodes executed concurrently.")] = None
     auto_generate_md: Annotated[bool, Field(description="Automatically generate markdown file for the workflow input documentation")] = False
     md_file_path: Annotated[str, Field(description="Path to save the generated markdown file.")] = "workflow_documentation.md"
     diagram_file_path: Annotated[str, Field(description="Path to save the generated workflow graph diagram image (png).")] = "workflow_diagram.png"
@@ -4,3 +4,14 @@ from enum import Enum
 class EndpointType(str, Enum):
     CLI = "cli"
     API = "api"
+
+
+class SchedulingPolicy(str, Enum):
+    FIFO = "fifo"
+    CRITICAL_PATH = "critical_path"
+
+
+class DurationSource(str, Enum):
+    UNIT = "unit"
+    TIMEOUT = "timeout"
+    HISTORY = "history"
@@ -1,15 +1,60 @@
-from typing import Annotated
+from collections.abc import Sequence
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, SerializeAsAny
+from pydantic import (
+    BaseModel,
+    Field,
+    SerializeAsAny,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+)
 
 from fluxly.core.node.execution import NodeExecution
+from fluxly.core.status import StatusCodes
+
+
+class EdgeConditionResult(BaseModel):
+    source: Annotated[str, Field(description="Source node of the conditional edge")]
+    destination: Annotated[str, Field(description="Destination node of the conditional edge")]
+    passed: Annotated[bool, Field(description="Result of the condition, evaluated once when the source was done")]
 
 
 class WorkflowOutput(BaseModel):
     node_to_executions: Annotated[
-        dict[str, list[SerializeAsAny[NodeExecution]]],
+        dict[str, Sequence[SerializeAsAny[NodeExecution]]],
         Field(description="Mapping of node name to all its executions"),
     ] = {}
+    reused_nodes: Annotated[
+        list[str],
+        Field(description="Nodes whose successful execution from an earlier attempt was reused instead of running again"),
+    ] = []
+    skipped_nodes: Annotated[
+        list[str],
+        Field(
+            description="Nodes that never started, because a condition on the way to them did not pass or because "
+            "every execution group they could contribute to had failed"
+        ),
+    ] = []
+    unsaved_checkpoints: Annotated[
+        list[str],
+        Field(description="Nodes that completed but could not be checkpointed; a resumed run executes them again"),
+    ] = []
+    edge_conditions: Annotated[
+        list[EdgeConditionResult],
+        Field(description="Conditional edges evaluated during the attempt, in evaluation order"),
+    ] = []
+
+    @field_serializer("node_to_executions", mode="wrap")
+    def _serialize_executions(self, value: dict[str, Sequence[NodeExecution]], handler: SerializerFunctionWrapHandler) -> Any:
+        # The scheduler stores lazy histories; build the execution models only now.
+        return handler({name: list(executions) for name, executions in value.items()})
+
+    def node_status(self, name: str) -> StatusCodes:
+        """``SKIPPED`` for a node that never started, otherwise the status of its last execution."""
+        if name in self.skipped_nodes:
+            return StatusCodes.SKIPPED
+        executions = self.node_to_executions.get(name)
+        return executions[-1].status if executions else StatusCodes.WAITING
 
     def __str__(self) -> str:
         return self.model_dump_json(indent=2)
@@ -0,0 +1,86 @@
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from fluxly.core.workflow.graph import WorkflowGraph
+
+
+class ExecutionPlan(BaseModel):
+    """Immutable scheduling view of a workflow graph, compiled once and shared by every run.
+
+    Nodes get dense indices in topological order; adjacency and levels refer to those indices.
+    Execution groups are int bitsets: bit ``g`` of ``group_masks[i]`` is set when node ``i``
+    belongs to group ``g``, and of ``relevance_masks[i]`` when the group contains the node or
+    one of its descendants.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    names: Annotated[tuple[str, ...], Field(description="Node names in topological order; the position is the node index.")]
+    parents: Annotated[tuple[tuple[int, ...], ...], Field(description="Parent indices of each node.")]
+    children: Annotated[tuple[tuple[int, ...], ...], Field(description="Child indices of each node.")]
+    levels: Annotated[tuple[tuple[int, ...], ...], Field(description="Node indices by topological level; a node sits one level below its deepest parent.")]
+    conditional_parents: Annotated[tuple[tuple[int, ...], ...], Field(description="Parents of each node whose edge has a condition to check.")]
+    conditional_children: Annotated[tuple[tuple[int, ...], ...], Field(description="Children of each node whose edge has a condition to check.")]
+    streaming_consumers: Annotated[frozenset[str], Field(description="Destinations of streaming edges.")]
+    group_count: Annotated[int, Field(description="Number of execution groups; a single implicit group without explicit ones.")]
+    group_masks: Annotated[tuple[int, ...], Field(description="Bitset of the groups containing each node.")]
+    relevance_masks: Annotated[tuple[int, ...], Field(description="Bitset of the groups containing each node or one of its descendants.")]
+
+    _index: dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: object) -> None:
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def compile(cls, graph: WorkflowGraph, groups: list[set[str]]) -> "ExecutionPlan":
+        names = graph.topological_order()
+        index = {name: i for i, name in enumerate(names)}
+        parents = [tuple(index[parent] for parent in graph._parents[name]) for name in names]
+        children = [tuple(index[child] for child in graph._children[name]) for name in names]
+
+        depth: list[int] = []
+        for node_parents in parents:
+            depth.append(max((depth[p] + 1 for p in node_parents), default=0))
+        levels: list[list[int]] = [[] for _ in range(max(depth, default=-1) + 1)]
+        for i, level in enumerate(depth):
+            levels[level].append(i)
+
+        groups = groups or [set(names)]
+        group_masks = [0] * len(names)
+        for bit, group in enumerate(groups):
+            for name in group:
+                group_masks[index[name]] |= 1 << bit
+        relevance_masks = list(group_masks)
+        for i in reversed(range(len(names))):
+            for child in children[i]:
+                relevance_masks[i] |= relevance_masks[child]
+
+        conditional_parents = [
+            tuple(p for p in parents[i] if graph._edge_index[(names[p], name)].conditional)
+            for i, name in enumerate(names)
+        ]
+        conditional_children: list[list[int]] = [[] for _ in names]
+        for i, node_parents in enumerate(conditional_parents):
+            for parent in node_parents:
+                conditional_children[parent].append(i)
+        return cls(
+            names=tuple(names),
+            parents=tuple(parents),
+            children=tuple(children),
+            levels=tuple(tuple(level) for level in levels),
+            conditional_parents=tuple(conditional_parents),
+            conditional_children=tuple(tuple(children) for children in conditional_children),
+            streaming_consumers=frozenset(edge.destination for edge in graph.streaming_edges()),
+            group_count=len(groups),
+            group_masks=tuple(group_masks),
+            relevance_masks=tuple(relevance_masks),
+        )
+
+    def index(self, name: str) -> int:
+        return self._index[name]
+
+    def group_dependents(self, group: int) -> list[int]:
+        """Indices of the nodes that matter to ``group``."""
+        bit = 1 << group
+        return [i for i, mask in enumerate(self.relevance_masks) if mask & bit]
@@ -0,0 +1,93 @@
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+from fluxly.core.node.node import Node
+from fluxly.core.status import StatusCodes
+from fluxly.core.workflow.graph import WorkflowGraph
+from fluxly.core.workflow.plan import ExecutionPlan
+
+DEFAULT_NODE_DURATION_SECONDS = 1.0
+
+
+class DurationHistory:
+    """Mean duration of completed attempts per node, shared by a workflow and every run made from it.
+
+    Runs created with ``Workflow.new_run()`` start without node records, so timings only carry over
+    from one run to the next through this object. It also keeps the critical-path ranks of the last
+    plan it ranked, and rebuilds them only once new timings have arrived.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: dict[str, tuple[float, int]] = {}
+        self._version = 0
+        self._ranks: tuple[ExecutionPlan, int, dict[str, float]] | None = None
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            total, count = self._totals.get(name, (0.0, 0))
+            self._totals[name] = (total + seconds, count + 1)
+            self._version += 1
+
+    def mean(self, name: str) -> float | None:
+        entry = self._totals.get(name)
+        return entry[0] / entry[1] if entry else None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The lock is process-local; a copied history carries its timings and rebuilds its ranks.
+        with self._lock:
+            return {"totals": dict(self._totals)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__()  # type: ignore[misc]
+        self._totals = state["totals"]
+
+    def ranks(self, graph: WorkflowGraph, plan: ExecutionPlan) -> dict[str, float]:
+        cached = self._ranks
+        if cached is not None and cached[0] is plan and cached[1] == self._version:
+            return cached[2]
+        version = self._version
+        durations = {name: estimate_node_duration(node, self) for name, node in graph.nodes.items()}
+        ranks = critical_path_ranks(graph, durations, order=plan.names)
+        self._ranks = (plan, version, ranks)
+        return ranks
+
+
+def recorded_node_duration(node: Node) -> float | None:
+    """Mean duration of the node's own completed attempts, read from its records without building executions."""
+    durations = [
+        record.process_time.total_seconds()
+        for record in node._records
+        if record.status == StatusCodes.COMPLETED and record.process_time is not None and not record.cache_hit
+    ]
+    return sum(durations) / len(durations) if durations else None
+
+
+def estimate_node_duration(node: Node, history: DurationHistory | None = None) -> float:
+    if node.expected_duration_seconds is not None:
+        return node.expected_duration_seconds
+
+    recorded = history.mean(node.name) if history is not None else None
+    if recorded is None:
+        recorded = recorded_node_duration(node)
+    if recorded is not None:
+        return recorded
+
+    return DEFAULT_NODE_DURATION_SECONDS
+
+
+def critical_path_ranks(
+    graph: WorkflowGraph,
+    durations: dict[str, float] | None = None,
+    order: Sequence[str] | None = None,
+) -> dict[str, float]:
+    """Length of the longest weighted path from each node to any sink, the node included."""
+    if durations is None:
+        durations = {name: estimate_node_duration(node) for name, node in graph.nodes.items()}
+
+    ranks: dict[str, float] = {}
+    for name in reversed(order if order is not None else graph.topological_order()):
+        children = graph._children[name]
+        ranks[name] = durations[name] + max((ranks[child] for child in children), default=0.0)
+    return ranks
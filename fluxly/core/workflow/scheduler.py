@@ -0,0 +1,473 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from fluxly.core.cancellation import CancellationToken
+from fluxly.core.exceptions import CancelledException
+from fluxly.core.node.models import ExecutorType
+from fluxly.core.node.node import Node
+from fluxly.core.resources import ResourceBudget
+from fluxly.core.status import StatusCodes
+from fluxly.core.workflow.exceptions import (
+    InsufficientResourcesException,
+    UnsupportedGraphScenario,
+)
+from fluxly.core.workflow.groups import ExecutionGroupIndex
+from fluxly.core.workflow.models import SchedulingPolicy
+from fluxly.core.workflow.output import EdgeConditionResult
+from fluxly.core.workflow.plan import ExecutionPlan
+from fluxly.core.workflow.stream import BatchStream
+from fluxly.core.workflow.worker_pool import WorkerPool
+
+if TYPE_CHECKING:
+    from fluxly.core.workflow.workflow import Workflow
+
+
+class WorkflowScheduler:
+    """Event-driven scheduler for a single workflow execution attempt.
+
+    Workers report back through a completion queue; the scheduler blocks on it and only
+    decrements the pending-parent counters of the node that just finished. A node becomes
+    ready once its counter reaches zero and its incoming edge conditions pass. Ready nodes
+    wait in a priority queue until the worker pool has a free slot; async nodes do not occupy
+    a worker and are started right away on the workflow's event loop.
+
+    Ready nodes are ordered by their ``priority`` field, then (under the critical-path policy)
+    by the weighted length of their longest downstream path, then by readiness order. When a
+    resource budget is set, a node is only admitted once its declared resources fit; nodes
+    that do not fit yet are skipped over in favour of ones that do.
+
+    Once every execution group a node matters to is dead, the node is skipped if it has not
+    started yet, or cancelled if it is running.
+
+    Conditional edges are evaluated once, when their source is done. A condition that does not
+    pass makes its destination unreachable: it is skipped right away together with its whole
+    subtree, since every node waits on all of its parents.
+
+    A failed attempt that may be retried frees its worker and resources: the node waits on a
+    timer heap and is queued as ready again once its backoff delay has elapsed.
+
+    ``reused_nodes`` (closed under ancestors) count as already completed: their recorded
+    executions are kept and only their children's counters are released. With a
+    ``selection``, nodes outside of it are never started.
+
+    The consumer of a streaming edge becomes ready as soon as its producer starts, and runs
+    on a thread of its own so it can never be starved of a worker by the producer it is
+    waiting on. Each streaming edge gets a fresh ``BatchStream`` per attempt, which is closed
+    with the producer's error (if any) once the producer finishes.
+
+    The output of a node with ``transient_output`` is released once all of its children have
+    completed. A child that fails or is skipped may run again later, so it pins the output.
+
+    Cancelling ``cancel_token`` wakes the scheduler, which stops dispatching and raises
+    ``CancelledException``; running nodes observe the same token through their cancel scope.
+    Whenever the attempt aborts, nodes still running are cancelled and get their
+    ``cancel_grace_seconds`` to report back before the error propagates.
+    """
+
+    def __init__(
+        self,
+        workflow: Workflow,
+        plan: ExecutionPlan,
+        pool: WorkerPool,
+        budget: ResourceBudget | None = None,
+        cancel_token: CancellationToken | None = None,
+        reused_nodes: Iterable[str] = (),
+        selection: set[str] | None = None,
+    ) -> None:
+        self._workflow = workflow
+        self._graph = workflow._graph
+        self._plan = plan
+        # The run's node objects by plan index.
+        self._nodes = [self._graph.nodes[name] for name in plan.names]
+        self._pool = pool
+        self._budget = budget
+        self._cancel_token = cancel_token or CancellationToken()
+        # Node names signal completions; None is a wake-up after resources were released elsewhere.
+        self._completions: queue.Queue[str | None] = queue.Queue()
+        self._ready: list[tuple[int, float, int, Node]] = []
+        self._sequence = itertools.count()
+        self._ranks = (
+            workflow._durations.ranks(self._graph, plan)
+            if workflow.scheduling_policy == SchedulingPolicy.CRITICAL_PATH
+            else {}
+        )
+        self._running: set[str] = set()
+        self._ready_without_worker = 0
+        self._pending_parents = [len(parents) for parents in plan.parents]
+        self._node_errors: dict[str, Exception] = {}
+        self._groups = ExecutionGroupIndex(plan)
+        self._node_scopes: dict[str, CancellationToken] = {}
+        self._finished: set[str] = set()
+        self._skipped: set[str] = set()
+        self._reused = list(reused_nodes)
+        self._selection = selection
+        self._started: set[str] = set()
+        self._retry_delays: dict[str, float] = {}
+        # Conditional edges belong to the run; results of an earlier attempt are evaluated again.
+        for source, children in enumerate(plan.conditional_children):
+            for child in children:
+                self._graph._edge_index[(plan.names[source], plan.names[child])].condition_passed = None
+        self._backoff: list[tuple[float, int, Node]] = []
+        self._stream_consumers = plan.streaming_consumers
+        self._consumers_left = {
+            name: len(children)
+            for name, children, node in zip(plan.names, plan.children, self._nodes, strict=True)
+            if children and node.transient_output
+        }
+
+    def run(self) -> None:
+        self._validate_resources()
+        self._validate_streams()
+        if self._budget is not None:
+            self._budget.subscribe(self._wake_up)
+        unregister = self._cancel_token.add_callback(self._wake_up)
+        self._open_streams()
+        try:
+            self._run()
+        except BaseException:
+            self._stop_running()
+            raise
+        finally:
+            unregister()
+            if self._budget is not None:
+                self._budget.unsubscribe(self._wake_up)
+            for node in self._graph.nodes.values():
+                node._set_streams({}, [])
+
+    def _run(self) -> None:
+        self._reuse_completed()
+        self._enqueue_ready(
+            node for node, count in zip(self._nodes, self._pending_parents, strict=True)
+            if count == 0 and node.name not in self._finished
+        )
+        self._dispatch()
+
+        while self._running or self._ready or self._backoff:
+            try:
+                name = self._completions.get(timeout=self._backoff_timeout())
+            except queue.Empty:
+                name = None
+            if self._cancel_token.cancelled:
+                raise CancelledException("Workflow execution was cancelled")
+            if name is not None:
+                node = self._finish(name)
+                if node is not None:
+                    self._enqueue_ready(self._release_children(node))
+            self._requeue_due_retries()
+            self._dispatch()
+
+    def _stop_running(self) -> None:
+        """Cancel the nodes still running when the attempt aborts, and give them their grace period to stop."""
+        for name in self._running:
+            self._node_scopes[name].cancel()
+        grace = max((self._graph.nodes[name].cancel_grace_seconds for name in self._running), default=0)
+        deadline = time.monotonic() + grace
+        output = self._workflow.current_execution.output
+        while self._running:
+            try:
+                name = self._completions.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                return
+            if name in self._running:
+                self._running.discard(name)
+                output.node_to_executions[name] = self._graph.nodes[name]._execution_history()
+
+    def _backoff_timeout(self) -> float | None:
+        if not self._backoff:
+            return None
+        return max(self._backoff[0][0] - time.monotonic(), 0)
+
+    def _requeue_due_retries(self) -> None:
+        now = time.monotonic()
+        while self._backoff and self._backoff[0][0] <= now:
+            self._push_ready(heapq.heappop(self._backoff)[-1])
+
+    def _reuse_completed(self) -> None:
+        output = self._workflow.current_execution.output
+        for name in self._reused:
+            node = self._graph.nodes[name]
+            self._finished.add(name)
+            output.node_to_executions[name] = node._execution_history()
+            output.reused_nodes.append(name)
+            for child in self._plan.children[self._plan.index(name)]:
+                self._pending_parents[child] -= 1
+            self._consumed(node)
+        # Only once every reused node is finished, so a condition can never skip one of them.
+        for name in self._reused:
+            self._evaluate_conditions(self._graph.nodes[name])
+
+    def _validate_resources(self) -> None:
+        if self._budget is None:
+            return
+        oversized = sorted(n.name for n in self._graph.nodes.values() if not self._budget.fits(n.resources))
+        if oversized:
+            raise InsufficientResourcesException(f"Nodes require more resources than the capacity allows: {oversized}")
+
+    def _validate_streams(self) -> None:
+        nodes = self._graph.nodes
+        invalid = sorted({
+            name
+            for edge in self._graph.streaming_edges()
+            for name in (edge.source, edge.destination)
+            if nodes[name].is_async
+            or nodes[name].cache
+            or nodes[name].max_retries > 1
+            or self._workflow._resolve_executor(nodes[name]) != ExecutorType.THREAD
+        })
+        if invalid:
+            raise UnsupportedGraphScenario(
+                f"Nodes on streaming edges must be synchronous thread nodes without retries or caching: {invalid}"
+            )
+
+    def _open_streams(self) -> None:
+        nodes = self._graph.nodes
+        inputs: dict[str, dict[str, BatchStream]] = {}
+        outputs: dict[str, list[BatchStream]] = {}
+        for edge in self._graph.streaming_edges():
+            stream = BatchStream(edge.source, edge.destination, edge.max_buffered_batches)
+            if self._selection is not None and edge.destination not in self._selection:
+                stream.detach()
+            inputs.setdefault(edge.destination, {})[edge.source] = stream
+            outputs.setdefault(edge.source, []).append(stream)
+        for name in inputs.keys() | outputs.keys():
+            nodes[name]._set_streams(inputs.get(name, {}), outputs.get(name, []))
+
+    def _needs_worker(self, node: Node) -> bool:
+        return not node.is_async and node.name not in self._stream_consumers
+
+    def _wake_up(self) -> None:
+        self._completions.put(None)
+
+    def _children(self, node: Node) -> list[Node]:
+        return [self._nodes[child] for child in self._plan.children[self._plan.index(node.name)]]
+
+    def _release_children(self, node: Node, streaming: bool = False) -> Iterator[Node]:
+        for index in self._plan.children[self._plan.index(node.name)]:
+            child = self._nodes[index]
+            if (child.name in self._stream_consumers) != streaming:
+                continue
+            self._pending_parents[index] -= 1
+            if self._pending_parents[index] == 0:
+                yield child
+
+    def _enqueue_ready(self, candidates: Iterable[Node]) -> None:
+        for node in candidates:
+            if node.name in self._skipped or (self._selection is not None and node.name not in self._selection):
+                continue
+            if not self._conditions_pass(node):
+                self._skip_subtree(self._plan.index(node.name))
+                continue
+            self._push_ready(node)
+
+    def _conditions_pass(self, node: Node) -> bool:
+        index = self._plan.index(node.name)
+        return all(self._edge_passed(parent, index) for parent in self._plan.conditional_parents[index])
+
+    def _evaluate_conditions(self, node: Node) -> None:
+        """Evaluate the conditional edges leaving ``node`` now that it is done, for children that may still run."""
+        plan = self._plan
+        source = plan.index(node.name)
+        for child in plan.conditional_children[source]:
+            name = plan.names[child]
+            if name in self._finished or name in self._skipped or (self._selection is not None and name not in self._selection):
+                continue
+            if not self._edge_passed(source, child):
+                self._skip_subtree(child)
+
+    def _edge_passed(self, source: int, destination: int) -> bool:
+        names = self._plan.names
+        edge = self._graph._edge_index[(names[source], names[destination])]
+        if edge.condition_passed is None:
+            edge.condition_passed = self._graph.edge_passes(edge)
+            self._workflow.current_execution.output.edge_conditions.append(
+                EdgeConditionResult(source=edge.source, destination=edge.destination, passed=edge.condition_passed)
+            )
+        return edge.condition_passed
+
+    def _push_ready(self, node: Node) -> None:
+        if not self._needs_worker(node):
+            self._ready_without_worker += 1
+        rank = self._ranks.get(node.name, 0.0)
+        heapq.heappush(self._ready, (-node.priority, -rank, next(self._sequence), node))
+
+    def _dispatch(self) -> None:
+        deferred: list[tuple[int, float, int, Node]] = []
+        while self._ready and (self._pool.available or self._ready_without_worker):
+            item = heapq.heappop(self._ready)
+            node = item[-1]
+            needs_worker = self._needs_worker(node)
+            if needs_worker and not self._pool.try_reserve():
+                deferred.append(item)
+                continue
+            if not self._acquire(node):
+                if needs_worker:
+                    self._pool.release()
+                deferred.append(item)
+                continue
+            if not needs_worker:
+                self._ready_without_worker -= 1
+            self._start(node)
+
+        for item in deferred:
+            heapq.heappush(self._ready, item)
+
+    def _acquire(self, node: Node) -> bool:
+        return self._budget is None or self._budget.try_acquire(node.resources)
+
+    def _release(self, node: Node) -> None:
+        if self._budget is not None:
+            self._budget.release(node.resources)
+
+    def _start(self, node: Node) -> None:
+        if any(child.name in self._running for child in self._children(node)):
+            raise UnsupportedGraphScenario("Attempted to start a node while one of its children is running")
+
+        first_attempt = node.name not in self._started
+        self._started.add(node.name)
+        self._running.add(node.name)
+        self._node_scopes[node.name] = self._cancel_token.child()
+        if node.is_async:
+            asyncio.run_coroutine_threadsafe(self._run_node_async(node, first_attempt), self._workflow._event_loop)
+        elif node.name in self._stream_consumers:
+            threading.Thread(target=self._run_node, args=(node, first_attempt), name=f"fluxly-stream-{node.name}", daemon=True).start()
+        else:
+            self._pool.submit(lambda: self._run_node(node, first_attempt))
+
+        if first_attempt:
+            self._enqueue_ready(self._release_children(node, streaming=True))
+
+    def _run_node(self, node: Node, first_attempt: bool) -> None:
+        try:
+            delay = self._workflow.run_node(node, cancel_scope=self._node_scopes[node.name], first_attempt=first_attempt)
+            if delay is not None:
+                self._retry_delays[node.name] = delay
+        except Exception as e:  # noqa: BLE001 - we intentionally capture to decide at workflow level
+            self._node_errors[node.name] = e
+        finally:
+            self._end_streams(node)
+            self._release(node)
+            self._completions.put(node.name)
+
+    def _end_streams(self, node: Node) -> None:
+        error = self._node_errors.get(node.name)
+        for stream in node._output_streams:
+            stream.close(error)
+        for stream in node._input_streams.values():
+            stream.detach()
+
+    async def _run_node_async(self, node: Node, first_attempt: bool) -> None:
+        try:
+            delay = await self._workflow.run_node_async(
+                node, cancel_scope=self._node_scopes[node.name], first_attempt=first_attempt
+            )
+            if delay is not None:
+                self._retry_delays[node.name] = delay
+        except Exception as e:  # noqa: BLE001 - we intentionally capture to decide at workflow level
+            self._node_errors[node.name] = e
+        finally:
+            self._release(node)
+            self._completions.put(node.name)
+
+    def _finish(self, name: str) -> Node | None:
+        """Record a finished attempt; returns the node once it is done for good."""
+        self._running.discard(name)
+        self._node_scopes.pop(name, None)
+        node = self._graph.nodes[name]
+        if self._needs_worker(node):
+            self._pool.release()
+
+        delay = self._retry_delays.pop(name, None)
+        if delay is not None:
+            heapq.heappush(self._backoff, (time.monotonic() + delay, next(self._sequence), node))
+            return None
+
+        self._finished.add(name)
+        workflow = self._workflow
+        workflow.current_execution.output.node_to_executions[name] = node._execution_history()
+        workflow._log_node_summary(node)
+
+        record = node._last_record
+        error = self._node_errors.get(name)
+        if error is not None and record.status == StatusCodes.COMPLETED:
+            # The node ran, but spilling its output failed afterwards.
+            workflow._logger.error(f"Saving the output of {name} failed: {error}")
+            raise error
+        if record.status == StatusCodes.COMPLETED and not record.cache_hit and record.process_time is not None:
+            workflow._durations.record(name, record.process_time.total_seconds())
+
+        self._consumed(node)
+        self._release_if_consumed(name)
+        self._evaluate_conditions(node)
+
+        if record.status != StatusCodes.COMPLETED:
+            pruned = self._groups.mark_failed(name)
+            if self._groups.all_dead():
+                raise self._node_errors.get(name) or Exception(
+                    str(record.error) if record.error else f"Node {name} failed"
+                )
+            self._prune(pruned)
+        return node
+
+    def _consumed(self, node: Node) -> None:
+        completed = node._last_record.status == StatusCodes.COMPLETED
+        plan = self._plan
+        for parent in plan.parents[plan.index(node.name)]:
+            name = plan.names[parent]
+            if name not in self._consumers_left:
+                continue
+            if not completed:
+                del self._consumers_left[name]
+                continue
+            self._consumers_left[name] -= 1
+            self._release_if_consumed(name)
+
+    def _release_if_consumed(self, name: str) -> None:
+        if self._consumers_left.get(name) == 0 and name in self._finished:
+            del self._consumers_left[name]
+            self._graph.nodes[name]._release_output()
+
+    def _prune(self, names: list[str]) -> None:
+        output = self._workflow.current_execution.output
+        for name in names:
+            if name in self._running:
+                self._node_scopes[name].cancel()
+            elif name in self._started and name not in self._finished:
+                # Waiting to retry: give up on it with the failure it already has.
+                self._backoff = [item for item in self._backoff if item[-1].name != name]
+                heapq.heapify(self._backoff)
+                self._finished.add(name)
+                output.node_to_executions[name] = self._graph.nodes[name]._execution_history()
+            elif name not in self._finished and name not in self._skipped:
+                self._skip(name)
+
+        if any(item[-1].name in self._skipped for item in self._ready):
+            self._ready = [item for item in self._ready if item[-1].name not in self._skipped]
+            heapq.heapify(self._ready)
+            self._ready_without_worker = sum(1 for item in self._ready if not self._needs_worker(item[-1]))
+
+    def _skip_subtree(self, index: int) -> None:
+        """Skip an unreachable node and every descendant that was waiting on it."""
+        plan = self._plan
+        pending = [index]
+        while pending:
+            i = pending.pop()
+            name = plan.names[i]
+            if name in self._skipped or name in self._started or name in self._finished:
+                continue
+            if self._selection is None or name in self._selection:
+                self._skip(name)
+            pending.extend(plan.children[i])
+
+    def _skip(self, name: str) -> None:
+        self._skipped.add(name)
+        self._workflow.current_execution.output.skipped_nodes.append(name)
+        for stream in self._graph.nodes[name]._input_streams.values():
+            stream.detach()
@@ -0,0 +1,77 @@
+import threading
+from collections import deque
+from collections.abc import Iterator
+from typing import Any
+
+from fluxly.core.cancellation import CancellationToken
+from fluxly.core.workflow.exceptions import StreamAbortedException
+
+
+class BatchStream:
+    """Bounded buffer of batches flowing over one streaming edge during a run.
+
+    The producer blocks in ``put`` while ``max_batches`` batches are waiting, so a slow
+    consumer throttles it. ``close`` ends the stream, with the producer's error if it
+    failed. Once the consumer is done, ``detach`` drops the buffer and any later batches.
+    Both sides wake up as soon as their cancellation token is cancelled.
+    """
+
+    def __init__(self, producer: str, consumer: str, max_batches: int) -> None:
+        self.producer = producer
+        self.consumer = consumer
+        self._max_batches = max_batches
+        self._batches: deque[Any] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._error: Exception | None = None
+        self._detached = False
+        self.batches_sent = 0
+
+    def put(self, batch: Any, token: CancellationToken) -> None:
+        unregister = token.add_callback(self._wake_up)
+        try:
+            with self._condition:
+                while len(self._batches) >= self._max_batches and not self._detached and not token.cancelled:
+                    self._condition.wait()
+                token.raise_if_cancelled()
+                if self._detached:
+                    return
+                self._batches.append(batch)
+                self.batches_sent += 1
+                self._condition.notify_all()
+        finally:
+            unregister()
+
+    def iterate(self, token: CancellationToken) -> Iterator[Any]:
+        while True:
+            unregister = token.add_callback(self._wake_up)
+            try:
+                with self._condition:
+                    while not self._batches and not self._closed and not token.cancelled:
+                        self._condition.wait()
+                    token.raise_if_cancelled()
+                    if not self._batches:
+                        if self._error is not None:
+                            raise StreamAbortedException(f"Producer {self.producer} failed: {self._error}")
+                        return
+                    batch = self._batches.popleft()
+                    self._condition.notify_all()
+            finally:
+                unregister()
+            yield batch
+
+    def close(self, error: Exception | None = None) -> None:
+        with self._condition:
+            self._closed = True
+            self._error = error
+            self._condition.notify_all()
+
+    def detach(self) -> None:
+        with self._condition:
+            self._detached = True
+            self._batches.clear()
+            self._condition.notify_all()
+
+    def _wake_up(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
@@ -13,9 +13,10 @@ def build_cli_command_from_workflow_input(workflow_input: WorkflowInput, endpoin
         if value is None or (isinstance(value, str) and not value.strip()) or str(value) == str(default):
             continue
 
-        flag = f"--{field_name.replace('_', '-')}"
+        cli_name = (field.alias or field_name).replace('_', '-')
+        flag = f"--{cli_name}"
         if isinstance(value, bool):
-            flags.append(flag if value else f"--no-{field_name.replace('_', '-')}")
+            flags.append(flag if value else f"--no-{cli_name}")
         elif isinstance(value, list):
             for item in value:
                 flags.append(f"{flag} {item}")
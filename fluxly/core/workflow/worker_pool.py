@@ -0,0 +1,68 @@
+import queue
+import threading
+from collections.abc import Callable
+
+
+class WorkerPool:
+    """Bounded pool of reusable daemon worker threads.
+
+    Threads are spawned lazily up to ``max_workers`` and kept alive between tasks, so the
+    same worker serves many nodes (and node attempts) over the course of a run. Callers
+    reserve a slot before submitting: the scheduler for each node, and map nodes for the
+    extra shards they run beside their own worker.
+    """
+
+    def __init__(self, max_workers: int, name: str = "fluxly-worker") -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self._max_workers = max_workers
+        self._name = name
+        self._tasks: queue.SimpleQueue[Callable[[], None] | None] = queue.SimpleQueue()
+        self._threads: list[threading.Thread] = []
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._reserved = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def available(self) -> int:
+        return self._max_workers - self._reserved
+
+    def try_reserve(self, count: int = 1) -> int:
+        """Reserve up to ``count`` free slots without blocking; returns how many were reserved."""
+        with self._lock:
+            granted = max(0, min(count, self._max_workers - self._reserved))
+            self._reserved += granted
+            return granted
+
+    def release(self, count: int = 1) -> None:
+        with self._lock:
+            self._reserved -= count
+
+    def submit(self, task: Callable[[], None]) -> None:
+        self._tasks.put(task)
+        if self._idle.acquire(blocking=False):
+            return
+
+        with self._lock:
+            if len(self._threads) < self._max_workers:
+                thread = threading.Thread(target=self._work, name=f"{self._name}-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for _ in self._threads:
+                self._tasks.put(None)
+            self._threads.clear()
+
+    def _work(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            task()
+            self._idle.release()
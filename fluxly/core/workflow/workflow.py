@@ -1,29 +1,56 @@
+import asyncio
+import pickle
 import sys
 import threading
-import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 from datetime import datetime
+from pathlib import Path
 from typing import Annotated
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, PrivateAttr, SerializeAsAny
 
+from fluxly.core.cache import (
+    CacheConfig,
+    ResultCache,
+    compute_cache_key,
+    upstream_digest,
+)
+from fluxly.core.cancellation import CancellationToken
 from fluxly.core.docs_generator.generator import generate_workflow_documentation
 from fluxly.core.exceptions import TimeoutException, WorkflowException
+from fluxly.core.node.models import ExecutorType
 from fluxly.core.node.node import Node
+from fluxly.core.node.process_pool import ProcessWorkerPool
+from fluxly.core.resources import ResourceBudget, ResourceCapacity
+from fluxly.core.retry import RetryPolicy
+from fluxly.core.spill import OutputSpiller, SpillConfig
 from fluxly.core.status import StatusCodes
+from fluxly.core.utils.consts import DEFAULT_MAX_WORKERS
+from fluxly.core.utils.copying import copy_with_fresh_private_state
+from fluxly.core.utils.event_loop import EventLoopThread
+from fluxly.core.workflow.analysis import GraphAnalysis, analyze_graph
+from fluxly.core.workflow.checkpoint import RunCheckpoint
 from fluxly.core.workflow.exceptions import (
+    InvalidNodeSelectionException,
     NodesNotFoundException,
-    UnsupportedGraphScenario,
+    WorkflowCompiledException,
 )
 from fluxly.core.workflow.execution import WorkflowExecution
-from fluxly.core.workflow.graph import WorkflowGraph
+from fluxly.core.workflow.graph import EdgeSpec, WorkflowGraph
 from fluxly.core.workflow.input import WorkflowInput
 from fluxly.core.workflow.metadata import WorkflowMetadata
-from fluxly.core.workflow.models import EndpointType
+from fluxly.core.workflow.models import DurationSource, EndpointType, SchedulingPolicy
+from fluxly.core.workflow.plan import ExecutionPlan
+from fluxly.core.workflow.priority import DurationHistory
+from fluxly.core.workflow.scheduler import WorkflowScheduler
 from fluxly.core.workflow.utils import build_cli_command_from_workflow_input
+from fluxly.core.workflow.worker_pool import WorkerPool
 from fluxly.services import LoggerConfig, LoggerService
 
+# Definition kept by ``Workflow.new_run``; every other private attribute is run state.
+_SHARED_PRIVATE_ATTRIBUTES = frozenset({"_id", "_logger", "_execution_groups", "_graph", "_plan", "_durations"})
+
 
 class Workflow(BaseModel):
     name: Annotated[str, Field(max_length=64, min_length=2, description="The name of the workflow.")]
@@ -33,15 +60,38 @@ class Workflow(BaseModel):
         SerializeAsAny[WorkflowInput] | None,
         Field(description="The workflow inputs."),
     ] = None
+    max_workers: Annotated[int | None, Field(gt=0, description="Maximum number of nodes executed concurrently.")] = None
+    executor: Annotated[ExecutorType, Field(description="Default executor for nodes that do not set their own.")] = ExecutorType.THREAD
+    scheduling_policy: Annotated[SchedulingPolicy, Field(description="Order in which ready nodes start when workers are limited.")] = SchedulingPolicy.CRITICAL_PATH
+    capacity: Annotated[ResourceCapacity | None, Field(description="Resource budget shared by the nodes of a run; unlimited when unset.")] = None
+    retry_policy: Annotated[RetryPolicy, Field(description="Which workflow failures are retried, and the backoff applied to the input's `retry_delay_seconds`.")] = RetryPolicy()
+    cache: Annotated[CacheConfig | None, Field(description="Result cache used by nodes with `cache=True`; defaults to the local user cache directory.")] = None
+    spill: Annotated[SpillConfig | None, Field(description="Spill the largest fields of big node outputs to disk, reloading them on first access; disabled when unset.")] = None
 
     _id: str = PrivateAttr(default_factory=lambda: str(uuid4()))
     _run_id: str | None = PrivateAttr(default=None)
     _executions: list[WorkflowExecution] = PrivateAttr(default_factory=list)
     _graph: WorkflowGraph = PrivateAttr(default_factory=WorkflowGraph)
     _execution_groups: list[set[str]] = PrivateAttr(default_factory=list)
+    _plan: ExecutionPlan | None = PrivateAttr(default=None)
+    _durations: DurationHistory = PrivateAttr(default_factory=DurationHistory)
     _logger: LoggerService = PrivateAttr(default_factory=lambda: LoggerService(config=LoggerConfig()))
     _endpoint_type: EndpointType | None = PrivateAttr(default=None)
     _endpoint_name: str | None = PrivateAttr(default=None)
+    _worker_pool: WorkerPool | None = PrivateAttr(default=None)
+    _process_pool: ProcessWorkerPool | None = PrivateAttr(default=None)
+    _event_loop: asyncio.AbstractEventLoop | None = PrivateAttr(default=None)
+    _event_loop_thread: EventLoopThread | None = PrivateAttr(default=None)
+    _resource_budget: ResourceBudget | None = PrivateAttr(default=None)
+    _run_budget: ResourceBudget | None = PrivateAttr(default=None)
+    _result_cache: ResultCache | None = PrivateAttr(default=None)
+    _spiller: OutputSpiller | None = PrivateAttr(default=None)
+    _checkpoint: RunCheckpoint | None = PrivateAttr(default=None)
+    _restored_from_checkpoint: bool = PrivateAttr(default=False)
+    _selection: set[str] | None = PrivateAttr(default=None)
+    _selection_upstream: set[str] = PrivateAttr(default_factory=set)
+    _cancel_token: CancellationToken = PrivateAttr(default_factory=CancellationToken)
+    _attempt_token: CancellationToken | None = PrivateAttr(default=None)
 
     @property
     def id(self) -> str:
@@ -54,6 +104,13 @@ class Workflow(BaseModel):
     def assign_run_id(self, run_id: str) -> None:
         self._run_id = run_id
 
+    def assign_resource_budget(self, budget: ResourceBudget) -> None:
+        self._resource_budget = budget
+
+    def cancel(self) -> None:
+        """Stop the current run: no new nodes start and running ones are cancelled."""
+        self._cancel_token.cancel()
+
     def assign_trigger(self, endpoint_type: EndpointType, endpoint_name: str) -> None:
         self._endpoint_type = endpoint_type
         self._endpoint_name = endpoint_name
@@ -98,16 +155,27 @@ class Workflow(BaseModel):
     def add_node(self, node: Node) -> None:
         self._graph.add_node(node)
 
+    def add_nodes_from(self, nodes: Iterable[Node]) -> None:
+        self._graph.add_nodes_from(nodes)
+
     def add_edge(self, source_node: Node, dest_node: Node) -> None:
         self._graph.add_edge(source_node, dest_node)
 
+    def add_edges_from(self, edges: Iterable[EdgeSpec]) -> None:
+        self._graph.add_edges_from(edges)
+
     def add_conditional_edge(self, source_node: Node, dest_node: Node, condition: Callable[[], bool]) -> None:
         self._graph.add_conditional_edge(source_node, dest_node, condition)
 
+    def add_streaming_edge(self, source_node: Node, dest_node: Node, max_buffered_batches: int = 8) -> None:
+        self._graph.add_streaming_edge(source_node, dest_node, max_buffered_batches)
+
     def add_edge_if_source_completed(self, source_node: Node, dest_node: Node) -> None:
         self._graph.add_edge_if_source_completed(source_node, dest_node)
 
     def add_execution_group(self, nodes: list[Node]) -> None:
+        if self._plan is not None:
+            raise WorkflowCompiledException("The workflow is compiled; execution groups can no longer be added")
         if not nodes:
             raise ValueError("Execution group must include at least one node.")
 
@@ -124,31 +192,75 @@ class Workflow(BaseModel):
     def get_execution_groups(self) -> list[set[str]]:
         return [group.copy() for group in self._execution_groups]
 
-    def _create_execution(self) -> WorkflowExecution:
-        return WorkflowExecution(id=str(self.attempt + 1))
+    def compile(self) -> ExecutionPlan:
+        """Freeze the graph and execution groups into a plan reused by every later run.
 
-    def _all_execution_groups_dead(self) -> bool:
-        nodes = self._graph.nodes
-        groups = self._execution_groups or [set(nodes.keys())]
+        Adding nodes, edges or execution groups afterwards raises ``WorkflowCompiledException``.
+        Runs of a workflow that was never compiled build a throwaway plan each time.
+        """
+        if self._plan is None:
+            if not self._graph.nodes:
+                raise NodesNotFoundException
+            self._plan = ExecutionPlan.compile(self._graph, self._execution_groups)
+            self._graph.freeze()
+        return self._plan
+
+    def _execution_plan(self) -> ExecutionPlan:
+        return self._plan or ExecutionPlan.compile(self._graph, self._execution_groups)
+
+    def analyze(
+        self,
+        durations: DurationSource | str | Mapping[str, float] = DurationSource.UNIT,
+        max_workers: int | None = None,
+    ) -> GraphAnalysis:
+        """Node and edge counts, depth, width, critical path and maximum speedup of the graph.
+
+        ``durations`` weighs the nodes, either by a ``DurationSource`` or explicitly per node name.
+        With ``max_workers`` the report also estimates the makespan of a run with that many workers.
+        """
+        if not self._graph.nodes:
+            raise NodesNotFoundException
+        return analyze_graph(self._graph, self._execution_plan(), durations, max_workers, history=self._durations)
+
+    def new_run(self) -> "Workflow":
+        """Workflow instance for one run that shares this workflow's definition.
+
+        Fields, node settings, edge conditions and execution groups are shared rather than copied;
+        executions, run id, pools and node attempts start empty, and each run gets its own copy of the
+        edges. References between nodes point at the run's own node copies, but edge conditions are
+        shared as they are, so a condition should not capture nodes.
+        """
+        run = copy_with_fresh_private_state(self, _SHARED_PRIVATE_ATTRIBUTES)
+        run._graph = self._graph._for_run()
+        return run
+
+    def _resolve_max_workers(self) -> int:
+        return self.inputs.max_workers or self.max_workers or DEFAULT_MAX_WORKERS
+
+    def _resolve_executor(self, node: Node) -> ExecutorType:
+        if node.is_async:
+            return ExecutorType.THREAD
+        return node.executor or self.executor
 
-        for group in groups:
-            group_failed = any(
-                (nodes[n].attempt > 0 and nodes[n].last_execution.status != StatusCodes.COMPLETED)
-                for n in group if n in nodes
-            )
-            if not group_failed:
-                return False
+    def _create_execution(self) -> WorkflowExecution:
+        return WorkflowExecution(id=str(self.attempt + 1))
 
-        return True
+    @property
+    def checkpoint_dir(self) -> Path | None:
+        return self._checkpoint.run_dir if self._checkpoint else None
 
     def execute(self) -> None:
+        self._open_checkpoint()
         if not self._run_id:
             self._run_id = str(uuid4())
+        self._cancel_token = CancellationToken()
         try:
             if not self._graph.nodes:
                 raise NodesNotFoundException
+            self._prepare_selection()
 
             self._log_workflow_start()
+            self._start_pools()
             while self.attempt <= self.inputs.max_retries:
                 try:
                     self._start_workflow_execution()
@@ -166,8 +278,143 @@ class Workflow(BaseModel):
                     self.on_finish()
 
         finally:
+            self._shutdown_pools()
             self._finalize_workflow()
 
+    def _open_checkpoint(self) -> None:
+        self._checkpoint = None
+        self._restored_from_checkpoint = False
+        if self.inputs.resume:
+            self._checkpoint = RunCheckpoint.open(self.inputs.resume, workflow_name=self.name)
+            if not self._run_id:
+                self._run_id = self._checkpoint.manifest.run_id
+            restored = self._checkpoint.restore(self._graph.nodes.values())
+            self._restored_from_checkpoint = bool(restored)
+        elif self.inputs.checkpoint_dir:
+            if not self._run_id:
+                self._run_id = str(uuid4())
+            self._checkpoint = RunCheckpoint.create(
+                Path(self.inputs.checkpoint_dir) / self._run_id,
+                workflow_name=self.name,
+                run_id=self._run_id,
+                nodes=self._graph.nodes,
+            )
+
+    def _prepare_selection(self) -> None:
+        self._selection = None
+        self._selection_upstream = set()
+        inputs = self.inputs
+        if not (inputs.only or inputs.from_nodes or inputs.until):
+            return
+
+        try:
+            selection = self._graph.select_nodes(only=inputs.only, from_nodes=inputs.from_nodes, until=inputs.until)
+        except ValueError as e:
+            raise InvalidNodeSelectionException(str(e)) from e
+        if not selection:
+            raise InvalidNodeSelectionException("The node selection does not match any node")
+
+        self._selection = selection
+        self._selection_upstream = self._graph.get_ancestors(selection) - selection
+
+    def _persist_output(self, node: Node) -> None:
+        # The checkpoint needs the full output, so it is written before anything is spilled.
+        if node._last_record.status != StatusCodes.COMPLETED:
+            return
+        if self._checkpoint is not None:
+            self._save_checkpoint(node)
+        if self._spiller is not None:
+            if self._result_cache is not None and any(child.cache for child in self._graph.get_children(node)):
+                # Hashed while the output is whole; cache keys of the children reuse the digest.
+                self._digest_output(node)
+            self._spiller.spill(node.last_execution.output, node.name)
+
+    def _save_checkpoint(self, node: Node) -> None:
+        try:
+            self._checkpoint.save_node(node)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            # The node completed; only a resume loses it, so the run goes on and the node runs again then.
+            self._logger.error(f"Checkpoint of {node.name} could not be written, it will run again on resume: {e}")
+            self._checkpoint.discard_node(node.name)
+            self.current_execution.output.unsaved_checkpoints.append(node.name)
+
+    def _digest_output(self, node: Node) -> None:
+        try:
+            upstream_digest(node)
+        except TypeError as e:
+            self._logger.warning(f"Output of {node.name} cannot be hashed for the cache keys of its children: {e}")
+
+    def _start_pools(self) -> None:
+        max_workers = self._resolve_max_workers()
+        self._worker_pool = WorkerPool(max_workers=max_workers)
+        self._run_budget = self._resource_budget or (ResourceBudget(self.capacity) if self.capacity else None)
+
+        process_nodes = [n for n in self._graph.nodes.values() if self._resolve_executor(n) == ExecutorType.PROCESS]
+        if process_nodes:
+            self._process_pool = ProcessWorkerPool(max_workers=min(max_workers, sum(n._process_slots for n in process_nodes)))
+
+        if any(n.cache for n in self._graph.nodes.values()):
+            self._result_cache = ResultCache(self.cache or CacheConfig())
+        self._spiller = OutputSpiller(self.spill) if self.spill is not None else None
+
+        if self._event_loop is None and any(n.is_async for n in self._graph.nodes.values()):
+            self._event_loop_thread = EventLoopThread().start()
+            self._event_loop = self._event_loop_thread.loop
+
+    def _shutdown_pools(self) -> None:
+        self._run_budget = None
+        self._result_cache = None
+        self._spiller = None
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+            for node in self._graph.nodes.values():
+                node._set_worker_pool(None, None)
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+            for node in self._graph.nodes.values():
+                node._set_process_pool(None)
+        if self._event_loop_thread is not None:
+            self._event_loop_thread.stop()
+            self._event_loop_thread = None
+            self._event_loop = None
+
+    async def execute_async(self) -> None:
+        """Run the workflow without blocking the running event loop; async nodes run on it.
+
+        The run gets a thread of its own rather than one from the loop's default executor, so
+        concurrent runs never queue behind each other. Cancelling the caller cancels the run.
+        """
+        loop = asyncio.get_running_loop()
+        done: asyncio.Future[None] = loop.create_future()
+
+        def resolve(error: BaseException | None) -> None:
+            if done.done():
+                return
+            if error is None:
+                done.set_result(None)
+            else:
+                done.set_exception(error)
+
+        def runner() -> None:
+            try:
+                self.execute()
+            except BaseException as e:  # noqa: BLE001 - handed to the awaiting coroutine
+                loop.call_soon_threadsafe(resolve, e)
+            else:
+                loop.call_soon_threadsafe(resolve, None)
+
+        self._event_loop = loop
+        threading.Thread(target=runner, name=f"fluxly-run-{self.name}", daemon=True).start()
+        try:
+            await done
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
+        finally:
+            self._event_loop = None
+
     def _start_workflow_execution(self) -> None:
         execution = self._create_execution()
         execution._attempt = self.attempt + 1
@@ -177,6 +424,8 @@ class Workflow(BaseModel):
 
     def _run_with_timeout(self) -> None:
         result: list[Exception | bool] = []
+        token = self._cancel_token.child()
+        self._attempt_token = token
 
         def runner() -> None:
             try:
@@ -184,12 +433,16 @@ class Workflow(BaseModel):
                 result.append(True)
             except Exception as e:
                 result.append(e)
+            finally:
+                # Stops nodes that are still running after a failure.
+                token.cancel()
 
         thread = threading.Thread(target=runner, daemon=True)
         thread.start()
         thread.join(timeout=self.inputs.timeout_seconds)
 
         if thread.is_alive():
+            token.cancel()
             self._handle_exception(TimeoutException())
 
         if result and isinstance(result[0], Exception):
@@ -204,13 +457,20 @@ class Workflow(BaseModel):
         raise exception
 
     def _handle_retry(self, error: Exception) -> bool:
+        if not self.retry_policy.is_retryable(error):
+            self._logger.error(f"{self.name} failed: {error}. Not retryable.")
+            return False
+
         if self.attempt >= self.inputs.max_retries:
             self._logger.error(f"{self.name} failed: {error}. Retries exhausted.")
             return False
 
-        self._logger.warning(f"{self.name} failed: {error}. Retrying in {self.inputs.retry_delay_seconds}s...")
-        time.sleep(self.inputs.retry_delay_seconds)
-        return True
+        if self._cancel_token.cancelled:
+            return False
+
+        delay = self.retry_policy.delay_seconds(self.inputs.retry_delay_seconds, self.attempt)
+        self._logger.warning(f"{self.name} failed: {error}. Retrying in {delay:.2f}s...")
+        return not self._cancel_token.wait(delay)
 
     def _finalize_workflow_execution(self) -> None:
         current = self.current_execution
@@ -232,63 +492,107 @@ class Workflow(BaseModel):
             )
 
     def _iterate_nodes(self) -> None:
-        all_nodes: list[Node] = list(self._graph.nodes.values())
-        running_threads: dict[str, threading.Thread] = {}
-        scheduled: set[str] = set()
-        completed: set[Node] = set()
-        node_errors: dict[str, Exception] = {}
+        reused_nodes = self._reused_nodes()
+        if reused_nodes:
+            self._logger.info(f"Resuming {self.name}: reusing {len(reused_nodes)} completed nodes {reused_nodes}")
+        WorkflowScheduler(
+            self,
+            plan=self._execution_plan(),
+            pool=self._worker_pool,
+            budget=self._run_budget,
+            cancel_token=self._attempt_token,
+            reused_nodes=reused_nodes,
+            selection=self._selection,
+        ).run()
+
+    def _reused_nodes(self) -> list[str]:
+        retrying = self.inputs.resume_on_retry and self.attempt > 1
+        if not (self._restored_from_checkpoint or retrying or self._selection is not None):
+            return []
+
+        reused = self._resumable_nodes()
+        if self._selection is None:
+            return self._without_lost_outputs(reused)
+
+        # Selected nodes always run again, except on a resumed retry; upstream nodes are only loaded.
+        reused = self._without_lost_outputs([
+            name for name in reused
+            if name in self._selection_upstream or (retrying and name in self._selection)
+        ])
+        missing = sorted(self._selection_upstream.difference(reused))
+        if missing:
+            raise InvalidNodeSelectionException(
+                f"Upstream nodes {missing} are not selected and have no completed execution to load; "
+                "resume from a run directory that completed them"
+            )
+        return reused
 
+    def _without_lost_outputs(self, names: list[str]) -> list[str]:
+        """Drop nodes whose output a re-running child would need but cannot get: streamed or released."""
+        nodes = self._graph.nodes
+        kept = set(names)
         while True:
-            runnable = [
-                n for n in all_nodes
-                if n.name not in scheduled and self._graph.can_node_run(n, completed)
-            ]
-
-            for node in runnable:
-                children = self._graph.get_children(node)
-                if any(child.name in running_threads for child in children):
-                    raise UnsupportedGraphScenario("Attempted to start a node while one of its children is running")
-
-                def _target(n: Node) -> None:
-                    try:
-                        self.run_node(n)
-                    except Exception as e:  # noqa: BLE001 - we intentionally capture to decide at workflow level
-                        node_errors[n.name] = e
-
-                thread = threading.Thread(target=_target, args=(node,), daemon=True)
-                running_threads[node.name] = thread
-                scheduled.add(node.name)
-                thread.start()
-
-            for name, thread in list(running_threads.items()):
-                if thread.is_alive():
-                    continue
-
-                thread.join()
-                node = self._graph.nodes[name]
-                completed.add(node)
-                self.current_execution.output.node_to_executions[node.name] = node.executions
-                self._log_node_summary(node)
-                if node.last_execution.status != StatusCodes.COMPLETED:
-                    if self._all_execution_groups_dead():
-                        raise node_errors.get(name) or Exception(
-                            str(node.last_execution.error) if node.last_execution.error else f"Node {name} failed"
-                        )
-                del running_threads[name]
-
-            if not running_threads:
-                pending_runnable = [
-                    n for n in all_nodes
-                    if n.name not in scheduled and self._graph.can_node_run(n, completed)
-                ]
-                if not pending_runnable:
-                    break
+            dropped = {
+                edge.source
+                for edge in self._graph.edges
+                if edge.source in kept
+                and edge.destination not in kept
+                and (edge.streaming or nodes[edge.source].last_execution.metadata.output_released)
+            }
+            if not dropped:
+                return [name for name in names if name in kept]
+            kept -= dropped | self._graph.get_descendants(dropped)
+
+    def _resumable_nodes(self) -> list[str]:
+        """Nodes whose last execution completed and whose ancestors are all resumable, in topological order."""
+        nodes = self._graph.nodes
+        resumable: list[str] = []
+        resumable_set: set[str] = set()
+        for name in self._graph.topological_order():
+            node = nodes[name]
+            if node.attempt == 0 or node._last_record.status != StatusCodes.COMPLETED:
+                continue
+            if all(parent in resumable_set for parent in self._graph._parents[name]):
+                resumable.append(name)
+                resumable_set.add(name)
+        return resumable
+
+    def run_node(self, node: Node, cancel_scope: CancellationToken | None = None, first_attempt: bool = True) -> float | None:
+        """Run one attempt of ``node``; returns the backoff delay when it should be retried."""
+        node._set_workflow_context(workflow_input=self.inputs, workflow_metadata=self.metadata)
+        node._set_process_pool(self._process_pool if self._resolve_executor(node) == ExecutorType.PROCESS else None)
+        node._set_worker_pool(self._worker_pool, self._run_budget)
+        node._set_cancel_scope(cancel_scope or self._attempt_token)
+        self._assign_result_cache(node)
 
-    def run_node(self, node: Node) -> None:
+        self._log_node_start(node)
+        delay = node._run_scheduled_attempt(first_attempt)
+        if delay is None:
+            self._persist_output(node)
+        return delay
+
+    async def run_node_async(self, node: Node, cancel_scope: CancellationToken | None = None, first_attempt: bool = True) -> float | None:
         node._set_workflow_context(workflow_input=self.inputs, workflow_metadata=self.metadata)
+        node._set_cancel_scope(cancel_scope or self._attempt_token)
+        self._assign_result_cache(node)
 
         self._log_node_start(node)
-        node.execute()
+        delay = await node._run_scheduled_attempt_async(first_attempt)
+        if delay is None and (self._checkpoint is not None or self._spiller is not None):
+            await asyncio.to_thread(self._persist_output, node)
+        return delay
+
+    def _assign_result_cache(self, node: Node) -> None:
+        if not node.cache or self._result_cache is None:
+            node._set_result_cache(None, None)
+            return
+        try:
+            cache_key = compute_cache_key(node, self.inputs, self._graph.get_parents(node))
+        except TypeError as e:
+            self._logger.warning(f"Caching disabled for {node.name}: {e}")
+            node._set_result_cache(None, None)
+            return
+        node._set_result_cache(self._result_cache, cache_key)
 
     def _log_workflow_start(self) -> None:
         if not self.inputs.verbose:
@@ -335,12 +639,13 @@ class Workflow(BaseModel):
                           f"{'-'*30}")
 
     def _log_node_summary(self, node: Node) -> None:
-        latest = node.last_execution if node.last_execution else None
         if not self.inputs.verbose:
+            latest = node._last_record if node.attempt else None
             status = latest.status if latest else StatusCodes.UNKNOWN
-            duration = latest.metadata.process_time if latest else None
+            duration = latest.process_time if latest else None
             if status == StatusCodes.COMPLETED:
-                self._logger.info(f"Node {node.name} completed in {duration}")
+                cached = " (cached)" if latest.cache_hit else ""
+                self._logger.info(f"Node {node.name} completed in {duration}{cached}")
             else:
                 err_cls = latest.error.exception_class_name if latest and latest.error else None
                 err_msg = latest.error.exception_message if latest and latest.error else None
@@ -349,6 +654,7 @@ class Workflow(BaseModel):
                 )
             return
 
+        latest = node.last_execution if node.attempt else None
         prev_failures = [
             f"\t\t- Attempt #{i}: status={ex.status} duration={ex.metadata.process_time} "
             f"error={ex.error.exception_class_name if ex.error else None}: "
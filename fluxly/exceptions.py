@@ -1,5 +1,6 @@
 from fluxly.core.exceptions import (
     APICallFailureException,
+    CancelledException,
     DataErrorException,
     DataValidationFailureException,
     DependencyUnavailableException,
@@ -13,6 +14,7 @@ from fluxly.core.exceptions import (
 __all__ = [
     "WorkflowException",
     "TimeoutException",
+    "CancelledException",
     "InfrastructureErrorException",
     "DataErrorException",
     "PrerequisiteFailureException",
@@ -1,15 +1,21 @@
 from fluxly.core.node import (
+    ExecutorType,
+    MapNode,
     Node,
     NodeError,
     NodeExecution,
     NodeMetadata,
     NodeOutput,
+    ShardMetadata,
 )
 
 __all__ = [
     "Node",
+    "MapNode",
     "NodeMetadata",
+    "ShardMetadata",
     "NodeOutput",
     "NodeError",
     "NodeExecution",
+    "ExecutorType",
 ]
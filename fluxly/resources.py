@@ -0,0 +1,7 @@
+from fluxly.core.resources import NodeResources, ResourceBudget, ResourceCapacity
+
+__all__ = [
+    "NodeResources",
+    "ResourceCapacity",
+    "ResourceBudget",
+]
@@ -0,0 +1,5 @@
+from fluxly.core.retry import RetryPolicy
+
+__all__ = [
+    "RetryPolicy",
+]
@@ -0,0 +1,8 @@
+from fluxly.core.spill import OutputSpiller, SpillConfig, SpilledValue, estimate_size
+
+__all__ = [
+    "SpillConfig",
+    "SpilledValue",
+    "OutputSpiller",
+    "estimate_size",
+]
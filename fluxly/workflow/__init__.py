@@ -1,6 +1,11 @@
 from fluxly.core.workflow import (
+    DurationSource,
+    ExecutionPlan,
+    GraphAnalysis,
     NodesNotFoundException,
+    SchedulingPolicy,
     Workflow,
+    WorkflowCompiledException,
     WorkflowExecution,
     WorkflowGraph,
     WorkflowInput,
@@ -16,4 +21,9 @@ __all__ = [
     "WorkflowGraph",
     "WorkflowExecution",
     "NodesNotFoundException",
+    "WorkflowCompiledException",
+    "SchedulingPolicy",
+    "ExecutionPlan",
+    "GraphAnalysis",
+    "DurationSource",
 ]
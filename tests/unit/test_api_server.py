@@ -80,6 +80,16 @@ class TestApiServer(unittest.TestCase):
         res = self.client.post("/test/run", json={"retry_delay_seconds": -1})
         self.assertEqual(res.status_code, status.HTTP_422_UNPROCESSABLE_CONTENT)
 
+    def test_broken_workflow_only_fails_its_endpoint(self) -> None:
+        empty = Workflow(name="EmptyWF", inputs=WorkflowInput(verbose=False))
+        app = build_app(endpoints={"test": (_build_simple_workflow(), WorkflowInput), "empty": (empty, WorkflowInput)}, config=ApiConfig())
+        client = TestClient(app)
+
+        res = client.post("/empty/run", json={})
+        self.assertEqual(res.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertIn("NodesNotFoundException", res.json()["detail"])
+        self.assertEqual(client.post("/test/run", json={}).status_code, status.HTTP_202_ACCEPTED)
+
     def test_get_nonexistent_run_returns_404(self) -> None:
         res = self.client.get("/runs/does-not-exist")
         self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
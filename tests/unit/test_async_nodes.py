@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from fluxly.exceptions import DataErrorException, TimeoutException
+from fluxly.node import Node, NodeExecution, NodeOutput
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class FetchOutput(NodeOutput):
+    payload: str = ""
+    thread_name: str = ""
+
+
+class FetchExecution(NodeExecution):
+    output: FetchOutput = FetchOutput()
+
+
+class AsyncFetch(Node):
+    delay_seconds: float = 0.2
+
+    def _create_execution(self) -> FetchExecution:
+        return FetchExecution()
+
+    async def _logic(self) -> None:
+        await asyncio.sleep(self.delay_seconds)
+        self.current_execution.output.payload = f"{self.name}-done"
+        self.current_execution.output.thread_name = threading.current_thread().name
+
+
+class SyncConsumer(Node):
+    source: AsyncFetch
+
+    def _create_execution(self) -> FetchExecution:
+        return FetchExecution()
+
+    def _logic(self) -> None:
+        self.current_execution.output.payload = self.source.last_execution.output.payload.upper()
+
+
+class AsyncNodesTest(unittest.TestCase):
+    def _wf(self, max_workers: int | None = None) -> Workflow:
+        return Workflow(name="async-wf", inputs=WorkflowInput(verbose=False, max_workers=max_workers))
+
+    def test_standalone_async_node_executes(self) -> None:
+        node = AsyncFetch(name="fetch", delay_seconds=0)
+        node.execute()
+        self.assertEqual(node.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(node.last_execution.output.payload, "fetch-done")
+
+    def test_async_nodes_share_one_loop_without_workers(self) -> None:
+        wf = self._wf(max_workers=1)
+        for i in range(50):
+            wf.add_node(AsyncFetch(name=f"fetch-{i}"))
+
+        start = time.perf_counter()
+        wf.execute()
+
+        self.assertLess(time.perf_counter() - start, 2)
+        threads = {n.last_execution.output.thread_name for n in wf.get_nodes()}
+        self.assertEqual(len(threads), 1)
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+
+    def test_async_timeout_and_retry(self) -> None:
+        class Flaky(Node):
+            async def _logic(self) -> None:
+                if self.attempt == 1:
+                    raise DataErrorException("transient")
+
+        flaky = Flaky(name="flaky", max_retries=2)
+        flaky.execute()
+        self.assertEqual(flaky.attempt, 2)
+        self.assertEqual(flaky.last_execution.status, StatusCodes.COMPLETED)
+
+        slow = AsyncFetch(name="slow", delay_seconds=5, timeout_seconds=1)
+        with self.assertRaises(TimeoutException):
+            slow.execute()
+        self.assertEqual(slow.last_execution.status, StatusCodes.TIMED_OUT)
+
+    def test_execute_async_runs_async_nodes_on_caller_loop(self) -> None:
+        fetch = AsyncFetch(name="fetch", delay_seconds=0.05)
+        consumer = SyncConsumer(name="consumer", source=fetch)
+        wf = self._wf()
+        wf.add_node(fetch)
+        wf.add_node(consumer)
+        wf.add_edge(fetch, consumer)
+
+        async def main() -> str:
+            await wf.execute_async()
+            return threading.current_thread().name
+
+        loop_thread = asyncio.run(main())
+
+        self.assertEqual(fetch.last_execution.output.thread_name, loop_thread)
+        self.assertEqual(consumer.last_execution.output.payload, "FETCH-DONE")
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+
+    def test_concurrent_runs_do_not_wait_for_the_default_executor(self) -> None:
+        class Sleep(Node):
+            def _logic(self) -> None:
+                time.sleep(0.3)
+
+        runs = []
+        for i in range(3):
+            wf = self._wf()
+            wf.add_node(Sleep(name=f"sleep-{i}"))
+            runs.append(wf)
+
+        async def main() -> float:
+            # A single default-executor thread would serialize runs that borrow it.
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=1))
+            start = time.perf_counter()
+            await asyncio.gather(*(wf.execute_async() for wf in runs))
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(main())
+
+        self.assertLess(elapsed, 0.8)
+        self.assertTrue(all(wf.last_execution.status == StatusCodes.COMPLETED for wf in runs))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+
+from fluxly.exceptions import DataErrorException
+from fluxly.node import Node
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class NoopNode(Node):
+    def _logic(self) -> None:
+        return None
+
+
+failed: set[str] = set()
+
+
+class FailOnceNode(Node):
+    def _logic(self) -> None:
+        if self.name not in failed:
+            failed.add(self.name)
+            raise DataErrorException("first call fails")
+
+
+class EdgeConditionTest(unittest.TestCase):
+    def test_condition_evaluated_once_and_recorded(self) -> None:
+        calls: list[str] = []
+
+        def flaky() -> bool:
+            calls.append("flaky")
+            return len(calls) == 1
+
+        source, slow, sink, other = (NoopNode(name=name) for name in ("source", "slow", "sink", "other"))
+        wf = Workflow(name="conditions-wf", inputs=WorkflowInput(verbose=False))
+        wf.add_nodes_from([source, slow, sink, other])
+        wf.add_edges_from([(source, slow), (slow, sink), (source, sink, flaky)])
+        wf.add_conditional_edge(source, other, condition=lambda: False)
+        wf.execute()
+
+        output = wf.last_execution.output
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(calls, ["flaky"])
+        self.assertIn("sink", output.node_to_executions)
+        self.assertNotIn("other", output.node_to_executions)
+        self.assertEqual(
+            {(result.source, result.destination): result.passed for result in output.edge_conditions},
+            {("source", "sink"): True, ("source", "other"): False},
+        )
+        self.assertFalse(wf._graph._edge_index[("source", "other")].condition_passed)
+
+    def test_each_attempt_evaluates_again(self) -> None:
+        calls: list[int] = []
+        source, sink = NoopNode(name="source"), NoopNode(name="sink")
+        wf = Workflow(name="conditions-rerun-wf", inputs=WorkflowInput(verbose=False))
+        wf.add_nodes_from([source, sink])
+        wf.add_conditional_edge(source, sink, condition=lambda: calls.append(1) is None)
+        for _ in range(2):
+            run = wf.new_run()
+            run.execute()
+            self.assertEqual([r.passed for r in run.last_execution.output.edge_conditions], [True])
+            self.assertTrue(run._graph.edges[0].condition_passed)
+        self.assertEqual(len(calls), 2)
+        self.assertIsNone(wf._graph.edges[0].condition_passed)
+
+    def test_reused_nodes_are_never_skipped(self) -> None:
+        results = iter([True, False])
+        source, branch, flaky = NoopNode(name="source"), NoopNode(name="branch"), FailOnceNode(name="flaky")
+        wf = Workflow(name="conditions-reuse-wf", inputs=WorkflowInput(verbose=False, max_retries=2, resume_on_retry=True))
+        wf.add_nodes_from([source, branch, flaky])
+        wf.add_edge(branch, flaky)
+        wf.add_conditional_edge(source, branch, condition=lambda: next(results))
+        wf.execute()
+
+        output = wf.last_execution.output
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(sorted(output.reused_nodes), ["branch", "source"])
+        self.assertEqual(output.skipped_nodes, [])
+
+    def test_false_condition_skips_the_subtree(self) -> None:
+        names = ("source", "branch", "left", "right", "join", "other")
+        source, branch, left, right, join, other = (NoopNode(name=name) for name in names)
+        wf = Workflow(name="conditions-skip-wf", inputs=WorkflowInput(verbose=False))
+        wf.add_nodes_from([source, branch, left, right, join, other])
+        wf.add_edges_from([(branch, left), (branch, right), (left, join), (right, join), (source, other)])
+        wf.add_conditional_edge(source, branch, condition=lambda: False)
+        wf.execute()
+
+        output = wf.last_execution.output
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(set(output.skipped_nodes), {"branch", "left", "right", "join"})
+        self.assertEqual(len(output.skipped_nodes), 4)
+        self.assertEqual(set(output.node_to_executions), {"source", "other"})
+        self.assertEqual(output.node_status("join"), StatusCodes.SKIPPED)
+        self.assertEqual(output.node_status("other"), StatusCodes.COMPLETED)
+        self.assertEqual(join.attempt, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import os
+import threading
+import time
+import unittest
+from typing import Any
+
+from fluxly.exceptions import DataErrorException
+from fluxly.node import ExecutorType, MapNode, Node, NodeExecution, NodeOutput
+from fluxly.resources import NodeResources, ResourceCapacity
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class RecordsOutput(NodeOutput):
+    records: list[int] = []
+    total: int = 0
+    pids: list[int] = []
+
+
+class RecordsExecution(NodeExecution):
+    output: RecordsOutput = RecordsOutput()
+
+
+class Extract(Node):
+    count: int = 20
+
+    def _create_execution(self) -> RecordsExecution:
+        return RecordsExecution()
+
+    def _logic(self) -> None:
+        self.current_execution.output.records = list(range(self.count))
+
+
+class SquareShards(MapNode):
+    source: Extract
+    shard_size: int = 5
+
+    def _create_execution(self) -> RecordsExecution:
+        return RecordsExecution()
+
+    def _split(self) -> list[list[int]]:
+        records = self.source.last_execution.output.records
+        return [records[i: i + self.shard_size] for i in range(0, len(records), self.shard_size)]
+
+    def _map(self, shard: list[int]) -> tuple[int, int]:
+        return sum(r * r for r in shard), os.getpid()
+
+    def _reduce(self, results: list[Any]) -> None:
+        self.current_execution.output.total = sum(total for total, _ in results)
+        self.current_execution.output.pids = sorted({pid for _, pid in results})
+
+
+class ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __enter__(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *_: object) -> None:
+        with self.lock:
+            self.active -= 1
+
+
+tracker = ConcurrencyTracker()
+calls: dict[int, int] = {}
+
+
+class FlakyShards(MapNode):
+    fail_times: dict[int, int] = {}
+
+    def _split(self) -> list[int]:
+        return list(range(6))
+
+    def _map(self, shard: int) -> int:
+        with tracker:
+            time.sleep(0.02)
+        calls[shard] = calls.get(shard, 0) + 1
+        if calls[shard] <= self.fail_times.get(shard, 0):
+            raise DataErrorException(f"bad shard {shard}")
+        return shard * 10
+
+    def _reduce(self, results: list[Any]) -> None:
+        self.current_execution.output = RecordsOutput(records=results)
+
+
+class MapNodeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        tracker.active = 0
+        tracker.peak = 0
+
+    def _run(self, executor: ExecutorType | None = None) -> SquareShards:
+        extract = Extract(name="extract")
+        squares = SquareShards(name="squares", source=extract, executor=executor)
+        wf = Workflow(name="map-wf", inputs=WorkflowInput(verbose=False))
+        wf.add_nodes_from([extract, squares])
+        wf.add_edge(extract, squares)
+        wf.execute()
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        return squares
+
+    def test_shards_are_mapped_and_reduced(self) -> None:
+        squares = self._run()
+        shards = squares.last_execution.metadata.shards
+
+        self.assertEqual(squares.last_execution.output.total, sum(i * i for i in range(20)))
+        self.assertEqual([s.index for s in shards], [0, 1, 2, 3])
+        self.assertTrue(all(s.status == StatusCodes.COMPLETED and s.attempts == 1 for s in shards))
+        self.assertTrue(all(s.process_time is not None for s in shards))
+
+    def test_concurrency_is_bounded(self) -> None:
+        node = FlakyShards(name="bounded", max_shard_workers=2)
+        node.execute()
+        self.assertEqual(node.last_execution.output.records, [0, 10, 20, 30, 40, 50])
+        self.assertEqual(tracker.peak, 2)
+
+    def test_shards_share_the_workflow_workers(self) -> None:
+        node = FlakyShards(name="shared", max_shard_workers=8)
+        wf = Workflow(name="map-wf", max_workers=2, inputs=WorkflowInput(verbose=False))
+        wf.add_node(node)
+        wf.execute()
+
+        self.assertEqual(node.last_execution.output.records, [0, 10, 20, 30, 40, 50])
+        self.assertEqual(tracker.peak, 2)
+
+    def test_borrowed_workers_reserve_node_resources(self) -> None:
+        node = FlakyShards(name="budgeted", max_shard_workers=8, resources=NodeResources(cpu=1))
+        wf = Workflow(name="map-wf", max_workers=8, capacity=ResourceCapacity(cpu=3), inputs=WorkflowInput(verbose=False))
+        wf.add_node(node)
+        wf.execute()
+
+        self.assertEqual(tracker.peak, 3)
+
+    def test_failed_shard_is_retried_alone(self) -> None:
+        node = FlakyShards(name="flaky", fail_times={3: 1}, shard_max_retries=2)
+        node.execute()
+
+        shards = node.last_execution.metadata.shards
+        self.assertEqual(node.attempt, 1)
+        self.assertEqual(shards[3].attempts, 2)
+        self.assertEqual([s.attempts for i, s in enumerate(shards) if i != 3], [1] * 5)
+        self.assertEqual(calls, {0: 1, 1: 1, 2: 1, 3: 2, 4: 1, 5: 1})
+
+    def test_node_retry_keeps_completed_shards(self) -> None:
+        node = FlakyShards(name="flaky", fail_times={2: 2}, shard_max_retries=2, max_retries=2)
+        node.execute()
+
+        first, second = node.executions
+        self.assertEqual(first.status, StatusCodes.DATA_ERROR)
+        self.assertEqual(first.metadata.shards[2].status, StatusCodes.DATA_ERROR)
+        self.assertEqual(first.metadata.shards[2].error.exception_message, "bad shard 2")
+        self.assertEqual(second.status, StatusCodes.COMPLETED)
+        self.assertEqual([s.reused for s in second.metadata.shards], [True, True, False, True, True, True])
+        self.assertEqual(calls[2], 3)
+        self.assertEqual(calls[0], 1)
+
+    def test_shards_run_on_process_pool(self) -> None:
+        squares = self._run(executor=ExecutorType.PROCESS)
+        self.assertEqual(squares.last_execution.output.total, sum(i * i for i in range(20)))
+        self.assertNotIn(os.getpid(), squares.last_execution.output.pids)
+
+
+if __name__ == "__main__":
+    unittest.main()
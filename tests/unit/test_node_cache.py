@@ -0,0 +1,170 @@
+import os
+import tempfile
+import time
+import unittest
+
+from click.testing import CliRunner
+from pydantic import ConfigDict
+
+from fluxly.cache import CacheConfig, ResultCache
+from fluxly.core.cache import compute_cache_key
+from fluxly.core.cli.cache import build_cache_group
+from fluxly.node import Node, NodeExecution, NodeOutput
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class ExtractInput(WorkflowInput):
+    source: str = "a"
+
+
+class CountOutput(NodeOutput):
+    value: str = ""
+
+
+class CountExecution(NodeExecution):
+    output: CountOutput = CountOutput()
+
+
+calls: list[str] = []
+
+
+class Extract(Node):
+    factor: int = 1
+
+    def _create_execution(self) -> CountExecution:
+        return CountExecution()
+
+    def _logic(self) -> None:
+        calls.append(self.name)
+        self.current_execution.output.value = self.workflow_input.source * self.factor
+
+
+class Upper(Node):
+    source: Extract
+
+    def _create_execution(self) -> CountExecution:
+        return CountExecution()
+
+    def _logic(self) -> None:
+        calls.append(self.name)
+        self.current_execution.output.value = self.source.last_execution.output.value.upper()
+
+
+class HandleOutput(NodeOutput):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    handle: object = None
+
+
+class HandleExecution(NodeExecution):
+    output: HandleOutput = HandleOutput()
+
+
+class Opener(Node):
+    def _create_execution(self) -> HandleExecution:
+        return HandleExecution()
+
+    def _logic(self) -> None:
+        self.current_execution.output.handle = object()
+
+
+class Reader(Node):
+    opener: Opener
+
+    def _logic(self) -> None:
+        return None
+
+
+class NodeCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.config = CacheConfig(directory=self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _run(self, source: str = "a", factor: int = 2) -> tuple[Extract, Upper]:
+        extract = Extract(name="extract", factor=factor, cache=True)
+        upper = Upper(name="upper", source=extract, cache=True)
+        wf = Workflow(name="cache-wf", cache=self.config, inputs=ExtractInput(verbose=False, source=source))
+        wf.add_nodes_from([extract, upper])
+        wf.add_edge(extract, upper)
+        wf.execute()
+        return extract, upper
+
+    def test_hit_skips_logic_and_restores_output(self) -> None:
+        self._run()
+        extract, upper = self._run()
+
+        self.assertEqual(calls, ["extract", "upper"])
+        self.assertTrue(extract.last_execution.metadata.cache_hit)
+        self.assertEqual(upper.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(upper.last_execution.output.value, "AA")
+
+    def test_key_tracks_config_inputs_and_upstream(self) -> None:
+        self._run()
+        self._run(factor=3)
+        self.assertEqual(calls, ["extract", "upper", "extract", "upper"])
+
+        calls.clear()
+        self._run(source="b", factor=3)
+        self.assertEqual(calls, ["extract", "upper"])
+
+    def test_unhashable_upstream_disables_caching(self) -> None:
+        opener = Opener(name="opener")
+        reader = Reader(name="reader", opener=opener, cache=True)
+        wf = Workflow(name="cache-wf", cache=self.config, inputs=ExtractInput(verbose=False))
+        wf.add_nodes_from([opener, reader])
+        wf.add_edge(opener, reader)
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(ResultCache(self.config).count(), 0)
+        with self.assertRaises(TypeError):
+            compute_cache_key(reader, None, [opener])
+
+    def test_lru_eviction(self) -> None:
+        cache = ResultCache(self.config)
+        for i, key in enumerate(["aa01", "bb02", "cc03"]):
+            cache.put(key, CountOutput(value="x" * 100))
+            os.utime(cache._path(key), (time.time() - 100 + i, time.time() - 100 + i))
+        cache.get("aa01")
+        entry_size = cache.size_bytes() // 3
+
+        self.assertEqual(cache.evict(max_size_bytes=entry_size * 2), 1)
+        self.assertIsNone(cache.get("bb02"))
+        self.assertIsNotNone(cache.get("aa01"))
+
+    def test_put_only_scans_the_store_past_the_limit(self) -> None:
+        cache = ResultCache(self.config)
+        cache.put("aa01", CountOutput(value="x" * 100))
+        os.utime(cache._path("aa01"), (time.time() - 100, time.time() - 100))
+        entry_size = cache.size_bytes()
+        cache._max_size_bytes = entry_size * 5
+        scans = []
+        entries = cache._entries
+        cache._entries = lambda: scans.append(1) or entries()
+
+        for key in ["bb02", "cc03", "dd04", "ee05"]:
+            cache.put(key, CountOutput(value="x" * 100))
+        self.assertEqual(scans, [])
+
+        cache.put("ff06", CountOutput(value="x" * 100))
+        self.assertEqual(len(scans), 1)
+        self.assertLessEqual(cache.size_bytes(), entry_size * 5 * 0.9)
+        self.assertIsNone(cache.get("aa01"))
+
+    def test_cli_info_and_clear(self) -> None:
+        ResultCache(self.config).put("aa01", CountOutput(value="x"))
+        runner = CliRunner()
+        group = build_cache_group(self.config)
+
+        self.assertIn("Entries: 1", runner.invoke(group, ["info"]).output)
+        self.assertIn("Removed 1", runner.invoke(group, ["clear"]).output)
+        self.assertEqual(ResultCache(self.config).count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import sys
+import threading
+import time
+import unittest
+
+from fluxly.core.cancellation import CancellationToken, watchdog
+from fluxly.exceptions import CancelledException, DataErrorException, TimeoutException
+from fluxly.node import Node
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class CooperativeNode(Node):
+    def _logic(self) -> None:
+        started.append(time.perf_counter())
+        try:
+            for _ in range(300):
+                self.raise_if_cancelled()
+                time.sleep(0.01)
+        finally:
+            stopped.setdefault(self.name, []).append(time.perf_counter())
+
+
+class SleepingNode(Node):
+    def _logic(self) -> None:
+        started.append(time.perf_counter())
+        time.sleep(1.5)
+        stopped.setdefault(self.name, []).append(time.perf_counter())
+
+
+class FailingNode(Node):
+    def _logic(self) -> None:
+        raise DataErrorException("boom")
+
+
+class SubprocessNode(Node):
+    def _logic(self) -> None:
+        self.run_subprocess([sys.executable, "-c", "import time; time.sleep(30)"])
+
+
+started: list[float] = []
+stopped: dict[str, list[float]] = {}
+
+
+class NodeCancellationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        started.clear()
+        stopped.clear()
+
+    def test_timed_out_attempt_stops_before_retry(self) -> None:
+        node = CooperativeNode(name="cooperative", timeout_seconds=1, max_retries=2)
+        with self.assertRaises(TimeoutException):
+            node.execute()
+
+        self.assertEqual([e.status for e in node.executions], [StatusCodes.TIMED_OUT, StatusCodes.TIMED_OUT])
+        self.assertTrue(node.cancel_token.cancelled)
+        self.assertEqual(len(started), 2)
+        first_stopped = stopped["cooperative"][0]
+        self.assertLess(first_stopped, started[1])
+
+    def test_timeout_frees_the_worker_when_logic_ignores_the_token(self) -> None:
+        node = SleepingNode(name="sleeping", timeout_seconds=1, max_retries=2)
+        start = time.perf_counter()
+        with self.assertRaises(TimeoutException):
+            node.execute()
+
+        self.assertEqual([e.status for e in node.executions], [StatusCodes.TIMED_OUT, StatusCodes.TIMED_OUT])
+        self.assertLess(time.perf_counter() - start, 2.9)
+        self.assertLess(stopped["sleeping"][0], started[1])
+
+    def test_cooperative_timeout_cancels_on_the_worker_thread(self) -> None:
+        node = CooperativeNode(name="cooperative", timeout_seconds=1, cooperative_timeout=True)
+        start = time.perf_counter()
+        with self.assertRaises(TimeoutException):
+            node.execute()
+
+        self.assertEqual(node.last_execution.status, StatusCodes.TIMED_OUT)
+        self.assertLess(stopped["cooperative"][0] - start, 1.5)
+
+    def test_failing_callbacks_do_not_stop_the_others(self) -> None:
+        def fail() -> None:
+            raise RuntimeError("callback failed")
+
+        token = CancellationToken()
+        fired = threading.Event()
+        token.add_callback(fail)
+        token.add_callback(fired.set)
+        token.cancel()
+        self.assertTrue(fired.is_set())
+
+        watchdog.schedule(0, fail)
+        expired = threading.Event()
+        watchdog.schedule(0.05, expired.set)
+        self.assertTrue(expired.wait(timeout=2))
+
+    def test_subprocess_is_killed_on_timeout(self) -> None:
+        node = SubprocessNode(name="subprocess", timeout_seconds=1)
+        start = time.perf_counter()
+        with self.assertRaises(TimeoutException):
+            node.execute()
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_workflow_failure_cancels_running_nodes(self) -> None:
+        wf = Workflow(name="cancel-wf", inputs=WorkflowInput(verbose=False))
+        slow = CooperativeNode(name="slow")
+        wf.add_nodes_from([slow, FailingNode(name="failing")])
+
+        start = time.perf_counter()
+        with self.assertRaises(DataErrorException):
+            wf.execute()
+
+        for _ in range(100):
+            if "slow" in stopped:
+                break
+            time.sleep(0.01)
+        self.assertLess(stopped["slow"][0] - start, 2)
+
+    def test_cancel_stops_workflow(self) -> None:
+        wf = Workflow(name="cancel-wf", inputs=WorkflowInput(verbose=False))
+        wf.add_node(CooperativeNode(name="slow"))
+        threading.Timer(0.2, wf.cancel).start()
+
+        with self.assertRaises(CancelledException):
+            wf.execute()
+        self.assertEqual(wf.last_execution.status, StatusCodes.CANCELLED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,13 @@
+import threading
 import time
 import unittest
 
+from pydantic import PrivateAttr
+
 from fluxly.exceptions import DataErrorException, TimeoutException
 from fluxly.node import Node
 from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
 
 
 class FlakyNode(Node):
@@ -24,6 +28,18 @@ class TimeoutNode(Node):
         time.sleep((self.timeout_seconds or 1) + 1)
 
 
+class NoopNode(Node):
+    def _logic(self) -> None:
+        return None
+
+
+class ThreadRecordingNode(Node):
+    _threads: list[threading.Thread] = PrivateAttr(default_factory=list)
+
+    def _logic(self) -> None:
+        self._threads.append(threading.current_thread())
+
+
 class NodeExecutionTest(unittest.TestCase):
     def test_retry_success_then_complete(self) -> None:
         node = FlakyNode(name="flaky", fail_times=1, max_retries=2, retry_delay_seconds=1)
@@ -60,6 +76,48 @@ class NodeExecutionTest(unittest.TestCase):
         self.assertIsNotNone(latest.error)
         self.assertEqual(latest.error.exception_class_name, "TimeoutException")
 
+    def test_logic_runs_on_the_calling_thread(self) -> None:
+        for timeout in (None, 5):
+            node = ThreadRecordingNode(name="recording", timeout_seconds=timeout, cooperative_timeout=True)
+            node.execute()
+            self.assertEqual(node._threads, [threading.current_thread()])
+
+    def test_execution_models_are_built_on_access(self) -> None:
+        node = FlakyNode(name="flaky", fail_times=1, max_retries=2)
+        node.execute()
+        self.assertTrue(all(record.execution is None for record in node._records))
+
+        first = node.executions[0]
+        self.assertIs(node.executions[0], first)
+        self.assertEqual(first.attempt, 1)
+        self.assertEqual(first.error.exception_message, "transient failure")
+        self.assertIsNotNone(first.metadata.process_time)
+        self.assertIs(node.last_execution, node.executions[1])
+        self.assertEqual(node.last_execution.status, StatusCodes.COMPLETED)
+
+    def test_writes_after_access_reach_the_execution(self) -> None:
+        node = NoopNode(name="noop")
+        node._start_node_execution()
+        current = node.current_execution
+        node._finalize_node_execution()
+
+        self.assertEqual(current.status, StatusCodes.COMPLETED)
+        self.assertIsNotNone(current.metadata.end_time)
+        self.assertEqual(node._last_record.status, StatusCodes.COMPLETED)
+
+    def test_workflow_output_builds_executions_on_read(self) -> None:
+        nodes = [NoopNode(name=f"noop-{i}") for i in range(5)]
+        wf = Workflow(name="lazy-output-wf", inputs=WorkflowInput(verbose=False))
+        wf.add_nodes_from(nodes)
+        wf.execute()
+        self.assertTrue(all(node._last_record.execution is None for node in nodes))
+
+        output = wf.last_execution.output
+        self.assertIs(output.node_to_executions["noop-0"][-1], nodes[0].last_execution)
+        self.assertIsNone(nodes[1]._last_record.execution)
+        payload = output.model_dump(mode="json")
+        self.assertEqual(payload["node_to_executions"]["noop-4"][0]["status"], StatusCodes.COMPLETED.value)
+
 
 if __name__ == "__main__":
     unittest.main()
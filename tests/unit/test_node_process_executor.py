@@ -0,0 +1,98 @@
+import os
+import time
+import unittest
+
+from fluxly.exceptions import DataErrorException, TimeoutException
+from fluxly.node import ExecutorType, Node, NodeExecution, NodeOutput
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class SquareOutput(NodeOutput):
+    total: int = 0
+    pid: int = 0
+
+
+class SquareExecution(NodeExecution):
+    output: SquareOutput = SquareOutput()
+
+
+class SquareSum(Node):
+    upto: int = 1000
+
+    def _create_execution(self) -> SquareExecution:
+        return SquareExecution()
+
+    def _logic(self) -> None:
+        self.current_execution.output.total = sum(i * i for i in range(self.upto))
+        self.current_execution.output.pid = os.getpid()
+
+
+class Doubler(Node):
+    source: SquareSum
+
+    def _create_execution(self) -> SquareExecution:
+        return SquareExecution()
+
+    def _logic(self) -> None:
+        self.current_execution.output.total = self.source.last_execution.output.total * 2
+        self.current_execution.output.pid = os.getpid()
+
+
+class FailingProcessNode(Node):
+    def _logic(self) -> None:
+        raise DataErrorException("bad data")
+
+
+class HangingProcessNode(Node):
+    def _logic(self) -> None:
+        time.sleep(30)
+
+
+class ProcessExecutorTest(unittest.TestCase):
+    def test_workflow_ships_process_output_to_downstream_nodes(self) -> None:
+        source = SquareSum(name="square-sum", upto=10, executor=ExecutorType.PROCESS)
+        doubler = Doubler(name="doubler", source=source)
+        wf = Workflow(name="process-wf", inputs=WorkflowInput(verbose=False))
+        wf.add_node(source)
+        wf.add_node(doubler)
+        wf.add_edge(source, doubler)
+        wf.execute()
+
+        self.assertEqual(source.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(source.last_execution.output.total, 285)
+        self.assertNotEqual(source.last_execution.output.pid, os.getpid())
+        self.assertEqual(doubler.last_execution.output.total, 570)
+        self.assertEqual(doubler.last_execution.output.pid, os.getpid())
+        self.assertIs(wf.last_execution.output.node_to_executions["square-sum"][-1], source.last_execution)
+
+    def test_workflow_default_executor_reuses_workers(self) -> None:
+        wf = Workflow(name="process-default", executor="process", max_workers=1, inputs=WorkflowInput(verbose=False))
+        wf.add_node(SquareSum(name="first", upto=3))
+        wf.add_node(SquareSum(name="second", upto=3))
+        wf.execute()
+
+        pids = {n.last_execution.output.pid for n in wf.get_nodes()}
+        self.assertEqual(len(pids), 1)
+        self.assertNotIn(os.getpid(), pids)
+
+    def test_process_error_is_shipped_back(self) -> None:
+        node = FailingProcessNode(name="failing", executor=ExecutorType.PROCESS)
+        with self.assertRaises(DataErrorException):
+            node.execute()
+
+        self.assertEqual(node.last_execution.status, StatusCodes.DATA_ERROR)
+        self.assertEqual(node.last_execution.error.exception_message, "bad data")
+
+    def test_process_timeout_raises(self) -> None:
+        node = HangingProcessNode(name="hanging", executor=ExecutorType.PROCESS, timeout_seconds=1)
+        start = time.perf_counter()
+        with self.assertRaises(TimeoutException):
+            node.execute()
+
+        self.assertLess(time.perf_counter() - start, 10)
+        self.assertEqual(node.last_execution.status, StatusCodes.TIMED_OUT)
+
+
+if __name__ == "__main__":
+    unittest.main()
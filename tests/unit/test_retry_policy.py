@@ -0,0 +1,78 @@
+import time
+import unittest
+
+from fluxly.exceptions import DataErrorException, NetworkFailureException
+from fluxly.node import Node
+from fluxly.retry import RetryPolicy
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+events: list[tuple[str, float]] = []
+
+
+class FlakyNode(Node):
+    error: str = "network"
+
+    def _logic(self) -> None:
+        events.append((self.name, time.perf_counter()))
+        if self.attempt == 1:
+            raise DataErrorException("bad row") if self.error == "data" else NetworkFailureException("reset")
+
+
+class QuickNode(Node):
+    def _logic(self) -> None:
+        events.append((self.name, time.perf_counter()))
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        events.clear()
+
+    def test_backoff_cap_and_jitter(self) -> None:
+        policy = RetryPolicy(backoff_factor=2, max_delay_seconds=5)
+        self.assertEqual([policy.delay_seconds(1, n) for n in range(1, 5)], [1, 2, 4, 5])
+
+        jittered = RetryPolicy(backoff_factor=2, jitter=0.5)
+        for _ in range(20):
+            self.assertTrue(2 <= jittered.delay_seconds(1, 3) <= 4)
+
+    def test_allow_and_deny_lists(self) -> None:
+        deny = RetryPolicy(no_retry_on=[DataErrorException, StatusCodes.DATA_VALIDATION_FAILURE])
+        self.assertFalse(deny.is_retryable(DataErrorException()))
+        self.assertTrue(deny.is_retryable(NetworkFailureException()))
+
+        allow = RetryPolicy(retry_on=[StatusCodes.NETWORK_FAILURE])
+        self.assertTrue(allow.is_retryable(NetworkFailureException()))
+        self.assertFalse(allow.is_retryable(ValueError()))
+
+    def test_node_does_not_retry_denied_errors(self) -> None:
+        node = FlakyNode(name="flaky", error="data", max_retries=3, retry_policy=RetryPolicy(no_retry_on=[DataErrorException]))
+        with self.assertRaises(DataErrorException):
+            node.execute()
+        self.assertEqual(node.attempt, 1)
+
+    def test_backoff_does_not_hold_a_worker(self) -> None:
+        wf = Workflow(name="retry-wf", inputs=WorkflowInput(verbose=False, max_workers=1))
+        flaky = FlakyNode(name="flaky", max_retries=2, retry_delay_seconds=1, priority=1)
+        wf.add_nodes_from([flaky, QuickNode(name="quick")])
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual([name for name, _ in events], ["flaky", "quick", "flaky"])
+        self.assertEqual(flaky.attempt, 2)
+        self.assertGreaterEqual(events[2][1] - events[0][1], 0.9)
+
+    def test_workflow_retry_policy(self) -> None:
+        wf = Workflow(
+            name="retry-wf",
+            retry_policy=RetryPolicy(no_retry_on=[StatusCodes.DATA_ERROR]),
+            inputs=WorkflowInput(verbose=False, max_retries=3),
+        )
+        wf.add_node(FlakyNode(name="flaky", error="data"))
+        with self.assertRaises(DataErrorException):
+            wf.execute()
+        self.assertEqual(wf.attempt, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import unittest
+
+from click.testing import CliRunner
+
+from fluxly.core.cli.generator import build_click_group_with_commands
+from fluxly.node import Node
+from fluxly.workflow import DurationSource, Workflow, WorkflowInput
+
+
+class NoopNode(Node):
+    def _logic(self) -> None:
+        return None
+
+
+def build_workflow() -> Workflow:
+    timeouts = {"extract": 2, "enrich": 3, "clean": 1, "load": 1, "audit": 4}
+    extract, enrich, clean, load, audit = (NoopNode(name=name, timeout_seconds=timeout) for name, timeout in timeouts.items())
+    wf = Workflow(name="analysis-wf", inputs=WorkflowInput(verbose=False))
+    wf.add_nodes_from([extract, enrich, clean, load, audit])
+    wf.add_edges_from([(extract, enrich), (extract, clean), (enrich, load), (clean, load)])
+    return wf
+
+
+class WorkflowAnalysisTest(unittest.TestCase):
+    def test_shape_with_unit_durations(self) -> None:
+        report = build_workflow().analyze()
+
+        self.assertEqual((report.node_count, report.edge_count), (5, 4))
+        self.assertEqual(report.depth, 3)
+        self.assertEqual(report.max_width, 3)
+        self.assertEqual(report.critical_path_length, 3)
+        self.assertAlmostEqual(report.max_speedup, 5 / 3)
+        self.assertIsNone(report.makespan)
+
+    def test_timeouts_and_makespan(self) -> None:
+        wf = build_workflow()
+        report = wf.analyze(DurationSource.TIMEOUT, max_workers=2)
+
+        self.assertEqual(report.critical_path, ["extract", "enrich", "load"])
+        self.assertEqual(report.critical_path_length, 6)
+        self.assertEqual(report.total_work, 11)
+        self.assertEqual(report.makespan, 6)
+        self.assertEqual(wf.analyze(DurationSource.TIMEOUT, max_workers=1).makespan, 11)
+
+    def test_width_of_chains_and_fans(self) -> None:
+        wf = Workflow(name="width-wf", inputs=WorkflowInput(verbose=False))
+        nodes = [NoopNode(name=f"node-{i}") for i in range(6)]
+        wf.add_nodes_from(nodes)
+        wf.add_edges_from([(nodes[i], nodes[i + 1]) for i in range(5)])
+        self.assertEqual(wf.analyze().max_width, 1)
+
+        fan = Workflow(name="fan-wf", inputs=WorkflowInput(verbose=False))
+        fan.add_nodes_from(nodes)
+        fan.add_edges_from([(nodes[0], node) for node in nodes[1:5]] + [(node, nodes[5]) for node in nodes[1:5]])
+        self.assertEqual(fan.analyze().max_width, 4)
+        self.assertEqual(fan.analyze({node.name: 1.0 for node in nodes}, max_workers=4).makespan, 3)
+
+    def test_cli_command(self) -> None:
+        group = build_click_group_with_commands({"nightly": (build_workflow(), WorkflowInput)})
+        result = CliRunner().invoke(group, ["analyze", "nightly", "--durations", "timeout", "--max-workers", "2", "--json"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        report = json.loads(result.output)
+        self.assertEqual(report["critical_path"], ["extract", "enrich", "load"])
+        self.assertEqual(report["makespan"], 6)
+        self.assertIn("Max width: 3", CliRunner().invoke(group, ["analyze", "nightly"]).output)
+
+
+if __name__ == "__main__":
+    unittest.main()
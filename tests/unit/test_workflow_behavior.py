@@ -1,3 +1,4 @@
+import threading
 import time
 import unittest
 
@@ -68,6 +69,66 @@ class WorkflowBehaviorTest(unittest.TestCase):
             wf.execute()
         self.assertEqual(wf.last_execution.status, StatusCodes.TIMED_OUT)
 
+    def test_join_node_runs_after_all_parents(self) -> None:
+        class Recorder(Node):
+            sleep_seconds: float = 0.0
+            def _logic(self) -> None:
+                time.sleep(self.sleep_seconds)
+                order.append(self.name)
+
+        order: list[str] = []
+        root = Recorder(name="root")
+        fast = Recorder(name="fast", sleep_seconds=0.05)
+        slow = Recorder(name="slow", sleep_seconds=0.2)
+        join = Recorder(name="join")
+
+        wf = self._wf(root)
+        for node in (fast, slow, join):
+            wf.add_node(node)
+        wf.add_edge(root, fast)
+        wf.add_edge(root, slow)
+        wf.add_edge(fast, join)
+        wf.add_edge(slow, join)
+        wf.execute()
+
+        self.assertEqual(order, ["root", "fast", "slow", "join"])
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+
+    def test_scheduler_idles_while_nodes_sleep(self) -> None:
+        class Sleeper(Node):
+            def _logic(self) -> None:
+                time.sleep(0.5)
+
+        wf = self._wf(Sleeper(name="sleeper-1"))
+        wf.add_node(Sleeper(name="sleeper-2"))
+
+        cpu_start = time.process_time()
+        wf.execute()
+        self.assertLess(time.process_time() - cpu_start, 0.25)
+
+    def test_max_workers_caps_concurrency(self) -> None:
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        class Tracked(Node):
+            def _logic(self) -> None:
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.05)
+                with lock:
+                    active[0] -= 1
+
+        wf = Workflow(name="pool-wf", max_workers=4, inputs=WorkflowInput(verbose=False, max_workers=2))
+        for i in range(6):
+            wf.add_node(Tracked(name=f"tracked-{i}"))
+        wf.execute()
+
+        self.assertEqual(peak[0], 2)
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(len(wf.last_execution.output.node_to_executions), 6)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -42,6 +42,20 @@ class FluxlyCliTest(unittest.TestCase):
         self.assertEqual(ctx.exception.code, 0)
 
 
+    def test_cli_broken_workflow_only_fails_its_command(self) -> None:
+        cli = _build_cli("ok", OkNode(name="ok-node"))
+        cli.add_command("empty", Workflow(name="empty-cli-wf", inputs=WorkflowInput(verbose=False)), WorkflowInput)
+
+        sys.argv = ["prog", "empty"]
+        with self.assertRaises(SystemExit) as ctx:
+            cli.run_cli()
+        self.assertEqual(ctx.exception.code, StatusCodes.PREREQUISITE_FAIL.value)
+
+        sys.argv = ["prog", "ok"]
+        with self.assertRaises(SystemExit) as ctx:
+            cli.run_cli()
+        self.assertEqual(ctx.exception.code, 0)
+
     def test_cli_failure_exit_code_custom(self) -> None:
         cli = _build_cli("fail", FailNode(name="fail-node"))
         sys.argv = ["prog", "fail"]
@@ -50,6 +64,33 @@ class FluxlyCliTest(unittest.TestCase):
         self.assertEqual(ctx.exception.code, StatusCodes.DATA_ERROR.value)
 
 
+    def test_cli_max_workers_flag_and_app_default(self) -> None:
+        class AssertWorkersNode(Node):
+            def _logic(self) -> None:
+                assert self._workflow_input is not None
+                assert self._workflow_input.max_workers == 3
+
+        cli = _build_cli("ok", AssertWorkersNode(name="assert-workers"))
+        cli.max_workers = 5
+        sys.argv = ["prog", "ok", "--max-workers", "3"]
+        with self.assertRaises(SystemExit) as ctx:
+            cli.run_cli()
+        self.assertEqual(ctx.exception.code, 0)
+        workflow, _ = cli._endpoints["ok"]
+        self.assertEqual(workflow.max_workers, 5)
+
+    def test_cli_node_selection_flags(self) -> None:
+        class AssertSelectionNode(Node):
+            def _logic(self) -> None:
+                assert self._workflow_input is not None
+                assert self._workflow_input.from_nodes == ["assert-selection"]
+                assert self._workflow_input.only == []
+
+        cli = _build_cli("ok", AssertSelectionNode(name="assert-selection"))
+        sys.argv = ["prog", "ok", "--from", "assert-selection"]
+        with self.assertRaises(SystemExit) as ctx:
+            cli.run_cli()
+        self.assertEqual(ctx.exception.code, 0)
 
     def test_cli_env_only_params_are_applied(self) -> None:
         class AssertInputsNode(Node):
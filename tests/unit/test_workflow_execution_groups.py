@@ -18,6 +18,13 @@ class FailFast(Node):
         raise DataErrorException()
 
 
+class CooperativeSlow(Node):
+    def _logic(self) -> None:
+        for _ in range(500):
+            self.raise_if_cancelled()
+            time.sleep(0.01)
+
+
 class ExecutionGroupsTest(unittest.TestCase):
     def _wf(self) -> Workflow:
         return Workflow(name="eg-wf", description="exec groups", version="v", inputs=WorkflowInput(verbose=False))
@@ -76,6 +83,39 @@ class ExecutionGroupsTest(unittest.TestCase):
         # Workflow status should reflect failure
         self.assertEqual(wf.last_execution.status, StatusCodes.DATA_ERROR)
 
+    def test_nodes_of_dead_groups_are_skipped(self) -> None:
+        wf = self._wf()
+        fail_fast = FailFast(name="fail-fast")
+        gate = SlowOk(name="gate", sleep_seconds=0.2)
+        gated = SlowOk(name="gated", sleep_seconds=0)
+        wf.add_nodes_from([fail_fast, gate, gated])
+        wf.add_edge(gate, gated)
+        wf.add_execution_group([fail_fast, gated])
+        wf.add_execution_group([gate])
+
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(gate.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(gated.attempt, 0)
+        self.assertEqual(wf.last_execution.output.skipped_nodes, ["gated"])
+
+    def test_running_nodes_of_dead_groups_are_cancelled(self) -> None:
+        wf = self._wf()
+        slow = CooperativeSlow(name="slow")
+        fail_fast = FailFast(name="fail-fast")
+        ok = SlowOk(name="ok-node", sleep_seconds=0)
+        wf.add_nodes_from([slow, fail_fast, ok])
+        wf.add_execution_group([slow, fail_fast])
+        wf.add_execution_group([ok])
+
+        start = time.perf_counter()
+        wf.execute()
+
+        self.assertLess(time.perf_counter() - start, 3)
+        self.assertEqual(slow.last_execution.status, StatusCodes.CANCELLED)
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -81,6 +81,54 @@ class WorkflowGraphTest(unittest.TestCase):
         completed.add(self.node_a)
         self.assertTrue(self.graph.can_node_run(self.node_b, completed))
 
+    def test_adjacency_and_in_degrees(self) -> None:
+        self.graph.add_edge(self.node_a, self.node_b)
+        self.graph.add_conditional_edge(self.node_a, self.node_c, condition=lambda: True)
+        self.graph.add_edge_if_source_completed(self.node_b, self.node_c)
+
+        self.assertEqual(self.graph.get_children(self.node_a), [self.node_b, self.node_c])
+        self.assertEqual(self.graph.get_parents(self.node_c), [self.node_a, self.node_b])
+        self.assertEqual(self.graph.get_in_degrees(), {"test-A": 0, "test-B": 1, "test-C": 2})
+        self.assertIs(self.graph.get_edge(self.node_a, self.node_c), self.graph.edges[1])
+        self.assertIsNone(self.graph.get_edge(self.node_c, self.node_a))
+
+    def test_bulk_insertion(self) -> None:
+        node_d = DummyNode(name="test-D")
+        self.graph.add_nodes_from([node_d])
+        edges = self.graph.add_edges_from([
+            (self.node_a, self.node_b),
+            (self.node_b, self.node_c),
+            (self.node_c, node_d, lambda: True),
+        ])
+
+        self.assertEqual(len(edges), 3)
+        self.assertIsNotNone(edges[2].condition)
+        self.assertEqual(self.graph.get_parents(node_d), [self.node_c])
+
+    def test_bulk_insertion_is_atomic(self) -> None:
+        self.graph.add_edge(self.node_a, self.node_b)
+        with self.assertRaises(ValueError):
+            self.graph.add_edges_from([(self.node_b, self.node_c), (self.node_c, self.node_a)])
+        self.assertEqual(len(self.graph.edges), 1)
+
+        with self.assertRaises(ValueError):
+            self.graph.add_nodes_from([DummyNode(name="test-D"), DummyNode(name="test-D")])
+        self.assertNotIn("test-D", self.graph.nodes)
+
+    def test_node_selection(self) -> None:
+        node_d = DummyNode(name="test-D")
+        self.graph.add_node(node_d)
+        self.graph.add_edges_from([(self.node_a, self.node_b), (self.node_b, self.node_c), (self.node_a, node_d)])
+
+        self.assertEqual(self.graph.get_ancestors(["test-C"]), {"test-A", "test-B"})
+        self.assertEqual(self.graph.get_descendants(["test-B"]), {"test-C"})
+        self.assertEqual(self.graph.select_nodes(from_nodes=["test-B"]), {"test-B", "test-C"})
+        self.assertEqual(self.graph.select_nodes(until=["test-B"]), {"test-A", "test-B"})
+        self.assertEqual(self.graph.select_nodes(from_nodes=["test-A"], until=["test-B"]), {"test-A", "test-B"})
+        self.assertEqual(self.graph.select_nodes(only=["test-D"]), {"test-D"})
+        with self.assertRaises(ValueError):
+            self.graph.select_nodes(only=["missing"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from fluxly.node import Node, NodeExecution, NodeOutput
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class RowsOutput(NodeOutput):
+    rows: list[int] = []
+
+
+class RowsExecution(NodeExecution):
+    output: RowsOutput = RowsOutput()
+
+
+class Extract(Node):
+    columns: list[str] = []
+
+    def _create_execution(self) -> RowsExecution:
+        return RowsExecution()
+
+    def _logic(self) -> None:
+        self.current_execution.output.rows = [len(self.columns), self.workflow_input.max_retries]
+
+
+class Transform(Node):
+    sources: list[Extract]
+
+    def _create_execution(self) -> RowsExecution:
+        return RowsExecution()
+
+    def _logic(self) -> None:
+        rows = [row for source in self.sources for row in source.last_execution.output.rows]
+        self.current_execution.output.rows = [row * 2 for row in rows]
+
+
+class Audit(Node):
+    def _logic(self) -> None:
+        return None
+
+
+def build_template() -> Workflow:
+    extract = Extract(name="extract", columns=["id", "name", "email"])
+    transform = Transform(name="transform", sources=[extract])
+    audit = Audit(name="audit")
+    wf = Workflow(name="template-wf", inputs=WorkflowInput(verbose=False))
+    wf.add_nodes_from([extract, transform, audit])
+    wf.add_edge(extract, transform)
+    wf.add_edge_if_source_completed(transform, audit)
+    return wf
+
+
+class NewRunTest(unittest.TestCase):
+    def test_runs_are_isolated_from_the_template(self) -> None:
+        template = build_template()
+        first, second = template.new_run(), template.new_run()
+        first.inputs = WorkflowInput(verbose=False, max_retries=1)
+        first.execute()
+        second.execute()
+
+        self.assertEqual(first.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(first._graph.nodes["transform"].last_execution.output.rows, [6, 2])
+        self.assertEqual(second._graph.nodes["transform"].last_execution.output.rows, [6, 0])
+        self.assertEqual(second._graph.nodes["audit"].attempt, 1)
+        self.assertNotEqual(first.run_id, second.run_id)
+
+        self.assertEqual(template.attempt, 0)
+        self.assertIsNone(template.run_id)
+        self.assertTrue(all(node.attempt == 0 for node in template.get_nodes()))
+
+    def test_definition_is_shared(self) -> None:
+        template = build_template()
+        run = template.new_run()
+        extract, transform = run._graph.nodes["extract"], run._graph.nodes["transform"]
+
+        self.assertIsNot(extract, template._graph.nodes["extract"])
+        self.assertIs(extract.columns, template._graph.nodes["extract"].columns)
+        self.assertIs(transform.sources[0], extract)
+        self.assertEqual(run._graph.edges, template._graph.edges)
+        self.assertEqual(run.id, template.id)
+
+    def test_edges_are_copied_per_run(self) -> None:
+        template = build_template()
+        first, second = template.new_run(), template.new_run()
+        first_edge = first._graph._edge_index[("transform", "audit")]
+
+        first_edge.evaluate_condition()
+        self.assertTrue(first_edge.condition_passed)
+        self.assertIsNone(second._graph._edge_index[("transform", "audit")].condition_passed)
+        self.assertIs(first._graph._edge_index[("extract", "transform")], template._graph._edge_index[("extract", "transform")])
+        self.assertIsNot(first._graph._parents["audit"], template._graph._parents["audit"])
+
+        template.compile()
+        run = template.new_run()
+        self.assertIs(run._graph._parents, template._graph._parents)
+        self.assertIsNot(run._graph._edge_index[("transform", "audit")], template._graph._edge_index[("transform", "audit")])
+
+
+if __name__ == "__main__":
+    unittest.main()
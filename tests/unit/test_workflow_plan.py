@@ -0,0 +1,74 @@
+import unittest
+
+from pydantic import ValidationError
+
+from fluxly.node import Node
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowCompiledException, WorkflowInput
+
+
+class NoopNode(Node):
+    def _logic(self) -> None:
+        return None
+
+
+class WorkflowPlanTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.nodes = {name: NoopNode(name=name) for name in ("extract", "clean", "enrich", "load", "audit")}
+        n = self.nodes
+        self.wf = Workflow(name="plan-wf", inputs=WorkflowInput(verbose=False))
+        self.wf.add_nodes_from(n.values())
+        self.wf.add_edges_from([(n["extract"], n["clean"]), (n["extract"], n["enrich"]), (n["clean"], n["load"])])
+        self.wf.add_conditional_edge(n["enrich"], n["load"], condition=lambda: True)
+        self.wf.add_edge_if_source_completed(n["load"], n["audit"])
+        self.wf.add_execution_group([n["extract"], n["clean"]])
+        self.wf.add_execution_group([n["audit"]])
+
+    def test_plan_layout(self) -> None:
+        plan = self.wf.compile()
+        i = plan.index
+
+        self.assertEqual(plan.names[0], "extract")
+        self.assertEqual(
+            [{plan.names[node] for node in level} for level in plan.levels],
+            [{"extract"}, {"clean", "enrich"}, {"load"}, {"audit"}],
+        )
+        self.assertEqual({plan.names[c] for c in plan.children[i("extract")]}, {"clean", "enrich"})
+        self.assertEqual({plan.names[p] for p in plan.parents[i("load")]}, {"clean", "enrich"})
+        self.assertEqual([plan.names[p] for p in plan.conditional_parents[i("load")]], ["enrich"])
+        self.assertEqual([plan.names[p] for p in plan.conditional_parents[i("audit")]], ["load"])
+
+        self.assertEqual(plan.group_count, 2)
+        self.assertEqual(plan.group_masks[i("clean")], 0b01)
+        self.assertEqual(plan.group_masks[i("load")], 0)
+        self.assertEqual(plan.relevance_masks[i("extract")], 0b11)
+        self.assertEqual(plan.relevance_masks[i("enrich")], 0b10)
+
+    def test_compiled_workflow_is_frozen(self) -> None:
+        plan = self.wf.compile()
+        self.assertIs(self.wf.compile(), plan)
+
+        extra = NoopNode(name="extra")
+        with self.assertRaises(WorkflowCompiledException):
+            self.wf.add_node(extra)
+        with self.assertRaises(WorkflowCompiledException):
+            self.wf.add_edge(self.nodes["clean"], self.nodes["audit"])
+        with self.assertRaises(WorkflowCompiledException):
+            self.wf.add_execution_group([self.nodes["load"]])
+        with self.assertRaises(ValidationError):
+            plan.group_count = 3
+
+    def test_runs_reuse_the_plan(self) -> None:
+        plan = self.wf.compile()
+        for _ in range(3):
+            run = self.wf.new_run()
+            self.assertIs(run.compile(), plan)
+            run.execute()
+            self.assertEqual(run.last_execution.status, StatusCodes.COMPLETED)
+            self.assertEqual(set(run.last_execution.output.node_to_executions), set(self.nodes))
+            with self.assertRaises(WorkflowCompiledException):
+                run.add_node(NoopNode(name="extra"))
+
+
+if __name__ == "__main__":
+    unittest.main()
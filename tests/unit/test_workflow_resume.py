@@ -0,0 +1,175 @@
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from fluxly.core.workflow.exceptions import CheckpointNotFoundException
+from fluxly.exceptions import DataErrorException
+from fluxly.node import Node, NodeExecution, NodeOutput
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+calls: Counter[str] = Counter()
+
+
+class CountingNode(Node):
+    def _logic(self) -> None:
+        calls[self.name] += 1
+
+
+class FlakyNode(Node):
+    def _logic(self) -> None:
+        calls[self.name] += 1
+        if calls[self.name] == 1:
+            raise DataErrorException("first call fails")
+
+
+class ValueOutput(NodeOutput):
+    value: int = 0
+
+
+class ValueExecution(NodeExecution):
+    output: ValueOutput = ValueOutput()
+
+
+class ValueNode(Node):
+    def _create_execution(self) -> ValueExecution:
+        return ValueExecution()
+
+    def _logic(self) -> None:
+        calls[self.name] += 1
+        self.current_execution.output.value = 42
+
+
+class RichOutput(NodeOutput):
+    items: Any = None
+
+
+class RichExecution(NodeExecution):
+    output: RichOutput = RichOutput()
+
+
+class RichNode(Node):
+    def _create_execution(self) -> RichExecution:
+        return RichExecution()
+
+    def _logic(self) -> None:
+        calls[self.name] += 1
+        self.current_execution.output.items = [{"when": date(2024, 1, 1)}, (1, 2), b"\xff\x00"]
+
+
+class LockNode(RichNode):
+    def _logic(self) -> None:
+        calls[self.name] += 1
+        self.current_execution.output.items = threading.Lock()
+
+
+def build_checkpointed_wf(name: str = "checkpoint-wf", source_cls: type[Node] = ValueNode, **inputs: object) -> Workflow:
+    wf = Workflow(name=name, inputs=WorkflowInput(verbose=False, **inputs))
+    source = source_cls(name="source")
+    flaky = FlakyNode(name="flaky")
+    tail = CountingNode(name="tail")
+    wf.add_nodes_from([source, flaky, tail])
+    wf.add_edges_from([(source, flaky), (flaky, tail)])
+    return wf
+
+
+class ResumeOnRetryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+
+    def _wf(self, resume: bool) -> Workflow:
+        wf = Workflow(name="resume-wf", inputs=WorkflowInput(verbose=False, max_retries=2, resume_on_retry=resume))
+        expensive = CountingNode(name="expensive")
+        side = CountingNode(name="side")
+        flaky = FlakyNode(name="flaky")
+        tail = CountingNode(name="tail")
+        wf.add_nodes_from([expensive, side, flaky, tail])
+        wf.add_edges_from([(expensive, flaky), (flaky, tail)])
+        return wf
+
+    def test_retry_reuses_successful_nodes(self) -> None:
+        wf = self._wf(resume=True)
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(calls, {"expensive": 1, "side": 1, "flaky": 2, "tail": 1})
+        self.assertEqual(sorted(wf.last_execution.output.reused_nodes), ["expensive", "side"])
+        self.assertEqual(len(wf.last_execution.output.node_to_executions), 4)
+
+    def test_retry_without_resume_reruns_everything(self) -> None:
+        wf = self._wf(resume=False)
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(calls["expensive"], 2)
+        self.assertEqual(wf.last_execution.output.reused_nodes, [])
+
+
+class CheckpointResumeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _crash(self) -> Path:
+        wf = build_checkpointed_wf(checkpoint_dir=self._tmp.name)
+        with self.assertRaises(DataErrorException):
+            wf.execute()
+        return wf.checkpoint_dir
+
+    def test_completed_nodes_are_checkpointed(self) -> None:
+        run_dir = self._crash()
+        self.assertEqual(run_dir.parent, Path(self._tmp.name))
+        self.assertTrue((run_dir / "manifest.json").is_file())
+        self.assertTrue((run_dir / "nodes" / "source.pkl").is_file())
+        self.assertFalse((run_dir / "nodes" / "flaky.pkl").exists())
+
+    def test_resume_runs_only_remaining_nodes(self) -> None:
+        run_dir = self._crash()
+        wf = build_checkpointed_wf(resume=str(run_dir))
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(calls, {"source": 1, "flaky": 2, "tail": 1})
+        self.assertEqual(wf.run_id, run_dir.name)
+        self.assertEqual(wf.last_execution.output.reused_nodes, ["source"])
+        source = wf.get_nodes()[0]
+        self.assertEqual(source.last_execution.output.value, 42)
+        self.assertTrue((run_dir / "nodes" / "tail.pkl").is_file())
+
+    def test_resume_rejects_other_workflow(self) -> None:
+        run_dir = self._crash()
+        with self.assertRaises(CheckpointNotFoundException):
+            build_checkpointed_wf(name="other-wf", resume=str(run_dir)).execute()
+
+    def test_outputs_round_trip_with_their_types(self) -> None:
+        wf = build_checkpointed_wf(source_cls=RichNode, checkpoint_dir=self._tmp.name)
+        with self.assertRaises(DataErrorException):
+            wf.execute()
+
+        resumed = build_checkpointed_wf(source_cls=RichNode, resume=str(wf.checkpoint_dir))
+        resumed.execute()
+
+        self.assertEqual(resumed.last_execution.output.reused_nodes, ["source"])
+        items = resumed.get_nodes()[0].last_execution.output.items
+        self.assertEqual(items, [{"when": date(2024, 1, 1)}, (1, 2), b"\xff\x00"])
+        self.assertIsInstance(items[1], tuple)
+
+    def test_unsaved_checkpoint_does_not_fail_the_run(self) -> None:
+        calls["flaky"] = 1
+        wf = build_checkpointed_wf(source_cls=LockNode, checkpoint_dir=self._tmp.name)
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(wf.last_execution.output.unsaved_checkpoints, ["source"])
+        self.assertFalse((wf.checkpoint_dir / "nodes" / "source.pkl").exists())
+        self.assertTrue((wf.checkpoint_dir / "nodes" / "tail.pkl").is_file())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import copy
+import threading
+import time
+import unittest
+
+from fluxly.core.workflow.exceptions import InsufficientResourcesException
+from fluxly.node import Node
+from fluxly.resources import NodeResources, ResourceBudget, ResourceCapacity
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class RecordingNode(Node):
+    sleep_seconds: float = 0
+
+    def _logic(self) -> None:
+        started.append(self.name)
+        time.sleep(self.sleep_seconds)
+
+
+started: list[str] = []
+
+
+class PrioritySchedulingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        started.clear()
+
+    def _wf(self, policy: str = "critical_path") -> Workflow:
+        return Workflow(name="priority-wf", scheduling_policy=policy, inputs=WorkflowInput(verbose=False, max_workers=1))
+
+    def _build(self, wf: Workflow) -> None:
+        short = RecordingNode(name="short", expected_duration_seconds=1)
+        head = RecordingNode(name="chain-head", expected_duration_seconds=1)
+        tail = RecordingNode(name="chain-tail", expected_duration_seconds=10)
+        wf.add_nodes_from([short, head, tail])
+        wf.add_edge(head, tail)
+
+    def test_critical_path_starts_longest_chain_first(self) -> None:
+        wf = self._wf()
+        self._build(wf)
+        wf.execute()
+        self.assertEqual(started, ["chain-head", "chain-tail", "short"])
+
+    def test_fifo_keeps_insertion_order(self) -> None:
+        wf = self._wf(policy="fifo")
+        self._build(wf)
+        wf.execute()
+        self.assertEqual(started, ["short", "chain-head", "chain-tail"])
+
+    def test_priority_overrides_rank(self) -> None:
+        wf = self._wf()
+        self._build(wf)
+        wf.get_nodes()[0].priority = 5
+        wf.execute()
+        self.assertEqual(started, ["short", "chain-head", "chain-tail"])
+
+    def test_runs_share_duration_history(self) -> None:
+        template = self._wf()
+        slow = RecordingNode(name="short", sleep_seconds=0.2)
+        head, tail = RecordingNode(name="chain-head"), RecordingNode(name="chain-tail")
+        template.add_nodes_from([slow, head, tail])
+        template.add_edge(head, tail)
+        plan = template.compile()
+
+        template.new_run().execute()
+        self.assertEqual(started[0], "chain-head")
+        self.assertGreaterEqual(template._durations.mean("short"), 0.2)
+
+        started.clear()
+        run = template.new_run()
+        run.execute()
+        self.assertEqual(started, ["short", "chain-head", "chain-tail"])
+        self.assertTrue(all(node._last_record.execution is None for node in run.get_nodes()))
+
+        ranks = template._durations.ranks(template._graph, plan)
+        self.assertIs(template._durations.ranks(template._graph, plan), ranks)
+        self.assertGreaterEqual(template.analyze("history").critical_path_length, 0.2)
+
+        copied = copy.deepcopy(template)
+        self.assertIsNot(copied._durations, template._durations)
+        self.assertEqual(copied._durations.mean("short"), template._durations.mean("short"))
+
+
+class ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __enter__(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *_: object) -> None:
+        with self.lock:
+            self.active -= 1
+
+
+tracker = ConcurrencyTracker()
+
+
+class TrackedNode(Node):
+    def _logic(self) -> None:
+        with tracker:
+            time.sleep(0.05)
+
+
+class ResourceAdmissionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tracker.active = 0
+        tracker.peak = 0
+
+    def _wf(self, capacity: ResourceCapacity | None) -> Workflow:
+        return Workflow(name="resource-wf", capacity=capacity, inputs=WorkflowInput(verbose=False, max_workers=4))
+
+    def test_nodes_wait_for_memory(self) -> None:
+        wf = self._wf(ResourceCapacity(memory_mb=8192))
+        wf.add_nodes_from(TrackedNode(name=f"big-{i}", resources=NodeResources(memory_mb=8192)) for i in range(3))
+        wf.add_node(TrackedNode(name="small"))
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(tracker.peak, 2)
+
+    def test_named_pool_serializes_nodes(self) -> None:
+        wf = self._wf(ResourceCapacity(pools={"db": 1}))
+        wf.add_nodes_from(TrackedNode(name=f"db-{i}", resources=NodeResources(pools={"db": 1})) for i in range(3))
+        wf.execute()
+        self.assertEqual(tracker.peak, 1)
+
+    def test_oversized_node_fails_fast(self) -> None:
+        wf = self._wf(ResourceCapacity(cpu=2))
+        wf.add_node(TrackedNode(name="greedy", resources=NodeResources(cpu=4)))
+        with self.assertRaises(InsufficientResourcesException):
+            wf.execute()
+        self.assertEqual(wf.last_execution.status, StatusCodes.PREREQUISITE_FAIL)
+
+    def test_shared_budget_spans_runs(self) -> None:
+        budget = ResourceBudget(ResourceCapacity(pools={"db": 1}))
+        workflows = []
+        for _ in range(2):
+            wf = self._wf(None)
+            wf.add_nodes_from(TrackedNode(name=f"db-{i}", resources=NodeResources(pools={"db": 1})) for i in range(2))
+            wf.assign_resource_budget(budget)
+            workflows.append(wf)
+
+        threads = [threading.Thread(target=wf.execute) for wf in workflows]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(tracker.peak, 1)
+        self.assertTrue(all(wf.last_execution.status == StatusCodes.COMPLETED for wf in workflows))
+
+
+if __name__ == "__main__":
+    unittest.main()
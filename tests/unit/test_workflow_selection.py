@@ -0,0 +1,83 @@
+import tempfile
+import unittest
+from collections import Counter
+
+from fluxly.core.workflow.exceptions import InvalidNodeSelectionException
+from fluxly.node import Node, NodeExecution, NodeOutput
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+calls: Counter[str] = Counter()
+
+
+class StageOutput(NodeOutput):
+    rows: int = 0
+
+
+class StageExecution(NodeExecution):
+    output: StageOutput = StageOutput()
+
+
+class Stage(Node):
+    upstream: "Stage | None" = None
+
+    def _create_execution(self) -> StageExecution:
+        return StageExecution()
+
+    def _logic(self) -> None:
+        calls[self.name] += 1
+        previous = self.upstream.last_execution.output.rows if self.upstream else 0
+        self.current_execution.output.rows = previous + 1
+
+
+def build_wf(**inputs: object) -> Workflow:
+    wf = Workflow(name="selection-wf", inputs=WorkflowInput(verbose=False, **inputs))
+    extract = Stage(name="extract")
+    transform = Stage(name="transform", upstream=extract)
+    load = Stage(name="load", upstream=transform)
+    report = Stage(name="report", upstream=extract)
+    wf.add_nodes_from([extract, transform, load, report])
+    wf.add_edges_from([(extract, transform), (transform, load), (extract, report)])
+    return wf
+
+
+class NodeSelectionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_until_runs_ancestors(self) -> None:
+        wf = build_wf(until=["transform"])
+        wf.execute()
+        self.assertEqual(calls, {"extract": 1, "transform": 1})
+        self.assertEqual(set(wf.last_execution.output.node_to_executions), {"extract", "transform"})
+
+    def test_from_loads_upstream_from_previous_run(self) -> None:
+        first = build_wf(checkpoint_dir=self._tmp.name)
+        first.execute()
+        calls.clear()
+
+        wf = build_wf(resume=str(first.checkpoint_dir), **{"from": ["transform"]})
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(calls, {"transform": 1, "load": 1})
+        self.assertEqual(wf.last_execution.output.reused_nodes, ["extract"])
+        self.assertEqual(wf.get_nodes()[2].last_execution.output.rows, 3)
+
+    def test_missing_upstream_results_fail_fast(self) -> None:
+        wf = build_wf(only=["load"])
+        with self.assertRaises(InvalidNodeSelectionException):
+            wf.execute()
+        self.assertEqual(calls, {})
+
+    def test_unknown_node_is_rejected(self) -> None:
+        with self.assertRaises(InvalidNodeSelectionException):
+            build_wf(only=["missing"]).execute()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import gc
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from fluxly.cache import CacheConfig
+from fluxly.core.spill import SpilledValue
+from fluxly.node import Node, NodeExecution, NodeOutput
+from fluxly.spill import SpillConfig
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class RecordsOutput(NodeOutput):
+    records: list[int] = []
+    blob: bytes = b""
+    count: int = 0
+
+
+class RecordsExecution(NodeExecution):
+    output: RecordsOutput = RecordsOutput()
+
+
+class Extract(Node):
+    size: int = 50_000
+
+    def _create_execution(self) -> RecordsExecution:
+        return RecordsExecution()
+
+    def _logic(self) -> None:
+        output = self.current_execution.output
+        output.records = list(range(self.size))
+        output.blob = bytes(self.size)
+        output.count = self.size
+
+
+class Total(Node):
+    extract: Extract
+
+    def _create_execution(self) -> RecordsExecution:
+        return RecordsExecution()
+
+    def _logic(self) -> None:
+        self.current_execution.output.count = sum(self.extract.last_execution.output.records)
+
+
+class SpillTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _run(self, size: int, threshold_mb: float = 0.01) -> tuple[Extract, Total, Workflow]:
+        extract = Extract(name="extract", size=size)
+        total = Total(name="total", extract=extract)
+        wf = Workflow(
+            name="spill-wf",
+            spill=SpillConfig(directory=str(self.directory), threshold_mb=threshold_mb),
+            inputs=WorkflowInput(verbose=False),
+        )
+        wf.add_nodes_from([extract, total])
+        wf.add_edge(extract, total)
+        wf.execute()
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        return extract, total, wf
+
+    def test_large_fields_are_spilled_and_reloaded(self) -> None:
+        extract, total, _ = self._run(size=50_000)
+        output = extract.last_execution.output
+
+        self.assertEqual(total.last_execution.output.count, sum(range(50_000)))
+        self.assertEqual(output.spilled_fields, ["blob"])
+        self.assertEqual(output.summarize(), {"records": "list[50000]", "blob": "bytes[50000]", "count": "50000"})
+        self.assertEqual(len(list(self.directory.glob("extract-blob-*.bin"))), 1)
+
+        self.assertEqual(output.blob, bytes(50_000))
+        self.assertEqual(output.spilled_fields, [])
+        gc.collect()
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+    def test_raw_buffers_load_with_their_type(self) -> None:
+        for kind, expected in (("bytes", bytes), ("bytearray", bytearray)):
+            path = self.directory / f"{kind}.bin"
+            path.write_bytes(b"\xff\x00" * 10)
+            value = SpilledValue(path, kind, "").load()
+            self.assertIs(type(value), expected)
+            self.assertEqual(value, b"\xff\x00" * 10)
+
+    def test_small_outputs_stay_in_memory(self) -> None:
+        extract, _, _ = self._run(size=10)
+        self.assertEqual(extract.last_execution.output.spilled_fields, [])
+        self.assertFalse(self.directory.exists() and any(self.directory.iterdir()))
+
+    def test_spilled_output_serializes_and_pickles(self) -> None:
+        extract, _, wf = self._run(size=50_000, threshold_mb=0)
+        output = extract.last_execution.output
+        self.assertEqual(sorted(output.spilled_fields), ["blob", "count"])
+
+        copied = pickle.loads(pickle.dumps(output))
+        self.assertEqual(copied.count, 50_000)
+        self.assertEqual(output.model_dump()["blob"], bytes(50_000))
+        self.assertEqual(wf.last_execution.output.node_to_executions["extract"][-1].output.count, 50_000)
+
+    def test_cache_keys_do_not_reload_spilled_fields(self) -> None:
+        cache = CacheConfig(directory=str(self.directory / "cache"))
+        for run in range(2):
+            extract = Extract(name="extract", size=50_000)
+            total = Total(name="total", extract=extract, cache=True)
+            wf = Workflow(
+                name="spill-cache-wf",
+                spill=SpillConfig(directory=str(self.directory / "spill"), threshold_mb=0.01),
+                cache=cache,
+                inputs=WorkflowInput(verbose=False),
+            )
+            wf.add_nodes_from([extract, total])
+            wf.add_edge(extract, total)
+            wf.execute()
+
+            self.assertIn("blob", extract.last_execution.output.spilled_fields)
+            self.assertIsNotNone(extract._last_record.output_digest)
+            self.assertEqual(total.last_execution.metadata.cache_hit, run == 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from fluxly.core.cancellation import CancellationToken
+from fluxly.core.workflow.exceptions import (
+    StreamAbortedException,
+    UnsupportedGraphScenario,
+)
+from fluxly.core.workflow.stream import BatchStream
+from fluxly.exceptions import DataErrorException
+from fluxly.node import Node, NodeExecution, NodeOutput
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class BatchesOutput(NodeOutput):
+    batches: list[list[int]] = []
+    max_in_flight: int = 0
+
+
+class BatchesExecution(NodeExecution):
+    output: BatchesOutput = BatchesOutput()
+
+
+events: list[str] = []
+lock = threading.Lock()
+counters = {"sent": 0, "received": 0}
+
+
+def record(event: str) -> None:
+    with lock:
+        events.append(event)
+
+
+class Reader(Node):
+    batch_count: int = 5
+    fail_after: int | None = None
+
+    def _logic(self) -> None:
+        for i in range(self.batch_count):
+            if i == self.fail_after:
+                raise DataErrorException("source went away")
+            self.emit([i, i + 1])
+            counters["sent"] += 1
+        record("reader-done")
+
+
+class Writer(Node):
+    reader: Reader
+    delay_seconds: float = 0
+
+    def _create_execution(self) -> BatchesExecution:
+        return BatchesExecution()
+
+    def _logic(self) -> None:
+        output = self.current_execution.output
+        for batch in self.stream(self.reader):
+            record(f"batch-{batch[0]}")
+            counters["received"] += 1
+            output.max_in_flight = max(output.max_in_flight, counters["sent"] - counters["received"])
+            output.batches.append(batch)
+            time.sleep(self.delay_seconds)
+
+
+class StreamingEdgeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        events.clear()
+        counters.update(sent=0, received=0)
+
+    def _wf(self, reader: Reader, writer: Writer, max_buffered_batches: int = 8) -> Workflow:
+        wf = Workflow(name="stream-wf", inputs=WorkflowInput(verbose=False, max_workers=1))
+        wf.add_nodes_from([reader, writer])
+        wf.add_streaming_edge(reader, writer, max_buffered_batches=max_buffered_batches)
+        return wf
+
+    def test_consumer_overlaps_producer(self) -> None:
+        reader = Reader(name="reader")
+        writer = Writer(name="writer", reader=reader, delay_seconds=0.01)
+        wf = self._wf(reader, writer, max_buffered_batches=1)
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(writer.last_execution.output.batches, [[i, i + 1] for i in range(5)])
+        self.assertLess(events.index("batch-0"), events.index("reader-done"))
+
+    def test_bounded_buffer_applies_backpressure(self) -> None:
+        reader = Reader(name="reader", batch_count=20)
+        writer = Writer(name="writer", reader=reader, delay_seconds=0.005)
+        wf = self._wf(reader, writer, max_buffered_batches=2)
+        wf.execute()
+
+        self.assertEqual(len(writer.last_execution.output.batches), 20)
+        self.assertLessEqual(writer.last_execution.output.max_in_flight, 3)
+
+    def test_producer_failure_stops_consumer(self) -> None:
+        reader = Reader(name="reader", fail_after=2)
+        writer = Writer(name="writer", reader=reader)
+        wf = self._wf(reader, writer)
+        with self.assertRaises(DataErrorException):
+            wf.execute()
+
+        self.assertEqual(reader.last_execution.status, StatusCodes.DATA_ERROR)
+        self.assertIn(writer.last_execution.status, (StatusCodes.CANCELLED, StatusCodes.PREREQUISITE_FAIL))
+
+    def test_stream_drains_then_raises_producer_error(self) -> None:
+        stream = BatchStream("reader", "writer", max_batches=2)
+        token = CancellationToken()
+        stream.put("a", token)
+        stream.close(DataErrorException("source went away"))
+
+        batches = stream.iterate(token)
+        self.assertEqual(next(batches), "a")
+        with self.assertRaises(StreamAbortedException):
+            next(batches)
+
+    def test_invalid_streaming_graphs_are_rejected(self) -> None:
+        reader = Reader(name="reader")
+        writer = Writer(name="writer", reader=reader)
+        wf = self._wf(reader, writer)
+        other = Reader(name="other")
+        wf.add_node(other)
+        with self.assertRaises(ValueError):
+            wf.add_edge(other, writer)
+
+        class AsyncReader(Reader):
+            async def _logic(self) -> None:
+                await asyncio.sleep(0)
+
+        async_reader = AsyncReader(name="async-reader")
+        wf = self._wf(async_reader, Writer(name="writer", reader=async_reader))
+        with self.assertRaises(UnsupportedGraphScenario):
+            wf.execute()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+from fluxly.exceptions import DataErrorException
+from fluxly.node import Node, NodeExecution, NodeOutput
+from fluxly.status import StatusCodes
+from fluxly.workflow import Workflow, WorkflowInput
+
+
+class RowsOutput(NodeOutput):
+    rows: list[int] = []
+    total: int = 0
+
+
+class RowsExecution(NodeExecution):
+    output: RowsOutput = RowsOutput()
+
+
+class Extract(Node):
+    def _create_execution(self) -> RowsExecution:
+        return RowsExecution()
+
+    def _logic(self) -> None:
+        self.current_execution.output.rows = list(range(1000))
+
+
+class Transform(Node):
+    source: Node
+    fail: bool = False
+
+    def _create_execution(self) -> RowsExecution:
+        return RowsExecution()
+
+    def _logic(self) -> None:
+        if self.fail:
+            raise DataErrorException("bad rows")
+        rows = self.source.last_execution.output.rows
+        self.current_execution.output.rows = [r * 2 for r in rows]
+        self.current_execution.output.total = sum(rows)
+
+
+class TransientOutputTest(unittest.TestCase):
+    def _wf(self) -> Workflow:
+        return Workflow(name="transient-wf", inputs=WorkflowInput(verbose=False, max_workers=1))
+
+    def test_outputs_released_after_last_child(self) -> None:
+        extract = Extract(name="extract", transient_output=True)
+        left = Transform(name="left", source=extract, transient_output=True)
+        right = Transform(name="right", source=extract)
+        load = Transform(name="load", source=left)
+        wf = self._wf()
+        wf.add_nodes_from([extract, left, right, load])
+        wf.add_edges_from([(extract, left), (extract, right), (left, load)])
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(right.last_execution.output.total, sum(range(1000)))
+        self.assertEqual(load.last_execution.output.total, 2 * sum(range(1000)))
+
+        for node in (extract, left):
+            metadata = node.last_execution.metadata
+            self.assertTrue(metadata.output_released)
+            self.assertEqual(metadata.output_summary["rows"], "list[1000]")
+            self.assertEqual(node.last_execution.output.rows, [])
+        self.assertIs(wf.last_execution.output.node_to_executions["extract"][-1], extract.last_execution)
+        self.assertFalse(right.last_execution.metadata.output_released)
+        self.assertEqual(len(load.last_execution.output.rows), 1000)
+
+    def test_failed_child_pins_output(self) -> None:
+        extract = Extract(name="extract", transient_output=True)
+        ok_node = Transform(name="ok-node", source=extract)
+        failing = Transform(name="failing", source=extract, fail=True)
+        wf = self._wf()
+        wf.add_nodes_from([extract, ok_node, failing])
+        wf.add_edges_from([(extract, ok_node), (extract, failing)])
+        wf.add_execution_group([extract, ok_node])
+        wf.add_execution_group([failing])
+        wf.execute()
+
+        self.assertEqual(failing.last_execution.status, StatusCodes.DATA_ERROR)
+        self.assertFalse(extract.last_execution.metadata.output_released)
+        self.assertEqual(len(extract.last_execution.output.rows), 1000)
+
+    def test_resume_reruns_producer_of_released_output(self) -> None:
+        extract = Extract(name="extract", transient_output=True)
+        transform = Transform(name="transform", source=extract)
+        load = Transform(name="load", source=transform, fail=True)
+
+        class FixingWorkflow(Workflow):
+            def on_failure(self, error: Exception) -> None:
+                load.fail = False
+                # Transform has to run again, so the released extract output must be recomputed.
+                transform.last_execution.status = StatusCodes.FAILED
+
+        wf = FixingWorkflow(name="transient-wf", inputs=WorkflowInput(verbose=False, max_retries=2, resume_on_retry=True))
+        wf.add_nodes_from([extract, transform, load])
+        wf.add_edges_from([(extract, transform), (transform, load)])
+        wf.execute()
+
+        self.assertEqual(wf.last_execution.status, StatusCodes.COMPLETED)
+        self.assertEqual(extract.attempt, 2)
+        self.assertEqual(load.last_execution.output.total, 2 * sum(range(1000)))
+
+
+if __name__ == "__main__":
+    unittest.main()